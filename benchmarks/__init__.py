@@ -0,0 +1,7 @@
+"""
+Benchmarks for Warzone: The Battle of Cards.
+
+Each module can be run on its own from the project root, e.g.:
+
+    python -m benchmarks.bench_parallel
+"""
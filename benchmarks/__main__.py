@@ -0,0 +1,4 @@
+"""Run the benchmark suite: ``python -m benchmarks`` (see ``benchmarks.suite``)."""
+from .suite import main
+
+main()
@@ -0,0 +1,90 @@
+"""
+Micro-benchmark of card comparisons and deck construction.
+
+Compares the flyweight ``Card`` against the previous implementation, which
+looked the rank up in ``Card.RANKS`` on every comparison and built 52 new
+cards for every deck.
+"""
+import argparse
+import random
+import timeit
+from src.card import Card
+from src.deck import Deck
+
+
+class LegacyCard:
+    """The card implementation before cards became flyweights, for reference."""
+
+    RANKS = Card.RANKS
+    SUITS = Card.SUITS
+
+    def __init__(self, rank: str, suit: str):
+        if rank not in self.RANKS:
+            raise ValueError(f"Invalid rank: {rank}")
+        if suit not in self.SUITS:
+            raise ValueError(f"Invalid suit: {suit}")
+        self.rank = rank
+        self.suit = suit
+        self.facedown = False
+
+    def get_value(self) -> int:
+        return self.RANKS.index(self.rank) + 2
+
+    def __lt__(self, other: 'LegacyCard') -> bool:
+        return self.get_value() < other.get_value()
+
+    def __gt__(self, other: 'LegacyCard') -> bool:
+        return self.get_value() > other.get_value()
+
+    def compare(self, other_card: 'LegacyCard') -> int:
+        if self > other_card:
+            return 1
+        elif self < other_card:
+            return -1
+        else:
+            return 0
+
+
+def legacy_deck() -> list:
+    return [LegacyCard(rank, suit) for suit in LegacyCard.SUITS for rank in LegacyCard.RANKS]
+
+
+def measure(stmt, number: int) -> float:
+    """Return the best time per call in nanoseconds."""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=20000, help="calls per measurement")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    new_pairs = [(rng.choice(Card.DECK), rng.choice(Card.DECK)) for _ in range(1000)]
+    old_pairs = [(LegacyCard(a.rank, a.suit), LegacyCard(b.rank, b.suit)) for a, b in new_pairs]
+
+    def compare_all(pairs):
+        return lambda: [a.compare(b) for a, b in pairs]
+
+    def less_all(pairs):
+        return lambda: [a < b for a, b in pairs]
+
+    def max_all(pairs):
+        return lambda: [max((a, b), key=lambda card: card.get_value()) for a, b in pairs]
+
+    rows = [
+        ("compare()", compare_all(old_pairs), compare_all(new_pairs), 1000),
+        ("__lt__", less_all(old_pairs), less_all(new_pairs), 1000),
+        ("max(key=get_value)", max_all(old_pairs), max_all(new_pairs), 1000),
+        ("Deck()", legacy_deck, Deck, 1),
+    ]
+    print(f"{'operation':>20} {'before ns':>10} {'after ns':>10} {'speedup':>8}")
+    for name, before, after, per_call in rows:
+        number = max(args.number // per_call, 10) if per_call > 1 else args.number
+        old = measure(before, number) / per_call
+        new = measure(after, number) / per_call
+        print(f"{name:>20} {old:>10.1f} {new:>10.1f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
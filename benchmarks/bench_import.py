@@ -0,0 +1,68 @@
+"""
+Cold import time of the headless and GUI entry points.
+
+Runs each entry point in a fresh interpreter under ``python -X importtime``
+and reports the cumulative import time of the entry module, the wall time of
+the whole process, and whether tkinter or Pillow were loaded.
+"""
+import argparse
+import subprocess
+import sys
+import time
+from typing import Dict, Tuple
+
+# Entry point name: (statement, module whose cumulative import time is reported)
+ENTRY_POINTS = {
+    'headless': ("from src import Game, Rules", 'src'),
+    'simulation': ("import src.simulation", 'src.simulation'),
+    'gui': ("from src.main import main", 'src.main'),
+}
+
+
+def import_profile(statement: str, module: str) -> Tuple[float, float, Dict[str, int]]:
+    """
+    Run an import statement in a fresh interpreter.
+
+    Returns:
+        Tuple[float, float, Dict[str, int]]: The wall time in ms, the cumulative
+            import time of ``module`` in ms, and the cumulative import time in us
+            of every module imported.
+    """
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True,
+    )
+    wall = (time.perf_counter() - start) * 1000
+
+    modules = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            cumulative = int(fields[1])
+        except ValueError:
+            continue  # The header line
+        name = fields[2].strip()
+        modules[name] = max(modules.get(name, 0), cumulative)
+    return wall, modules.get(module, 0) / 1000, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="runs per entry point (best is reported)")
+    args = parser.parse_args()
+
+    print(f"{'entry point':>12} {'wall ms':>8} {'import ms':>10} {'tkinter':>8} {'PIL':>5}")
+    for name, (statement, module) in ENTRY_POINTS.items():
+        runs = [import_profile(statement, module) for _ in range(args.repeat)]
+        wall = min(run[0] for run in runs)
+        package = min(run[1] for run in runs)
+        modules = runs[0][2]
+        print(f"{name:>12} {wall:>8.1f} {package:>10.1f} "
+              f"{'yes' if 'tkinter' in modules else 'no':>8} {'yes' if 'PIL' in modules else 'no':>5}")
+
+
+if __name__ == "__main__":
+    main()
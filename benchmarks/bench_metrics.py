@@ -0,0 +1,45 @@
+"""
+Cost of the per-phase instrumentation in ``src.metrics``.
+
+Plays the same games before the instrumentation is enabled, while it is
+enabled, and after it is disabled again. Disabled instrumentation must leave
+the original methods in place, so the first and last runs should match.
+"""
+import argparse
+import time
+from src import simulation
+from src.metrics import PHASES, Instrumentation
+from src.rules import Rules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--games", type=int, default=200, help="games to play")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="seed of the run")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    def run() -> float:
+        best = float('inf')
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            simulation.simulate(args.games, Rules(), args.seed)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    originals = [cls.__dict__[name] for cls, name in PHASES]
+    before = run()
+    instrumentation = Instrumentation()
+    with instrumentation as registry:
+        enabled = run()
+    after = run()
+    assert [cls.__dict__[name] for cls, name in PHASES] == originals, "methods were not restored"
+
+    print(f"{'instrumentation':>16} {'seconds':>8} {'change':>8}")
+    for label, seconds in (("never enabled", before), ("enabled", enabled), ("disabled", after)):
+        print(f"{label:>16} {seconds:>8.3f} {seconds / before - 1:>+8.1%}")
+    print(registry.log_line())
+
+
+if __name__ == "__main__":
+    main()
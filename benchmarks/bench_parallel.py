@@ -0,0 +1,45 @@
+"""
+Scaling benchmark for the multi-process simulation runner.
+
+Reports games per second at 1, 2, 4 and N workers (N = number of CPUs), and
+checks that every worker count produces identical results.
+"""
+import argparse
+import os
+import time
+from src.parallel import run
+from src.rules import Rules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--games", type=int, default=4000, help="games per measurement")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="seed of the run")
+    parser.add_argument("--max-rounds", type=int, default=2000, help="round cap per game")
+    parser.add_argument("--double-deck", action="store_true", help="play with two decks")
+    args = parser.parse_args()
+
+    rules = Rules(use_double_deck=args.double_deck)
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cpus})
+
+    reference = None
+    print(f"{'workers':>8} {'games/s':>12} {'rounds/s':>14} {'speedup':>8}")
+    base_rate = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        outcome = run(args.games, rules, args.seed, workers, args.max_rounds)
+        elapsed = time.perf_counter() - start
+
+        if reference is None:
+            reference = outcome.results
+        elif outcome.results != reference:
+            raise SystemExit(f"Results with {workers} workers differ from 1 worker")
+
+        rate = args.games / elapsed
+        base_rate = base_rate or rate
+        print(f"{workers:>8} {rate:>12,.0f} {outcome.rounds / elapsed:>14,.0f} {rate / base_rate:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
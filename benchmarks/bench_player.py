@@ -0,0 +1,71 @@
+"""
+Round throughput with the deque hand against the previous list hand.
+
+The list hand took cards from the top with ``list.pop(0)``, which moves every
+remaining card; the deque takes them in constant time.
+"""
+import argparse
+import random
+import time
+from typing import List
+from src.card import Card
+from src.game import Game
+from src.player import Player
+from src.rules import Rules
+
+
+class ListPlayer(Player):
+    """A player whose hand is a list, as before the deque hand, for reference."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.hand: List[Card] = []
+
+    def play_card(self) -> Card:
+        if not self.hand:
+            raise ValueError(f"{self.name} has no cards left to play.")
+        return self.hand.pop(0)
+
+    def play_cards(self, count: int) -> List[Card]:
+        return [self.play_card() for _ in range(count)]
+
+
+def rounds_per_second(player_class: type, rules: Rules, games: int, max_rounds: int) -> float:
+    rounds = 0
+    elapsed = 0.0
+    for index in range(games):
+        game = Game("Player 1", "Player 2", rules)
+        game.players = [player_class("Player 1"), player_class("Player 2")]
+        game.shuffle(random.Random(index))
+        game.deal()
+
+        start = time.perf_counter()
+        for _ in range(max_rounds):
+            if game.war_in_progress:
+                game.resolve_war()
+                if game.is_game_over():
+                    break
+            else:
+                rounds += 1
+                if game.play_round() is not None:
+                    break
+        elapsed += time.perf_counter() - start
+    return rounds / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--games", type=int, default=50, help="games per measurement")
+    parser.add_argument("--max-rounds", type=int, default=2000, help="round cap per game")
+    args = parser.parse_args()
+
+    print(f"{'deck':>6} {'list rounds/s':>14} {'deque rounds/s':>15} {'speedup':>8}")
+    for double in (False, True):
+        rules = Rules(use_double_deck=double)
+        before = rounds_per_second(ListPlayer, rules, args.games, args.max_rounds)
+        after = rounds_per_second(Player, rules, args.games, args.max_rounds)
+        print(f"{'double' if double else 'single':>6} {before:>14,.0f} {after:>15,.0f} {after / before:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
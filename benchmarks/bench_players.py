@@ -0,0 +1,39 @@
+"""
+Cost of a round as the number of players grows.
+
+Plays the same seeds with 2 to 8 players and reports the time per round,
+which should grow linearly with the number of players (a constant time per
+player and round), along with whole-game throughput.
+"""
+import argparse
+import time
+from src.rules import Rules
+from src.simulation import game_seed, new_game, play_game
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--games", type=int, default=200, help="games per player count")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="seed of the run")
+    parser.add_argument("-w", "--war", default="1", help="war resolution method")
+    parser.add_argument("--double-deck", action="store_true", help="play with two decks")
+    parser.add_argument("--max-rounds", type=int, default=5000, help="round cap per game")
+    parser.add_argument("--max-players", type=int, default=8, help="largest number of players")
+    args = parser.parse_args()
+    rules = Rules(args.war, use_double_deck=args.double_deck)
+
+    print(f"{'players':>7} {'games/s':>8} {'rounds/s':>10} {'us/round':>9} {'us/round/player':>16} {'wars/round':>11}")
+    for num_players in range(2, args.max_players + 1):
+        games = [new_game(rules, game_seed(args.seed, i), num_players=num_players) for i in range(args.games)]
+        start = time.perf_counter()
+        results = [play_game(game, args.max_rounds) for game in games]
+        elapsed = time.perf_counter() - start
+        rounds = sum(result.rounds for result in results)
+        wars = sum(result.wars for result in results)
+        per_round = elapsed / rounds * 1e6
+        print(f"{num_players:>7} {args.games / elapsed:>8.1f} {rounds / elapsed:>10,.0f} {per_round:>9.2f} "
+              f"{per_round / num_players:>16.2f} {wars / rounds:>11.4f}")
+
+
+if __name__ == "__main__":
+    main()
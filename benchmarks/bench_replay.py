@@ -0,0 +1,64 @@
+"""
+Cost of recording replay logs, and speed of replaying them.
+
+Plays the same games with and without a ``ReplayWriter`` to measure the
+logging overhead, then reconstructs every game from the log (to its end, and
+at random rounds via keyframes) and compares that with simulating it again.
+"""
+import argparse
+import io
+import random
+import time
+from src import replay, simulation
+from src.rules import Rules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--games", type=int, default=300, help="games to play")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="seed of the run")
+    parser.add_argument("--max-rounds", type=int, default=5000, help="round cap per game")
+    parser.add_argument("--double-deck", action="store_true", help="play with two decks")
+    args = parser.parse_args()
+    rules = Rules(use_double_deck=args.double_deck)
+
+    def run(listeners=()) -> float:
+        start = time.perf_counter()
+        simulation.simulate(args.games, rules, args.seed, args.max_rounds, listeners=listeners)
+        return time.perf_counter() - start
+
+    # Interleaved and repeated, since the difference is small compared to the noise
+    plain = logged = float('inf')
+    for _ in range(3):
+        plain = min(plain, run())
+        buffer = io.BytesIO()
+        writer = replay.ReplayWriter(buffer)
+        logged = min(logged, run([writer]))
+        writer.close()
+    data = buffer.getvalue()
+    print(f"Simulate: {plain:.2f} s, with logging: {logged:.2f} s ({logged / plain - 1:+.1%})")
+
+    start = time.perf_counter()
+    replays = replay.load(data)
+    loaded = time.perf_counter() - start
+    rounds = sum(r.rounds for r in replays)
+    print(f"Log: {len(data):,} bytes for {len(replays)} games, {len(data) / rounds:.1f} bytes/round, "
+          f"loaded in {loaded:.3f} s")
+
+    start = time.perf_counter()
+    for r in replays:
+        r.final()
+    replayed = time.perf_counter() - start
+    print(f"Replay every game to its end: {replayed:.2f} s ({plain / replayed:.1f}x faster than simulating)")
+
+    rng = random.Random(args.seed)
+    targets = [(r, rng.randint(0, r.rounds)) for r in replays]
+    start = time.perf_counter()
+    for r, rounds in targets:
+        r.seek(rounds)
+    seek = (time.perf_counter() - start) / len(targets)
+    print(f"Seek to a random round: {seek * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Games started per second, and the memory each start allocates.
+
+A game is started three ways, each time shuffled from its own seed and dealt:
+a new ``Game`` for every game (as ``simulation.new_game`` used to do), one
+``Game`` reused with ``Game.reset``, and games taken from a ``GamePool`` and
+given back. Memory is counted with ``sys.getallocatedblocks`` and
+``tracemalloc`` while the games started are kept alive, so it is what each
+start adds: the whole game for a new game, and nothing for a reused one.
+"""
+import argparse
+import gc
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, List, Tuple
+from src.game import Game, GamePool
+from src.rules import Rules
+from src.simulation import new_game
+
+NAMES = ("Player 1", "Player 2")
+
+
+def starters(rules: Rules, detect_cycles: bool) -> List[Tuple[str, Callable[[int], Game]]]:
+    """The ways of starting a game from a seed, by name."""
+    game = Game(*NAMES, rules=rules, detect_cycles=detect_cycles)
+    pool = GamePool()
+
+    def start_new(seed: int) -> Game:
+        return new_game(rules, seed, detect_cycles=detect_cycles)
+
+    def start_reset(seed: int) -> Game:
+        game.reset(seed)
+        game.deal()
+        return game
+
+    def start_pooled(seed: int) -> Game:
+        pooled = pool.acquire(*NAMES, rules=rules, detect_cycles=detect_cycles, seed=seed)
+        pooled.deal()
+        pool.release(pooled)
+        return pooled
+
+    return [("new", start_new), ("reset", start_reset), ("pool", start_pooled)]
+
+
+def allocations(start: Callable[[int], Game], count: int) -> Tuple[float, float]:
+    """
+    Measure the memory that starting games adds, keeping every game started alive.
+
+    Returns:
+        Tuple[float, float]: The memory blocks and the bytes added per game.
+    """
+    start(0)  # Warm up caches and free lists
+    games = []
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    blocks = sys.getallocatedblocks()
+    before = tracemalloc.get_traced_memory()[0]
+    for seed in range(count):
+        games.append(start(seed))
+    added = tracemalloc.get_traced_memory()[0] - before
+    blocks = sys.getallocatedblocks() - blocks
+    tracemalloc.stop()
+    gc.enable()
+    # The list holding the games is not part of a start
+    list_bytes = sys.getsizeof(games)
+    return blocks / count, max(added - list_bytes, 0) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=5000, help="games started per measurement")
+    parser.add_argument("--detect-cycles", action="store_true", help="enable cycle detection in the games")
+    args = parser.parse_args()
+
+    print(f"{'deck':>6} {'start':>6} {'games/s':>10} {'blocks/game':>12} {'bytes/game':>11}")
+    for double in (False, True):
+        rules = Rules(use_double_deck=double)
+        for name, start in starters(rules, args.detect_cycles):
+            seeds = iter(range(10 ** 9))
+            seconds = min(timeit.repeat(lambda: start(next(seeds)), number=args.number, repeat=3))
+            blocks, size = allocations(start, args.number)
+            print(f"{'double' if double else 'single':>6} {name:>6} {args.number / seconds:>10,.0f} "
+                  f"{blocks:>12.1f} {size:>11,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Shuffle throughput of the generators in ``src.rng``.
+
+Reports the decks shuffled per second: with the global ``random`` generator,
+with a ``SeededRandom`` carrying on from its last shuffle, with a new
+``random.Random`` per deck (as games used to be seeded), with one
+``SeededRandom`` moved to each deck's stream, and with ``PermutationBatch``.
+The reproducibility and statistical quality of the permutations are checked
+by ``tests/test_rng.py``.
+"""
+import argparse
+import random
+import timeit
+from typing import Callable, List, Tuple
+from src.rng import PermutationBatch, SeededRandom, derive_seed
+
+
+def throughput(size: int, count: int, seed: int) -> List[Tuple[str, float]]:
+    """
+    Measure the decks shuffled per second by each way of shuffling.
+
+    Returns:
+        List[Tuple[str, float]]: The name of each way and its decks per second.
+    """
+    deck = list(range(size))
+    seeded = SeededRandom(seed)
+    batch = PermutationBatch(deck, count)
+    streams = iter(range(10 ** 9))
+
+    def new_random() -> None:
+        random.Random(derive_seed(seed, next(streams))).shuffle(deck)
+
+    def jump() -> None:
+        seeded.jump(next(streams))
+        seeded.shuffle(deck)
+
+    ways: List[Tuple[str, Callable[[], None], int]] = [
+        ("random.shuffle", lambda: random.shuffle(deck), count),
+        ("SeededRandom.shuffle", lambda: seeded.shuffle(deck), count),
+        ("new random.Random", new_random, count),
+        ("SeededRandom.jump", jump, count),
+        ("PermutationBatch", lambda: batch.fill(seed, next(streams)), 1),
+    ]
+    rates = []
+    for name, shuffle, number in ways:
+        seconds = min(timeit.repeat(shuffle, number=number, repeat=3))
+        # Every way shuffles ``count`` decks per repeat
+        rates.append((name, count / seconds))
+    return rates
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=52, help="cards per deck")
+    parser.add_argument("-n", "--decks", type=int, default=2000, help="decks shuffled per measurement")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="seed of the streams")
+    args = parser.parse_args()
+
+    print(f"{'shuffle':<22} {'decks/s':>10}")
+    for name, rate in throughput(args.size, args.decks, args.seed):
+        print(f"{name:<22} {rate:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Load generator for the game server in ``src.server``.
+
+Starts a server on a free localhost port in a separate process (or uses the
+one given with ``--port``), then plays whole games over many concurrent
+connections: each connection creates a table, plays it to the end a few
+steps per request, and closes it. Reports the p50/p99 latency of each kind of
+request and the number of tables served per second. Finally it opens many
+idle tables and reports the server's memory per table.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, Optional
+from src.stats import QuantileSketch
+
+
+class Client:
+    """One connection to the server, sending a request at a time and timing it."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 latencies: Dict[str, QuantileSketch]):
+        self.reader = reader
+        self.writer = writer
+        self.latencies = latencies
+
+    async def request(self, **request) -> dict:
+        start = time.perf_counter()
+        self.writer.write(json.dumps(request).encode() + b"\n")
+        response = json.loads(await self.reader.readline())
+        self.latencies.setdefault(request['op'], QuantileSketch()).add((time.perf_counter() - start) * 1e6)
+        if not response['ok']:
+            raise RuntimeError(f"{request}: {response['error']}")
+        return response
+
+
+async def connect(host: str, port: int, latencies: Dict[str, QuantileSketch]) -> Client:
+    reader, writer = await asyncio.open_connection(host, port)
+    return Client(reader, writer, latencies)
+
+
+async def play_tables(client: Client, tables, args: argparse.Namespace) -> None:
+    """Play whole games on a connection, one table after another."""
+    for index in tables:
+        state = (await client.request(op='create', seed=args.seed + index, max_rounds=args.max_rounds,
+                                      rules={'war_resolution_method': args.war}))['state']
+        while state['outcome'] is None:
+            state = (await client.request(op='play', table=state['table'], steps=args.steps))['state']
+        await client.request(op='close', table=state['table'])
+
+
+def server_rss(pid: int) -> Optional[int]:
+    """The resident memory of a process in bytes, where /proc is available."""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+async def run(args: argparse.Namespace, port: int, pid: Optional[int]) -> None:
+    latencies: Dict[str, QuantileSketch] = {}
+    clients = [await connect(args.host, port, latencies) for _ in range(args.concurrency)]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(play_tables(client, range(i, args.tables, args.concurrency), args)
+                           for i, client in enumerate(clients)))
+    elapsed = time.perf_counter() - start
+    requests = sum(sketch.count for sketch in latencies.values())
+
+    print(f"{args.tables} tables over {args.concurrency} connections in {elapsed:.2f} s: "
+          f"{args.tables / elapsed:,.1f} tables/s, {requests / elapsed:,.0f} requests/s")
+    print(f"{'request':>8} {'count':>9} {'p50 us':>9} {'p99 us':>9}")
+    for op, sketch in latencies.items():
+        print(f"{op:>8} {sketch.count:>9,} {sketch.quantile(0.5):>9.0f} {sketch.quantile(0.99):>9.0f}")
+
+    if args.idle_tables:
+        before = server_rss(pid) if pid is not None else None
+        client = clients[0]
+        for i in range(args.idle_tables):
+            await client.request(op='create', seed=i)
+        stats = await client.request(op='stats')
+        after = server_rss(pid) if pid is not None else None
+        line = f"{stats['tables']:,} idle tables open ({stats['live']:,} live)"
+        if before is not None and after is not None:
+            line += f", server memory {(after - before) / args.idle_tables:,.0f} bytes per table"
+        print(line)
+
+    for client in clients:
+        client.writer.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1", help="server address")
+    parser.add_argument("--port", type=int, default=None, help="port of a running server (default: start one)")
+    parser.add_argument("-n", "--tables", type=int, default=500, help="games to play")
+    parser.add_argument("-c", "--concurrency", type=int, default=50, help="concurrent connections")
+    parser.add_argument("--steps", type=int, default=50, help="rounds or wars per play request")
+    parser.add_argument("-w", "--war", default="1", help="war resolution method")
+    parser.add_argument("--max-rounds", type=int, default=2000, help="round cap per game")
+    parser.add_argument("--idle-tables", type=int, default=20000, help="idle tables opened at the end")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="seed of the first game")
+    args = parser.parse_args()
+
+    process = None
+    port = args.port
+    if port is None:
+        process = subprocess.Popen([sys.executable, "-m", "src.server", "--host", args.host, "--port", "0"],
+                                   stdout=subprocess.PIPE, text=True,
+                                   cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        port = int(process.stdout.readline().rsplit(":", 1)[1])
+    try:
+        asyncio.run(run(args, port, process.pid if process else None))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
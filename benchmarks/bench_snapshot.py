@@ -0,0 +1,51 @@
+"""
+Snapshot size and the cost of snapshotting, restoring and cloning a game.
+
+Games are played part of the way through, then copied with ``Game.snapshot``
+and ``Game.restore``, with ``Game.clone``, and with ``copy.deepcopy`` for
+reference.
+"""
+import argparse
+import copy
+import pickle
+import timeit
+from src.game import Game
+from src.rules import Rules
+from src.simulation import new_game
+
+
+def midgame(rules: Rules, seed: int, rounds: int) -> Game:
+    game = new_game(rules, seed)
+    game.enable_cycle_detection()
+    while game.rounds_played < rounds and game.outcome is None:
+        if game.war_in_progress:
+            game.resolve_war()
+        else:
+            game.play_round()
+    return game
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=2000, help="copies per measurement")
+    parser.add_argument("--rounds", type=int, default=100, help="rounds played before copying")
+    args = parser.parse_args()
+
+    print(f"{'deck':>6} {'snapshot B':>11} {'pickle B':>9} {'snapshot us':>12} {'restore us':>11} "
+          f"{'clone us':>9} {'deepcopy us':>12}")
+    for double in (False, True):
+        rules = Rules(use_double_deck=double)
+        game = midgame(rules, 0, args.rounds)
+        target = Game("Player 1", "Player 2", rules)
+        data = game.snapshot()
+
+        def per_call(statement) -> float:
+            return min(timeit.repeat(statement, number=args.number, repeat=3)) / args.number * 1e6
+
+        print(f"{'double' if double else 'single':>6} {len(data):>11} {len(pickle.dumps(game)):>9} "
+              f"{per_call(game.snapshot):>12.2f} {per_call(lambda: target.restore(data)):>11.2f} "
+              f"{per_call(game.clone):>9.2f} {per_call(lambda: copy.deepcopy(game)):>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""
+Spectator fan-out benchmark for the game server in ``src.server``.
+
+Starts a server on a Unix socket (or on a localhost TCP port where Unix
+sockets are not available) and plays a game one step per request, first with
+nobody watching and then with many spectators joining after a few rounds, so
+that they start from a snapshot. Every spectator rebuilds the hand sizes from
+the deltas and checks them against the final state of the game. Reports how
+much the spectators slow the game down, how long events take to reach them and
+the server's CPU time per event delivered. The spectators run in this process,
+so on a machine with few cores they compete with the server for the CPU.
+
+Then a few slow spectators watch more tables, and stop reading for a while as
+the tables are played: the server skips them instead of waiting, and catches
+them up with a snapshot once they have read their backlog.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+from src.stats import QuantileSketch
+
+
+class Connection:
+    """A connection to the server, sending requests and reading responses and events."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def request(self, **request) -> dict:
+        """Send a request and wait for its response (on a connection without events)."""
+        self.writer.write(json.dumps(request).encode() + b"\n")
+        response = json.loads(await self.reader.readline())
+        if not response['ok']:
+            raise RuntimeError(f"{request}: {response['error']}")
+        return response
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class Spectator(Connection):
+    """
+    A spectator rebuilding the hand sizes of the tables it watches from their events.
+
+    Attributes:
+        hands (Dict[int, List[int]]): The hand sizes of each table.
+        seq (Dict[int, int]): The sequence number of the last event of each table.
+        ended (Dict[int, asyncio.Event]): Set once the game of a table is over.
+        events (int): The number of events received.
+        snapshots (int): The number of snapshots received to catch up.
+        gaps (int): The number of events missed without a snapshot to follow.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 latency: Optional[QuantileSketch] = None, sent: Optional[Dict[int, float]] = None,
+                 timed_table: Optional[int] = None):
+        super().__init__(reader, writer)
+        self.hands: Dict[int, List[int]] = {}
+        self.seq: Dict[int, int] = {}
+        self.ended: Dict[int, asyncio.Event] = {}
+        self.events = 0
+        self.snapshots = 0
+        self.gaps = 0
+        self.latency = latency
+        self.sent = sent
+        self.timed_table = timed_table
+
+    def watch(self, table: int) -> None:
+        self.ended[table] = asyncio.Event()
+        self.writer.write(json.dumps({'op': 'watch', 'table': table}).encode() + b"\n")
+
+    async def listen(self, stall: float = 0.0) -> None:
+        """Read events until the connection is closed, after not reading for ``stall`` seconds."""
+        if stall:
+            await asyncio.sleep(stall)
+        clock = time.perf_counter
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                return
+            message = json.loads(line)
+            kind = message.get('ev')
+            if kind is None or kind == 'snapshot':
+                # The response to a watch request, or a snapshot to catch up
+                if kind == 'snapshot':
+                    self.snapshots += 1
+                state = message['state']
+                table = state['table']
+                self.hands[table] = state['hands']
+                self.seq[table] = message['q']
+                if state['outcome'] is not None:
+                    self.ended[table].set()
+                continue
+            if kind == 'closed':
+                continue
+            self.events += 1
+            table = message['t']
+            if message['q'] != self.seq[table] + 1:
+                self.gaps += 1
+            self.seq[table] = message['q']
+            if table == self.timed_table and self.latency is not None:
+                self.latency.add((clock() - self.sent[message['q']]) * 1e6)
+            if kind == 'end':
+                self.ended[table].set()
+            else:
+                self.hands[table] = [size + change for size, change in zip(self.hands[table], message['h'])]
+
+
+def cpu_time(pid: Optional[int]) -> Optional[float]:
+    """The CPU time used by a process in seconds, where /proc is available."""
+    try:
+        with open(f"/proc/{pid}/stat") as stat:
+            fields = stat.read().rsplit(")", 1)[1].split()
+    except (OSError, TypeError):
+        return None
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+async def play(player: Connection, table: int, steps: int = 1, sent: Optional[Dict[int, float]] = None,
+               seq: int = 0) -> int:
+    """
+    Play a table to its end.
+
+    When ``sent`` is given, requests play one step each, and the time each one
+    is sent is stored under the sequence number of the event it makes,
+    counting from ``seq``.
+
+    Returns:
+        int: The number of requests sent.
+    """
+    requests = 0
+    state = (await player.request(op='state', table=table))['state']
+    while state['outcome'] is None:
+        if sent is not None:
+            seq += 1
+            sent[seq] = time.perf_counter()
+            # The request that ends the game also makes the 'end' event
+            sent[seq + 1] = sent[seq]
+        state = (await player.request(op='play', table=table, steps=steps))['state']
+        requests += 1
+    return requests
+
+
+async def play_round_robin(player: Connection, tables: List[int], steps: int) -> None:
+    """Play tables to their end, taking turns."""
+    while tables:
+        responses = [await player.request(op='play', table=table, steps=steps) for table in tables]
+        tables = [table for table, response in zip(tables, responses) if response['state']['outcome'] is None]
+
+
+async def run(args: argparse.Namespace, connect, pid: Optional[int]) -> None:
+    async def open_connection(cls=Connection, *extra):
+        return cls(*(await connect()), *extra)
+
+    player = await open_connection()
+    create = dict(op='create', seed=args.seed, max_rounds=args.max_rounds,
+                  rules={'war_resolution_method': args.war})
+
+    # The game with nobody watching
+    table = (await player.request(**create))['state']['table']
+    start = time.perf_counter()
+    baseline_steps = await play(player, table)
+    baseline = baseline_steps / (time.perf_counter() - start)
+    await player.request(op='close', table=table)
+    print(f"no spectators: {baseline_steps} steps, {baseline:,.0f} steps/s")
+
+    # The same game with spectators joining after the warm-up rounds
+    table = (await player.request(**create))['state']['table']
+    for _ in range(args.warmup):
+        await player.request(op='play', table=table)
+    latency = QuantileSketch()
+    sent: Dict[int, float] = {}
+    spectators = []
+    for _ in range(args.spectators):
+        spectator = await open_connection(Spectator, latency, sent, table)
+        spectator.watch(table)
+        spectators.append(spectator)
+    listeners = [asyncio.ensure_future(spectator.listen()) for spectator in spectators]
+    while any(table not in spectator.seq for spectator in spectators):
+        await asyncio.sleep(0.01)
+    seq = spectators[0].seq[table] if spectators else 0
+
+    cpu = cpu_time(pid)
+    start = time.perf_counter()
+    steps = await play(player, table, sent=sent, seq=seq)
+    elapsed = time.perf_counter() - start
+    await asyncio.wait_for(asyncio.gather(*(spectator.ended[table].wait() for spectator in spectators)), 60)
+    delivered = time.perf_counter() - start
+    cpu = cpu_time(pid) - cpu if cpu is not None else None
+    final = (await player.request(op='state', table=table))['state']
+
+    events = sum(spectator.events for spectator in spectators)
+    print(f"{args.spectators:,} spectators: {steps} steps, {steps / elapsed:,.0f} steps/s "
+          f"({steps / elapsed / baseline:.0%} of the pace with no spectators)")
+    print(f"  {events:,} events delivered in {delivered:.2f} s, {events / delivered:,.0f} events/s; "
+          f"delivery latency p50 {latency.quantile(0.5) / 1000:.1f} ms, p99 {latency.quantile(0.99) / 1000:.1f} ms")
+    if cpu is not None and events:
+        print(f"  server CPU {cpu:.2f} s, {cpu / events * 1e6:.1f} us per event delivered")
+    consistent = sum(spectator.hands[table] == final['hands'] and not spectator.gaps for spectator in spectators)
+    print(f"  {consistent:,}/{len(spectators):,} rebuilt the final hands from a snapshot and deltas")
+    for spectator in spectators:
+        spectator.close()
+    await player.request(op='close', table=table)
+
+    if args.slow:
+        # Slow spectators of more tables
+        tables = [(await player.request(**dict(create, seed=args.seed + 1 + i)))['state']['table']
+                  for i in range(args.slow_tables)]
+        slow = []
+        for _ in range(args.slow):
+            spectator = await open_connection(Spectator)
+            for watched in tables:
+                spectator.watch(watched)
+            slow.append(spectator)
+        listeners += [asyncio.ensure_future(spectator.listen(args.stall)) for spectator in slow]
+        start = time.perf_counter()
+        await play_round_robin(player, tables, args.slow_steps)
+        elapsed = time.perf_counter() - start
+        finals = {watched: (await player.request(op='state', table=watched))['state'] for watched in tables}
+        # Wait for them to read what is left and be caught up
+        await asyncio.wait_for(asyncio.gather(*(spectator.ended[watched].wait()
+                                                for spectator in slow for watched in tables)), args.stall + 60)
+        stats = await player.request(op='stats')
+        consistent = sum(all(spectator.hands[watched] == finals[watched]['hands'] for watched in tables)
+                         for spectator in slow)
+        print(f"{args.slow} slow spectators stalling for {args.stall:.1f} s on {len(tables)} tables "
+              f"played in {elapsed:.2f} s: {stats['events_skipped']:,} events skipped, "
+              f"{stats['resyncs']:,} snapshots to catch up, {consistent}/{args.slow} consistent at the end")
+        for spectator in slow:
+            spectator.close()
+
+    player.close()
+    for listener in listeners:
+        listener.cancel()
+    await asyncio.gather(*listeners, return_exceptions=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--spectators", type=int, default=1000, help="spectators of the table")
+    parser.add_argument("--warmup", type=int, default=20, help="rounds played before the spectators join")
+    parser.add_argument("--slow", type=int, default=5, help="slow spectators")
+    parser.add_argument("--slow-tables", type=int, default=20, help="tables the slow spectators watch")
+    parser.add_argument("--slow-steps", type=int, default=5, help="steps per request on the slow spectators' tables")
+    parser.add_argument("--stall", type=float, default=2.0, help="seconds the slow spectators stop reading")
+    parser.add_argument("--high-water", type=int, default=64 * 1024, help="server's spectator backlog limit")
+    parser.add_argument("-w", "--war", default="1", help="war resolution method")
+    parser.add_argument("--max-rounds", type=int, default=300, help="round cap per game")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="seed of the game")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    command = [sys.executable, "-m", "src.server", "--high-water", str(args.high_water),
+               "--low-water", str(args.high_water // 4)]
+    if hasattr(socket, "AF_UNIX"):
+        path = os.path.join(directory, "server.sock")
+        command += ["--unix", path]
+    else:
+        command += ["--port", "0"]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True,
+                               cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    address = process.stdout.readline().split()[-1]
+
+    def connect():
+        if hasattr(socket, "AF_UNIX"):
+            return asyncio.open_unix_connection(address)
+        host, port = address.rsplit(":", 1)
+        return asyncio.open_connection(host, int(port))
+
+    try:
+        asyncio.run(run(args, connect, process.pid))
+    finally:
+        process.terminate()
+        process.wait()
+        if hasattr(socket, "AF_UNIX") and os.path.exists(path):
+            os.remove(path)
+        os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Time to first frame of ``run.py``.
+
+Launches the game in a fresh process with ``WARZONE_STARTUP_PROBE`` set, which
+makes the GUI print wall-clock timestamps when its window first appears and when
+the last card image has been loaded, and then close. Needs a display (on a
+headless machine, run it under ``xvfb-run``).
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Dict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def startup_times() -> Dict[str, float]:
+    """
+    Launch ``run.py`` once.
+
+    Returns:
+        Dict[str, float]: Milliseconds from launch to each reported event.
+    """
+    env = dict(os.environ, WARZONE_STARTUP_PROBE="1")
+    launched = time.time()
+    process = subprocess.run([sys.executable, "run.py"], cwd=ROOT, env=env,
+                             capture_output=True, text=True, timeout=60)
+    if process.returncode != 0:
+        raise SystemExit(f"run.py failed:\n{process.stderr}")
+    times = {}
+    for line in process.stdout.splitlines():
+        event, _, stamp = line.partition(" ")
+        if event in ("first_frame", "images_ready"):
+            times[event] = (float(stamp) - launched) * 1000
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="launches (best is reported)")
+    args = parser.parse_args()
+
+    runs = [startup_times() for _ in range(args.repeat)]
+    for event in ("first_frame", "images_ready"):
+        values = [run[event] for run in runs if event in run]
+        if values:
+            print(f"{event:>13}: {min(values):8.1f} ms (best of {len(values)})")
+        else:
+            print(f"{event:>13}: not reported")
+
+
+if __name__ == "__main__":
+    main()
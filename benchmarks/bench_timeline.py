@@ -0,0 +1,56 @@
+"""
+Seek time of the GUI round slider's timeline.
+
+Records long double-deck games, then seeks to random rounds with keyframes
+and, for reference, with a single keyframe at the start (replaying every
+round from round 0, as the GUI would have to without keyframes).
+"""
+import argparse
+import random
+import time
+from src.rules import Rules
+from src.simulation import game_seed, new_game
+from src.timeline import Timeline
+
+
+def recorded_game(seed: int, rounds: int, keyframe_interval: int):
+    game = new_game(Rules(use_double_deck=True), seed)
+    timeline = Timeline(keyframe_interval)
+    game.add_listener(timeline)
+    while game.outcome is None and game.rounds_played < rounds:
+        if game.war_in_progress:
+            game.resolve_war()
+        else:
+            game.play_round()
+    return game, timeline
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=2000, help="rounds recorded per game")
+    parser.add_argument("--seeks", type=int, default=500, help="seeks per measurement")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="seed of the run")
+    args = parser.parse_args()
+
+    # Find a game that lasts the requested number of rounds
+    seed = 0
+    while recorded_game(game_seed(args.seed, seed), args.rounds, args.rounds)[0].rounds_played < args.rounds:
+        seed += 1
+
+    print(f"{'keyframes every':>16} {'mean ms':>8} {'max ms':>8}")
+    for interval in (16, 64, 256, args.rounds + 1):
+        game, timeline = recorded_game(game_seed(args.seed, seed), args.rounds, interval)
+        view = game.clone()
+        rng = random.Random(args.seed)
+        times = []
+        for _ in range(args.seeks):
+            target = rng.randint(0, timeline.rounds)
+            start = time.perf_counter()
+            timeline.seek(view, target)
+            times.append(time.perf_counter() - start)
+        label = f"{interval} rounds" if interval <= args.rounds else "never"
+        print(f"{label:>16} {sum(times) / len(times) * 1e3:>8.3f} {max(times) * 1e3:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Throughput of the vectorized engine against the object engine.
+
+Sweeps every war resolution method over single and double decks, checks that
+both engines agree on a sample of games, and reports games per second.
+"""
+import argparse
+import time
+from src import simulation, vectorized
+from src.rules import Rules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--games", type=int, default=20000, help="games per vectorized measurement")
+    parser.add_argument("--check", type=int, default=200, help="games compared against the object engine")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="seed of the run")
+    parser.add_argument("--max-rounds", type=int, default=2000, help="round cap per game")
+    args = parser.parse_args()
+
+    print(f"{'method':>6} {'deck':>6} {'object g/s':>12} {'vector g/s':>12} {'speedup':>8}")
+    for method in ('1', '2', '3'):
+        for double in (False, True):
+            rules = Rules(war_resolution_method=method, use_double_deck=double)
+
+            start = time.perf_counter()
+            expected = simulation.simulate(args.check, rules, args.seed, args.max_rounds)
+            object_rate = args.check / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            results = vectorized.simulate(args.games, rules, args.seed, args.max_rounds)
+            vector_rate = args.games / (time.perf_counter() - start)
+
+            if results.to_list()[:args.check] != expected:
+                raise SystemExit(f"Engines disagree for method {method}, double deck {double}")
+            print(f"{method:>6} {'double' if double else 'single':>6} "
+                  f"{object_rate:>12,.0f} {vector_rate:>12,.0f} {vector_rate / object_rate:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
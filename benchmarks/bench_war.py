@@ -0,0 +1,85 @@
+"""
+Card conservation and throughput of the iterative war engine.
+
+Plays many random wars (random hands, player counts and war methods, with few
+distinct values so that ties chain) and checks after every one that each card
+that went in came out exactly once, in the winner's hand, behind the cards the
+winner already held. Then settles a tie chain far deeper than the recursion
+limit, which the previous recursive ``Rules.resolve_war`` could not. The
+same properties are asserted by ``tests/test_war.py``; this script plays far
+more wars and reports their throughput.
+"""
+import argparse
+import random
+import sys
+import time
+from src.card import Card
+from src.player import Player
+from src.rules import Rules
+from src.war import War
+
+METHODS = ('1', '2', '3', 'double', 'quadruple')
+
+
+def random_war(rng: random.Random, war: War, players: list) -> None:
+    values = rng.randint(1, 4)
+    cards = [card for card in Card.DECK if card.value - 2 < values] * 2
+    rng.shuffle(cards)
+    stake = cards[:rng.randint(0, 4)]
+    position = len(stake)
+    for player in players:
+        player.hand.clear()
+        size = rng.randint(0, 10)
+        player.receive_cards(cards[position:position + size])
+        position += size
+    war.rules.war_resolution_method = rng.choice(METHODS)
+
+    before = [list(player.hand) for player in players]
+    winner = war.fight(players, stake)
+
+    held = sorted(card.id for player in players for card in player.hand)
+    expected = sorted(card.id for card in cards[:position])
+    if held != expected:
+        raise SystemExit(f"Cards were not conserved: {before} + {stake} -> {[list(p.hand) for p in players]}")
+    received = list(winner.hand)[len(winner.hand) - war.pot_size:] if winner is not None else None
+    if received != war.pot[:war.pot_size]:
+        raise SystemExit(f"The winner did not receive the pot: {before} + {stake}")
+
+
+def deep_tie_chain(depth: int) -> War:
+    # Both players hold the same values in the same order, so every face-up card ties
+    first_suit = Card.DECK[:len(Card.RANKS)]
+    second_suit = Card.DECK[len(Card.RANKS):2 * len(Card.RANKS)]
+    players = [Player("Player 1"), Player("Player 2")]
+    for _ in range(depth // len(Card.RANKS) + 1):
+        players[0].receive_cards(first_suit)
+        players[1].receive_cards(second_suit)
+    war = War(Rules('1'), sum(len(player.hand) for player in players))
+    war.fight(players)
+    return war
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--wars", type=int, default=1_000_000, help="random wars to play")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="seed of the run")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    war = War(Rules(), 2 * 2 * len(Card.DECK))
+    tables = [[Player(f"Player {i + 1}") for i in range(count)] for count in range(1, 5)]
+    start = time.perf_counter()
+    for _ in range(args.wars):
+        random_war(rng, war, rng.choice(tables))
+    elapsed = time.perf_counter() - start
+    print(f"{args.wars:,} random wars conserved every card ({args.wars / elapsed:,.0f} wars/s with checks)")
+
+    depth = 10 * sys.getrecursionlimit()
+    start = time.perf_counter()
+    war = deep_tie_chain(depth)
+    print(f"Settled a war of depth {war.depth:,} ({war.pot_size:,} cards) "
+          f"in {time.perf_counter() - start:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+"""
+Benchmark suite for the engine and GUI hot paths, with regression baselines.
+
+Every benchmark runs on a fixed-seed corpus, so two runs measure exactly the
+same work. Each one is repeated and the best throughput is kept, then
+compared with the baselines stored in ``benchmarks/baselines.json``. The
+benchmarks slower than their baseline by more than the threshold are run again
+after the others (``--retries`` times at most, keeping the best throughput),
+so that a burst of load on the machine is not mistaken for a regression. Any
+still slower are flagged as regressions and the suite exits with status 1.
+The threshold is stored with the baselines, as noisier machines need a wider one.
+
+    python -m benchmarks                      # run and compare with the baselines
+    python -m benchmarks -k game.             # only the benchmarks matching a pattern
+    python -m benchmarks --update-baselines   # store this run as the new baselines
+
+Baselines depend on the machine, so regenerate them when the reference
+machine changes (with ``--threshold`` to set how much slower counts as a
+regression there). Whole-game throughput with a single and a double deck
+(``games.single_deck`` and ``games.double_deck``) are the headline metrics.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import sys
+import time
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from src.card import Card
+from src.deck import Deck
+from src.game import Game
+from src.player import Player
+from src.rng import PermutationBatch, SeededRandom
+from src.rules import Rules
+from src.simulation import game_seed, new_game, play_game
+from src.table import Table
+
+BASELINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+CORPUS_SEED = 20240917
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_RETRIES = 2
+# War methods with a distinct number of face-down cards
+WAR_METHODS = ('1', '2', '3', 'speed', 'quadruple')
+
+# A benchmark takes a scale factor for its amount of work and returns the
+# number of operations done and the seconds they took
+Benchmark = Callable[[float], Tuple[int, float]]
+BENCHMARKS: Dict[str, Tuple[Benchmark, str]] = {}
+
+
+class Result(NamedTuple):
+    """The best throughput of a benchmark, and how it compares with its baseline."""
+    name: str
+    rate: float
+    unit: str
+    baseline: Optional[float]
+
+    @property
+    def change(self) -> Optional[float]:
+        return self.rate / self.baseline - 1 if self.baseline else None
+
+
+def benchmark(name: str, unit: str = "ops/s") -> Callable[[Benchmark], Benchmark]:
+    """
+    Register a benchmark under a name.
+
+    Args:
+        name (str): The name of the benchmark in the results and the baselines.
+        unit (str): The unit of its throughput.
+    """
+    def register(function: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = (function, unit)
+        return function
+    return register
+
+
+def corpus_games(rules: Rules, count: int) -> List[Game]:
+    """Deal the first ``count`` games of the fixed-seed corpus."""
+    return [new_game(rules, game_seed(CORPUS_SEED, i)) for i in range(count)]
+
+
+@lru_cache(maxsize=None)
+def war_corpus(method: str, count: int) -> List[bytes]:
+    """Snapshots of the corpus games at the start of their first ``count`` wars with a war method."""
+    rules = Rules(method)
+    snapshots = []
+    i = 0
+    while len(snapshots) < count:
+        game = new_game(rules, game_seed(CORPUS_SEED, i))
+        game.enable_cycle_detection()
+        while game.outcome is None and len(snapshots) < count:
+            if game.war_in_progress:
+                snapshots.append(game.snapshot())
+                game.resolve_war()
+            else:
+                game.play_round()
+        i += 1
+    return snapshots
+
+
+@benchmark("deck.init")
+def bench_deck_init(scale: float) -> Tuple[int, float]:
+    n = int(200_000 * scale)
+    start = time.perf_counter()
+    for _ in range(n):
+        Deck()
+    return n, time.perf_counter() - start
+
+
+@benchmark("deck.shuffle")
+def bench_deck_shuffle(scale: float) -> Tuple[int, float]:
+    n = int(20_000 * scale)
+    deck = Deck()
+    rng = random.Random(CORPUS_SEED)
+    start = time.perf_counter()
+    for _ in range(n):
+        deck.shuffle(rng)
+    return n, time.perf_counter() - start
+
+
+@benchmark("deck.shuffle_seeded")
+def bench_deck_shuffle_seeded(scale: float) -> Tuple[int, float]:
+    n = int(20_000 * scale)
+    deck = Deck(rng=SeededRandom(CORPUS_SEED))
+    start = time.perf_counter()
+    for _ in range(n):
+        deck.shuffle()
+    return n, time.perf_counter() - start
+
+
+@benchmark("deck.permutations", "decks/s")
+def bench_deck_permutations(scale: float) -> Tuple[int, float]:
+    n = int(20_000 * scale)
+    batch = PermutationBatch([card.id for card in Deck().cards], 1000)
+    start = time.perf_counter()
+    for first in range(0, n, batch.count):
+        batch.fill(CORPUS_SEED, first)
+    return n, time.perf_counter() - start
+
+
+@benchmark("deck.deal")
+def bench_deck_deal(scale: float) -> Tuple[int, float]:
+    n = int(50_000 * scale)
+    deck = Deck()
+    deck.shuffle(random.Random(CORPUS_SEED))
+    start = time.perf_counter()
+    for _ in range(n):
+        deck.deal(2)
+    return n, time.perf_counter() - start
+
+
+@benchmark("card.compare")
+def bench_card_compare(scale: float) -> Tuple[int, float]:
+    rng = random.Random(CORPUS_SEED)
+    pairs = [(rng.choice(Card.DECK), rng.choice(Card.DECK)) for _ in range(int(100_000 * scale))]
+    start = time.perf_counter()
+    for a, b in pairs:
+        a < b
+        a > b
+        a == b
+    return 3 * len(pairs), time.perf_counter() - start
+
+
+@benchmark("player.play_card")
+def bench_player_play_card(scale: float) -> Tuple[int, float]:
+    player = Player("Player 1")
+    cards = Card.DECK * 100
+    elapsed = 0.0
+    n = 0
+    for _ in range(max(int(100 * scale), 1)):
+        player.receive_cards(cards)
+        play_card = player.play_card
+        start = time.perf_counter()
+        for _ in range(len(cards)):
+            play_card()
+        elapsed += time.perf_counter() - start
+        n += len(cards)
+    return n, elapsed
+
+
+@benchmark("table.get_round_winner")
+def bench_table_get_round_winner(scale: float) -> Tuple[int, float]:
+    rng = random.Random(CORPUS_SEED)
+    players = [Player("Player 1"), Player("Player 2")]
+    tables = []
+    for _ in range(1000):
+        table = Table()
+        for player in players:
+            table.place_card(player, rng.choice(Card.DECK))
+        tables.append(table)
+    repeats = max(int(200 * scale), 1)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for table in tables:
+            table.get_round_winner()
+    return repeats * len(tables), time.perf_counter() - start
+
+
+@benchmark("game.play_round")
+def bench_game_play_round(scale: float) -> Tuple[int, float]:
+    """Rounds outside wars, over whole corpus games (wars are resolved but not timed)."""
+    clock = time.perf_counter
+    elapsed = 0.0
+    n = 0
+    for game in corpus_games(Rules(), max(int(100 * scale), 1)):
+        game.enable_cycle_detection()
+        play_round = game.play_round
+        while game.outcome is None:
+            if game.war_in_progress:
+                game.resolve_war()
+            else:
+                start = clock()
+                play_round()
+                elapsed += clock() - start
+                n += 1
+    return n, elapsed
+
+
+def bench_game_resolve_war(method: str) -> Benchmark:
+    def run(scale: float) -> Tuple[int, float]:
+        rules = Rules(method)
+        game = new_game(rules, CORPUS_SEED)
+        clock = time.perf_counter
+        elapsed = 0.0
+        snapshots = war_corpus(method, max(int(5000 * scale), 1))
+        for snapshot in snapshots:
+            game.restore(snapshot)
+            start = clock()
+            game.resolve_war()
+            elapsed += clock() - start
+        return len(snapshots), elapsed
+    run.__doc__ = f"Wars from the corpus with the '{method}' war method, one at a time."
+    return run
+
+
+for _method in WAR_METHODS:
+    benchmark(f"game.resolve_war[{_method}]")(bench_game_resolve_war(_method))
+
+
+def bench_games(double_deck: bool) -> Benchmark:
+    def run(scale: float) -> Tuple[int, float]:
+        count = max(int((40 if double_deck else 100) * scale), 1)
+        games = corpus_games(Rules(use_double_deck=double_deck), count)
+        start = time.perf_counter()
+        for game in games:
+            play_game(game)
+        return len(games), time.perf_counter() - start
+    run.__doc__ = f"Whole corpus games played to their end with a {'double' if double_deck else 'single'} deck."
+    return run
+
+
+benchmark("games.single_deck", "games/s")(bench_games(False))
+benchmark("games.double_deck", "games/s")(bench_games(True))
+
+
+@benchmark("gui.load_card_images", "images/s")
+def bench_gui_load_card_images(scale: float) -> Tuple[int, float]:
+    """
+    Every image the GUI loads, decoded from the files into a cold cache.
+
+    This is the Pillow-only part of ``GUI.load_card_images`` (no sprite atlas
+    and no Tk ``PhotoImage``), so it runs without a display.
+    """
+    from src.gui import BACK_DECK_SIZE, CARD_SIZE, GUI
+    from src.image_cache import ImageCache
+
+    view = SimpleNamespace(card_size=CARD_SIZE, back_deck_size=BACK_DECK_SIZE)
+    sources = [('back', CARD_SIZE), *GUI.image_sources(view)]
+    loads = max(int(2 * scale), 1)
+    start = time.perf_counter()
+    for _ in range(loads):
+        cache = ImageCache(atlas_dir=None)
+        for source, size in sources:
+            cache.get_image(source, size)
+    return loads * len(sources), time.perf_counter() - start
+
+
+def format_rate(rate: float) -> str:
+    return f"{rate:>14,.0f}" if rate >= 100 else f"{rate:>14,.2f}"
+
+
+def is_regression(result: Result, threshold: float) -> bool:
+    return result.baseline is not None and result.change < -threshold
+
+
+def format_result(result: Result, threshold: float) -> str:
+    """Format a row of the results table."""
+    line = f"{result.name:<28} {format_rate(result.rate)} {result.unit:<8}"
+    if result.baseline is not None:
+        line += f" {format_rate(result.baseline)} {result.change:>+8.1%}"
+        if is_regression(result, threshold):
+            line += "  REGRESSION"
+    return line
+
+
+def run_benchmark(name: str, scale: float, repeat: int) -> float:
+    """
+    Run a benchmark several times.
+
+    Returns:
+        float: The best throughput, in operations per second.
+    """
+    function, _ = BENCHMARKS[name]
+    best = 0.0
+    for _ in range(repeat):
+        operations, seconds = function(scale)
+        best = max(best, operations / seconds)
+    return best
+
+
+def load_baselines(path: str) -> Tuple[Dict[str, float], float]:
+    """
+    Read stored baselines.
+
+    Returns:
+        Tuple[Dict[str, float], float]: The baseline throughput of each benchmark, empty if
+            there is no file, and the threshold stored with them (``DEFAULT_THRESHOLD`` if none).
+    """
+    if not os.path.exists(path):
+        return {}, DEFAULT_THRESHOLD
+    with open(path) as file:
+        data = json.load(file)
+    rates = {name: metric["rate"] for name, metric in data["benchmarks"].items()}
+    return rates, data.get("threshold", DEFAULT_THRESHOLD)
+
+
+def save_baselines(path: str, results: List[Result], scale: float, threshold: float) -> None:
+    """Store results as baselines, keeping the baselines of the benchmarks that were not run."""
+    data = {"benchmarks": {}}
+    if os.path.exists(path):
+        with open(path) as file:
+            data = json.load(file)
+    data["machine"] = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "processor": platform.machine(),
+        "system": platform.system(),
+    }
+    data["scale"] = scale
+    data["threshold"] = threshold
+    for result in results:
+        data["benchmarks"][result.name] = {"rate": round(result.rate, 1), "unit": result.unit}
+    data["benchmarks"] = dict(sorted(data["benchmarks"].items()))
+    with open(path, "w") as file:
+        json.dump(data, file, indent=2)
+        file.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", "--filter", default="", help="only run the benchmarks whose name matches this regex")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="runs per benchmark (best is kept)")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier for the work done per run")
+    parser.add_argument("--threshold", type=float,
+                        help="slowdown relative to the baseline flagged as a regression "
+                             "(default: the one stored with the baselines, or 0.2)")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES,
+                        help="times a benchmark slower than its baseline is run again before it is a regression")
+    parser.add_argument("--baselines", default=BASELINES_PATH, help="baselines file")
+    parser.add_argument("--update-baselines", action="store_true", help="store the results as the new baselines")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if re.search(args.filter, name)]
+    if args.list:
+        print("\n".join(names))
+        return
+    baselines, threshold = load_baselines(args.baselines)
+    if args.threshold is not None:
+        threshold = args.threshold
+
+    results = []
+    print(f"{'benchmark':<28} {'rate':>14} {'unit':<8} {'baseline':>14} {'change':>8}")
+    for name in names:
+        try:
+            rate = run_benchmark(name, args.scale, args.repeat)
+        except ImportError as error:
+            print(f"{name:<28} skipped: {error}")
+            continue
+        result = Result(name, rate, BENCHMARKS[name][1], baselines.get(name))
+        results.append(result)
+        print(format_result(result, threshold), flush=True)
+
+    # Load on the machine tends to come in bursts, so the slow benchmarks are
+    # run again once the others are done rather than straight away
+    retries = 0 if args.update_baselines else args.retries
+    for _ in range(retries):
+        slow = [i for i, result in enumerate(results) if is_regression(result, threshold)]
+        if not slow:
+            break
+        print(f"Running {len(slow)} benchmark(s) slower than their baseline again")
+        for i in slow:
+            result = results[i]
+            results[i] = result._replace(rate=max(result.rate, run_benchmark(result.name, args.scale, args.repeat)))
+            print(format_result(results[i], threshold), flush=True)
+    regressions = [result for result in results if is_regression(result, threshold)]
+
+    if args.update_baselines:
+        save_baselines(args.baselines, results, args.scale, threshold)
+        print(f"Stored {len(results)} baselines in {args.baselines}")
+    elif regressions:
+        print(f"{len(regressions)} benchmark(s) slower than their baseline by more than {threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
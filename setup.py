@@ -27,9 +27,15 @@ setup(
     install_requires=[
         "Pillow>=8.0.0",
     ],
+    extras_require={
+        "fast": ["numpy>=1.17"],
+    },
     entry_points={
         "console_scripts": [
             "warzone=src.main:main",
+            "warzone-sim=src.simulation:main",
+            "warzone-atlas=src.atlas:main",
+            "warzone-server=src.server:main",
         ],
     },
     include_package_data=True,
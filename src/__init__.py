@@ -12,17 +12,41 @@ Modules:
     rules: Defines the Rules class for game variations
     game: Implements the main Game logic
     gui: Contains the GUI class for the graphical user interface
+    simulation: Runs games headlessly for batch simulation
+
+GUI and simulate are loaded on first access, so that headless users of the
+package do not import tkinter and Pillow.
 """
 
+import importlib
+
 from .card import Card
 from .deck import Deck
 from .player import Player
 from .table import Table
 from .rules import Rules
 from .game import Game
-from .gui import GUI
 
-__all__ = ['Card', 'Deck', 'Player', 'Table', 'Rules', 'Game', 'GUI']
+__all__ = ['Card', 'Deck', 'Player', 'Table', 'Rules', 'Game', 'GUI', 'simulate']
+
+# Attributes loaded lazily, mapped to the module that defines them
+_LAZY_ATTRIBUTES = {
+    'GUI': '.gui',
+    'simulate': '.simulation',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
 
 __version__ = "1.0.0"
 __author__ = "Kashaf Ahmed"
@@ -0,0 +1,258 @@
+"""
+Pre-resized sprite atlases of the card images.
+
+An atlas holds every card face and back from ``static/images/DECK`` at one
+size, as raw RGBA pixels in a single file, with a JSON index of offsets. At
+runtime the file is memory-mapped and images are sliced out of it without
+decoding any PNG. The index records the modification time and size of every
+source image, and an atlas whose sources have changed, or that is missing an
+image added since it was built, is ignored.
+
+Build the atlases with:
+
+    python -m src.atlas
+"""
+import argparse
+import json
+import mmap
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+from PIL import Image
+from .card import Card
+
+ATLAS_DIR = os.path.join("static", "atlas")
+ATLAS_VERSION = 1
+
+# The sizes used by the GUI and by Card.get_image
+DEFAULT_SIZES = [(150, 218), (350, 350), (100, 145)]
+
+
+def atlas_paths(size: Tuple[int, int], atlas_dir: str = ATLAS_DIR) -> Tuple[str, str]:
+    """
+    Get the paths of the pixel file and the index of an atlas.
+
+    Args:
+        size (Tuple[int, int]): The size of the images in the atlas.
+        atlas_dir (str): The directory containing the atlases.
+
+    Returns:
+        Tuple[str, str]: The path of the pixel file and the path of the index.
+    """
+    stem = os.path.join(atlas_dir, f"deck_{size[0]}x{size[1]}")
+    return f"{stem}.rgba", f"{stem}.json"
+
+
+def source_images(image_dir: str = Card.IMAGE_PATH) -> List[str]:
+    """
+    List the images packed into an atlas: every card face and every card back.
+
+    Args:
+        image_dir (str): The directory containing the card images.
+
+    Returns:
+        List[str]: The file names of the images.
+    """
+    faces = {f"{card.rank}{card.suit[0].upper()}.png" for card in Card.DECK}
+    backs = {"gray_back.png", "back_cards-07.png"}
+    backs.update(name for name in os.listdir(image_dir) if name.endswith("_back.png"))
+    return sorted(name for name in faces | backs if os.path.exists(os.path.join(image_dir, name)))
+
+
+def source_signature(path: str) -> List[int]:
+    """
+    Get the signature of a source image, which changes whenever the file does.
+
+    Args:
+        path (str): The path of the image.
+
+    Returns:
+        List[int]: The modification time in nanoseconds and the size in bytes.
+    """
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def build_atlas(size: Tuple[int, int], image_dir: str = Card.IMAGE_PATH, atlas_dir: str = ATLAS_DIR) -> str:
+    """
+    Build the atlas of one size.
+
+    Args:
+        size (Tuple[int, int]): The size of the images in the atlas.
+        image_dir (str): The directory containing the card images.
+        atlas_dir (str): The directory to write the atlas to.
+
+    Returns:
+        str: The path of the index of the atlas.
+    """
+    os.makedirs(atlas_dir, exist_ok=True)
+    pixels_path, index_path = atlas_paths(size, atlas_dir)
+    entries = {}
+    offset = 0
+    with open(pixels_path + ".tmp", "wb") as pixels:
+        for name in source_images(image_dir):
+            path = os.path.join(image_dir, name)
+            with Image.open(path) as image:
+                data = image.convert("RGBA").resize(size, Image.LANCZOS).tobytes()
+            pixels.write(data)
+            entries[os.path.splitext(name)[0]] = {
+                'offset': offset,
+                'source': source_signature(path),
+            }
+            offset += len(data)
+
+    index = {'version': ATLAS_VERSION, 'size': list(size), 'entries': entries}
+    with open(index_path + ".tmp", "w") as file:
+        json.dump(index, file, indent=1)
+    # The index is replaced last, so a reader never sees an index ahead of its pixels
+    os.replace(pixels_path + ".tmp", pixels_path)
+    os.replace(index_path + ".tmp", index_path)
+    return index_path
+
+
+class Atlas:
+    """
+    A memory-mapped atlas of card images of one size.
+
+    Attributes:
+        size (Tuple[int, int]): The size of the images in the atlas.
+        entries (Dict[str, int]): The byte offset of each image, by file name without extension.
+    """
+
+    def __init__(self, size: Tuple[int, int], entries: Dict[str, int], pixels: mmap.mmap):
+        self.size = size
+        self.entries = entries
+        self._pixels = pixels
+        self._stride = size[0] * size[1] * 4
+
+    @classmethod
+    def open(cls, size: Tuple[int, int], image_dir: str = Card.IMAGE_PATH,
+             atlas_dir: str = ATLAS_DIR) -> Optional['Atlas']:
+        """
+        Open the atlas of one size, if it exists and is up to date.
+
+        Args:
+            size (Tuple[int, int]): The size of the images in the atlas.
+            image_dir (str): The directory containing the card images.
+            atlas_dir (str): The directory containing the atlases.
+
+        Returns:
+            Optional[Atlas]: The atlas, or None if it is missing, unreadable,
+                older than any of its source images or missing any of them.
+        """
+        pixels_path, index_path = atlas_paths(size, atlas_dir)
+        try:
+            with open(index_path) as file:
+                index = json.load(file)
+            if index.get('version') != ATLAS_VERSION or tuple(index['size']) != tuple(size):
+                return None
+            if set(index['entries']) != {os.path.splitext(name)[0] for name in source_images(image_dir)}:
+                return None
+            for name, entry in index['entries'].items():
+                if source_signature(os.path.join(image_dir, name + ".png")) != entry['source']:
+                    return None
+            with open(pixels_path, "rb") as file:
+                pixels = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, KeyError):
+            return None
+
+        entries = {name: entry['offset'] for name, entry in index['entries'].items()}
+        stride = size[0] * size[1] * 4
+        if any(offset + stride > len(pixels) for offset in entries.values()):
+            pixels.close()
+            return None
+        return cls(tuple(size), entries, pixels)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def get(self, name: str) -> Optional[Image.Image]:
+        """
+        Get an image from the atlas, without copying or decoding it.
+
+        Args:
+            name (str): The file name of the image, without extension (e.g. 'AS').
+
+        Returns:
+            Optional[Image.Image]: A read-only image backed by the atlas, or None if it is not in the atlas.
+        """
+        offset = self.entries.get(name)
+        if offset is None:
+            return None
+        view = memoryview(self._pixels)[offset:offset + self._stride]
+        return Image.frombuffer("RGBA", self.size, view, "raw", "RGBA", 0, 1)
+
+
+class AtlasSet:
+    """
+    The atlases of every size, opened on first use.
+
+    An opened atlas (or the lack of an up-to-date one) is reused until the
+    image directory or the atlas's index changes on disk, that is until images
+    are added, removed or replaced, or the atlas is rebuilt, and the atlas is
+    then opened again. Checking this takes two ``stat`` calls per lookup, and
+    ``ImageCache`` only looks images up on a miss. Images edited in place
+    leave the directory unchanged, so only the next ``AtlasSet`` notices them.
+    """
+
+    def __init__(self, image_dir: str = Card.IMAGE_PATH, atlas_dir: str = ATLAS_DIR):
+        self.image_dir = image_dir
+        self.atlas_dir = atlas_dir
+        # size -> (stamp of the files the atlas was opened from, atlas or None)
+        self._atlases: Dict[Tuple[int, int], Tuple[Optional[tuple], Optional[Atlas]]] = {}
+        self._lock = threading.Lock()
+
+    def _stamp(self, size: Tuple[int, int]) -> Optional[tuple]:
+        """Get a stamp of the image directory and the atlas index, which changes whenever either is replaced."""
+        try:
+            directory = os.stat(self.image_dir)
+            index = os.stat(atlas_paths(size, self.atlas_dir)[1])
+        except OSError:
+            return None
+        return directory.st_mtime_ns, index.st_ino, index.st_mtime_ns, index.st_size
+
+    def get(self, name: str, size: Tuple[int, int]) -> Optional[Image.Image]:
+        """
+        Get an image from the atlas of its size.
+
+        Args:
+            name (str): The file name of the image, without extension.
+            size (Tuple[int, int]): The size of the image.
+
+        Returns:
+            Optional[Image.Image]: The image, or None if there is no up-to-date atlas holding it.
+        """
+        size = tuple(size)
+        stamp = self._stamp(size)
+        with self._lock:
+            cached = self._atlases.get(size)
+            if cached is None or cached[0] != stamp:
+                cached = self._atlases[size] = (stamp, Atlas.open(size, self.image_dir, self.atlas_dir))
+            atlas = cached[1]
+        return atlas.get(name) if atlas is not None else None
+
+
+def parse_size(text: str) -> Tuple[int, int]:
+    """
+    Parse a size written as WIDTHxHEIGHT.
+    """
+    width, _, height = text.partition("x")
+    return int(width), int(height)
+
+
+def main(argv: Optional[Iterable[str]] = None) -> None:
+    """
+    Command line entry point for building atlases.
+    """
+    parser = argparse.ArgumentParser(description="Build the card image atlases.")
+    parser.add_argument("--size", type=parse_size, action="append",
+                        help="image size as WIDTHxHEIGHT (repeatable; default: the sizes the game uses)")
+    parser.add_argument("--images", default=Card.IMAGE_PATH, help="directory of the card images")
+    parser.add_argument("--out", default=ATLAS_DIR, help="directory to write the atlases to")
+    args = parser.parse_args(argv)
+
+    for size in args.size or DEFAULT_SIZES:
+        print(f"Built {build_atlas(size, args.images, args.out)}")
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 import os
-from PIL import Image, ImageTk
+from typing import TYPE_CHECKING, Dict, Tuple
+
+if TYPE_CHECKING:
+    from PIL import ImageTk
 
 class Card:
     """
@@ -8,40 +11,78 @@ class Card:
     This class defines a card with a rank and suit, provides methods
     for comparing cards based on their rank, and a method to get the card's image.
 
+    Cards are immutable flyweights: there is exactly one instance of each of the
+    52 cards, and ``Card(rank, suit)`` returns that shared instance.
+
     Attributes:
         rank (str): The rank of the card (e.g., '2', '3', ..., 'J', 'Q', 'K', 'A').
         suit (str): The suit of the card (Hearts, Diamonds, Clubs, Spades).
-        facedown (bool): Indicates whether the card is face down (default is False).
+        value (int): The value of the card (2-14, where Ace is 14).
+        id (int): The position of the card in an unshuffled deck (0-51).
+        facedown (bool): Indicates whether the card is face down (always False).
 
     Class Attributes:
         RANKS (list): Valid card ranks in ascending order.
         SUITS (list): Valid card suits.
         IMAGE_PATH (str): Path to the directory containing card images.
+        DECK (tuple): All 52 cards, in unshuffled deck order (indexed by ``id``).
     """
 
+    __slots__ = ('rank', 'suit', 'value', 'id')
+
     RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
     SUITS = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
     IMAGE_PATH = os.path.join("static", "images", "DECK")
+    DECK: Tuple['Card', ...] = ()
 
-    def __init__(self, rank: str, suit: str):
+    facedown = False
+
+    # Interned instances keyed by (rank, suit), and _COMPARE[a.id][b.id] == a.compare(b)
+    _INTERNED: Dict[Tuple[str, str], 'Card'] = {}
+    _COMPARE: Tuple[Tuple[int, ...], ...] = ()
+
+    def __new__(cls, rank: str, suit: str) -> 'Card':
         """
-        Initialize a new Card instance.
+        Get the card with the given rank and suit.
 
         Args:
             rank (str): The rank of the card.
             suit (str): The suit of the card.
 
+        Returns:
+            Card: The shared instance of the card.
+
         Raises:
             ValueError: If an invalid rank or suit is provided.
         """
-        if rank not in self.RANKS:
-            raise ValueError(f"Invalid rank: {rank}")
-        if suit not in self.SUITS:
+        card = cls._INTERNED.get((rank, suit))
+        if card is None:
+            if rank not in cls.RANKS:
+                raise ValueError(f"Invalid rank: {rank}")
             raise ValueError(f"Invalid suit: {suit}")
-        
-        self.rank = rank
-        self.suit = suit
-        self.facedown = False
+        return card
+
+    @classmethod
+    def from_id(cls, card_id: int) -> 'Card':
+        """
+        Get the card with the given id.
+
+        Args:
+            card_id (int): The id of the card (0-51).
+
+        Returns:
+            Card: The shared instance of the card.
+        """
+        return cls.DECK[card_id]
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("Card is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Card is immutable")
+
+    def __reduce__(self):
+        return (Card, (self.rank, self.suit))
 
     def __str__(self) -> str:
         """
@@ -59,7 +100,7 @@ class Card:
         Returns:
             int: The value of the card (2-14, where Ace is 14).
         """
-        return self.RANKS.index(self.rank) + 2
+        return self.value
 
     def __lt__(self, other: 'Card') -> bool:
         """
@@ -71,7 +112,7 @@ class Card:
         Returns:
             bool: True if this card's value is less than the other card's value, False otherwise.
         """
-        return self.get_value() < other.get_value()
+        return self.value < other.value
 
     def __gt__(self, other: 'Card') -> bool:
         """
@@ -83,7 +124,7 @@ class Card:
         Returns:
             bool: True if this card's value is greater than the other card's value, False otherwise.
         """
-        return self.get_value() > other.get_value()
+        return self.value > other.value
 
     def __eq__(self, other: 'Card') -> bool:
         """
@@ -95,7 +136,7 @@ class Card:
         Returns:
             bool: True if this card's value is equal to the other card's value, False otherwise.
         """
-        return self.get_value() == other.get_value()
+        return self.value == other.value
 
     def compare(self, other_card: 'Card') -> int:
         """
@@ -107,17 +148,15 @@ class Card:
         Returns:
             int: 1 if this card's rank is higher, -1 if lower, and 0 if equal.
         """
-        if self > other_card:
-            return 1
-        elif self < other_card:
-            return -1
-        else:
-            return 0
+        return self._COMPARE[self.id][other_card.id]
 
-    def get_image(self, size: tuple = (100, 145)) -> ImageTk.PhotoImage:
+    def get_image(self, size: tuple = (100, 145)) -> 'ImageTk.PhotoImage':
         """
         Get the image of the card (front face).
 
+        Images come from the image cache shared with the GUI, so each size is
+        only rendered once.
+
         Args:
             size (tuple): The desired size of the image (width, height).
 
@@ -127,13 +166,31 @@ class Card:
         Raises:
             FileNotFoundError: If the image file for the card is not found.
         """
-        suit_letter = self.suit[0].upper()
-        filename = f"{self.rank}{suit_letter}.png"
-        filepath = os.path.join(self.IMAGE_PATH, filename)
-        
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"Card image not found: {filepath}")
-        
-        image = Image.open(filepath)
-        image = image.resize(size, Image.LANCZOS)
-        return ImageTk.PhotoImage(image)
\ No newline at end of file
+        # Imported here so that headless use of the game does not load Pillow
+        from .image_cache import get_image_cache
+
+        return get_image_cache().get_photo(self, size)
+
+
+
+def _intern_cards() -> None:
+    """
+    Create the 52 shared card instances and the comparison table.
+    """
+    deck = []
+    for suit in Card.SUITS:
+        for rank in Card.RANKS:
+            card = object.__new__(Card)
+            object.__setattr__(card, 'rank', rank)
+            object.__setattr__(card, 'suit', suit)
+            object.__setattr__(card, 'value', Card.RANKS.index(rank) + 2)
+            object.__setattr__(card, 'id', len(deck))
+            Card._INTERNED[(rank, suit)] = card
+            deck.append(card)
+    Card.DECK = tuple(deck)
+    Card._COMPARE = tuple(
+        tuple((a.value > b.value) - (a.value < b.value) for b in deck) for a in deck
+    )
+
+
+_intern_cards()
@@ -0,0 +1,68 @@
+from typing import Callable, Hashable, Optional
+
+
+class CycleDetector:
+    """
+    Detects when a sequence of game states starts repeating, in constant memory.
+
+    This is Brent's algorithm run online: one checkpoint state is kept and
+    compared against every new state, and the checkpoint moves forward after
+    1, 2, 4, 8, ... states. Since a game is deterministic, a state that repeats
+    means the game will cycle forever. States are compared by fingerprint, and a
+    fingerprint match is confirmed against the exact checkpoint state.
+
+    Attributes:
+        length (Optional[int]): The length of the cycle, once one has been found.
+    """
+
+    __slots__ = ('_fingerprint', '_state', '_power', '_steps', 'length')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget every state seen, e.g. for a new game.
+        """
+        self._fingerprint: Optional[Hashable] = None
+        self._state: Optional[Hashable] = None
+        self._power = 1
+        self._steps = 0
+        self.length: Optional[int] = None
+
+    def observe(self, fingerprint: Hashable, exact_state: Callable[[], Hashable]) -> bool:
+        """
+        Record the next state of the game.
+
+        Args:
+            fingerprint (Hashable): A cheap fingerprint of the state.
+            exact_state (Callable[[], Hashable]): Returns the exact state. Only
+                called when the state becomes the checkpoint or matches its fingerprint.
+
+        Returns:
+            bool: True if the state was seen before, i.e. the game is in a cycle.
+        """
+        if self._fingerprint is not None:
+            self._steps += 1
+            if fingerprint == self._fingerprint and exact_state() == self._state:
+                self.length = self._steps
+                return True
+            if self._steps < self._power:
+                return False
+            self._power *= 2
+        self._fingerprint = fingerprint
+        self._state = exact_state()
+        self._steps = 0
+        return False
+
+    def copy(self) -> 'CycleDetector':
+        """
+        Get an independent copy of the detector. The checkpoint is immutable, so it is shared.
+        """
+        clone = CycleDetector.__new__(CycleDetector)
+        clone._fingerprint = self._fingerprint
+        clone._state = self._state
+        clone._power = self._power
+        clone._steps = self._steps
+        clone.length = self.length
+        return clone
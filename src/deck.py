@@ -1,5 +1,5 @@
 import random
-from typing import List
+from typing import List, Optional
 from .card import Card
 
 class Deck:
@@ -11,28 +11,58 @@ class Deck:
 
     Attributes:
         cards (List[Card]): A list containing all the Card objects in the deck.
+        rng (Optional[random.Random]): The generator that shuffles the deck, or
+            None for the global generator of the ``random`` module.
     """
 
-    def __init__(self):
+    def __init__(self, copies: int = 1, rng: Optional[random.Random] = None):
         """
         Initialize a new deck of cards.
 
         Creates a standard 52-card deck with all combinations of ranks and suits.
+        The cards are the shared ``Card`` instances, so no cards are created.
+
+        Args:
+            copies (int): The number of 52-card decks to combine, e.g. 2 for a double deck.
+            rng (Optional[random.Random]): The generator that shuffles the deck,
+                e.g. an ``rng.SeededRandom``. Default is the global generator.
+        """
+        self.cards = list(Card.DECK * copies)
+        self.rng = rng
+
+    def reset(self, copies: int = 1) -> None:
+        """
+        Put the cards back in their unshuffled order, reusing the list.
+
+        Args:
+            copies (int): The number of 52-card decks to combine, e.g. 2 for a double deck.
         """
-        self.cards = [Card(rank, suit) for suit in Card.SUITS for rank in Card.RANKS]
+        cards = self.cards
+        size = len(Card.DECK)
+        del cards[size * copies:]
+        for copy in range(copies):
+            cards[copy * size:(copy + 1) * size] = Card.DECK
 
-    def shuffle(self) -> None:
+    def shuffle(self, rng: Optional[random.Random] = None) -> None:
         """
         Shuffle the deck of cards.
 
         This method randomizes the order of cards in the deck.
+
+        Args:
+            rng (Optional[random.Random]): The random number generator to shuffle with.
+                Defaults to the deck's ``rng``, or the global generator of the
+                ``random`` module if it has none.
         """
-        random.shuffle(self.cards)
+        (rng or self.rng or random).shuffle(self.cards)
 
     def deal(self, num_players: int) -> List[List[Card]]:
         """
         Deal cards to a specified number of players.
 
+        Every card is dealt, one at a time in turn from the top of the deck.
+        When the cards do not divide evenly, the first players get one card more.
+
         Args:
             num_players (int): The number of players to deal cards to.
 
@@ -44,17 +74,10 @@ class Deck:
         """
         if num_players < 2:
             raise ValueError("At least two players are required.")
-        
-        cards_per_player = len(self.cards) // num_players
-        if cards_per_player == 0:
+        if len(self.cards) < num_players:
             raise ValueError("Not enough cards to deal to all players.")
 
-        hands = [[] for _ in range(num_players)]
-        
-        for i in range(cards_per_player * num_players):
-            hands[i % num_players].append(self.cards[i])
-        
-        return hands
+        return [self.cards[seat::num_players] for seat in range(num_players)]
 
     def __len__(self) -> int:
         """
@@ -1,9 +1,49 @@
-from typing import Optional, List
+import itertools
+import random
+import struct
+from typing import Dict, Hashable, Optional, List, Tuple, Union
 from .deck import Deck
 from .player import Player
 from .table import Table
 from .rules import Rules
 from .card import Card
+from .cycle import CycleDetector
+from .rng import SeededRandom
+from .war import War
+
+
+class GameListener:
+    """
+    Receives the events of a game, e.g. to record or analyse it.
+
+    Subclasses override the events they need; every method does nothing by
+    default. Cards are given as ``(seat, card)`` pairs, where the seat is the
+    index of the player in ``Game.players``, in the order they were played.
+    """
+
+    def game_started(self, game: 'Game') -> None:
+        """
+        Called when the listener is added, when the game is reset, when the cards are dealt
+        and when a snapshot is restored.
+        """
+
+    def round_played(self, game: 'Game', placed: List[Tuple[int, Card]], winner: Optional[int],
+                     pot_size: int) -> None:
+        """
+        Called after a round. ``winner`` is None and ``pot_size`` is 0 if the round was tied.
+        """
+
+    def war_fought(self, game: 'Game', placed: List[Tuple[int, Card]], winner: Optional[int],
+                   pot_size: int) -> None:
+        """
+        Called after a war, with every card put down in it. The pot also holds the tied cards.
+        """
+
+    def game_ended(self, game: 'Game') -> None:
+        """
+        Called once ``Game.outcome`` is set.
+        """
+
 
 class Game:
     """
@@ -13,122 +53,440 @@ class Game:
     the table, and game rules. It provides methods for game setup and gameplay.
 
     Attributes:
-        deck (Deck): The deck of cards used in the game.
+        deck (Deck): The deck of cards used in the game. Its ``rng`` is the game's
+            own generator, so games never share random state.
         players (List[Player]): The list of players in the game.
         table (Table): The game table where cards are played.
         rules (Rules): The set of rules governing the game.
+        war (War): The engine that plays out wars, with a pot sized for the deck.
+        war_depth (int): The number of face-up rounds the last war took to settle.
+        rounds_played (int): The number of rounds played so far.
+        max_rounds (Optional[int]): The number of rounds after which the game is abandoned, or None for no limit.
+        cycle_detector (Optional[CycleDetector]): Detects games that would never end, when enabled.
+        outcome (Optional[str]): How the game ended: 'win', 'infinite' (the game was found
+            to repeat forever) or 'capped' (``max_rounds`` was reached). None while it is running.
+        listeners (List[GameListener]): The listeners notified of the events of the game.
+
+    Class Attributes:
+        OUTCOMES (tuple): The possible outcomes, in the order used to encode them as integers.
+        SNAPSHOT_VERSION (int): The version of the ``snapshot`` encoding.
     """
 
-    def __init__(self, player1_name: str, player2_name: str, rules: Rules):
+    OUTCOMES = ('win', 'infinite', 'capped')
+
+    SNAPSHOT_VERSION = 1
+    # version, number of players, flags, outcome (0 for None), rounds played, war depth
+    _SNAPSHOT_HEADER = struct.Struct('<BBBBII')
+    _SNAPSHOT_WAR = 1  # flag: a war is in progress
+    _SNAPSHOT_DECK = 2  # flag: the deck order is stored instead of the (empty) hands
+    _NO_CARD = 0xFF
+
+    def __init__(self, *players: Union[str, Rules], rules: Optional[Rules] = None,
+                 max_rounds: Optional[int] = None, detect_cycles: bool = False,
+                 rng: Optional[random.Random] = None):
         """
         Initialize a new game.
 
+        The rules, ``max_rounds`` and ``detect_cycles`` may also follow the
+        player names positionally, as in ``Game("Player 1", "Player 2", rules)``.
+
         Args:
-            player1_name (str): The name of the first player.
-            player2_name (str): The name of the second player.
-            rules (Rules): The rule set for the game.
-        """
-        self.rules = rules
-        self.deck = Deck()
-        if self.rules.use_double_deck:
-            self.deck.cards.extend(Deck().cards)  # Add a second deck
-        self.players = [Player(player1_name), Player(player2_name)]
-        self.table = Table()
+            *players (str): The names of the players, in seat order. At least two, all different.
+            rules (Optional[Rules]): The rule set for the game. Default is the standard rules.
+            max_rounds (Optional[int]): The number of rounds after which the game is abandoned.
+                Default is None (no limit).
+            detect_cycles (bool): Whether to end games that would repeat forever. Default is False.
+            rng (Optional[random.Random]): The generator that shuffles the deck.
+                Default is an ``rng.SeededRandom`` created on the first shuffle.
+
+        Raises:
+            ValueError: If there are fewer than two players or two players have the same name.
+            TypeError: If the arguments after the names are not a rule set and options.
+        """
+        names = list(itertools.takewhile(lambda arg: isinstance(arg, str), players))
+        options = players[len(names):]
+        if options:
+            if rules is not None or len(options) > 3 or not isinstance(options[0], Rules):
+                raise TypeError("Expected player names followed by rules, max_rounds and detect_cycles")
+            rules = options[0]
+            if len(options) > 1:
+                max_rounds = options[1]
+            if len(options) > 2:
+                detect_cycles = options[2]
+        if len(names) < 2:
+            raise ValueError("At least two players are required.")
+        if len(set(names)) != len(names):
+            raise ValueError("Player names must be different.")
+
+        self.rules = rules if rules is not None else Rules()
+        self.deck = Deck(2 if self.rules.use_double_deck else 1, rng)
+        self.players = [Player(name) for name in names]
+        self._seats = {name: seat for seat, name in enumerate(names)}
+        self.table = Table(names)
+        self.war = War(self.rules, len(self.deck.cards))
         self.war_in_progress = False
         self.war_cards = []
         self.speed_war_cards = []
+        self.war_depth = 0
+        self.rounds_played = 0
+        self.max_rounds = max_rounds
+        self.outcome: Optional[str] = None
+        self.cycle_detector: Optional[CycleDetector] = None
+        self.listeners: List[GameListener] = []
+        if detect_cycles:
+            self.enable_cycle_detection()
+
+    def enable_cycle_detection(self) -> None:
+        """
+        Start detecting whether the game repeats forever.
+
+        The state of the game is checked after every round, first by the cheap
+        ``hand_fingerprint`` and only then by the exact ``hand_state``, so
+        nothing is tracked as cards move. Memory use stays constant however
+        long the game runs.
+        """
+        self.cycle_detector = CycleDetector()
+
+    def add_listener(self, listener: GameListener) -> None:
+        """
+        Start notifying a listener of the events of the game.
+
+        The listener's ``game_started`` is called right away with the current state.
+
+        Args:
+            listener (GameListener): The listener.
+        """
+        self.listeners.append(listener)
+        listener.game_started(self)
 
-    def shuffle(self) -> None:
+    def remove_listener(self, listener: GameListener) -> None:
+        """
+        Stop notifying a listener.
+
+        Args:
+            listener (GameListener): The listener.
+        """
+        self.listeners.remove(listener)
+
+    def hand_fingerprint(self) -> Hashable:
+        """
+        Get a cheap fingerprint of the hands, checked by cycle detection after every round.
+
+        Equal states have equal fingerprints. The size of the first player's
+        hand and the value of its bottom card (the last one won) tell apart
+        most states, so ``hand_state`` is rarely needed to settle a match.
+        Once the first player is out, the size and bottom value of every hand are used.
+
+        Returns:
+            Hashable: The fingerprint.
+        """
+        hand = self.players[0].hand
+        if hand:
+            return len(hand) << 4 | hand[-1].value
+        return tuple([(len(player.hand), player.hand[-1].value if player.hand else 0) for player in self.players])
+
+    def hand_state(self) -> bytes:
+        """
+        Get the card values in every player's hand, which decide the rest of the game.
+
+        Returns:
+            bytes: The values of each hand, top card first, with hands separated by a zero byte.
+        """
+        return b"\0".join(bytes(card.value for card in player.hand) for player in self.players)
+
+    def _end_step(self) -> Optional[Player]:
+        """
+        Update the outcome after a round or a war.
+
+        Returns:
+            Optional[Player]: The winner of the game if the game has been won, otherwise None.
+        """
+        winner = self.get_winner()
+        if self.outcome is not None:
+            return winner
+        if winner is not None:
+            self.outcome = 'win'
+        elif (not self.war_in_progress and self.cycle_detector is not None and self.cycle_detector.observe(
+                self.hand_fingerprint(), self.hand_state)):
+            self.outcome = 'infinite'
+        elif self.max_rounds is not None and self.rounds_played >= self.max_rounds:
+            self.outcome = 'capped'
+        else:
+            return winner
+        for listener in self.listeners:
+            listener.game_ended(self)
+        return winner
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """
+        Start a new game with the same players, reusing the deck, hands, table and war pot.
+
+        Every card goes back into the deck in its original order, the counters
+        and the outcome are cleared and the deck is shuffled, so the game is in
+        the same state as a new ``Game`` after ``shuffle``; deal the cards with
+        ``deal``. A change to ``rules.use_double_deck`` takes effect. Cycle
+        detection stays enabled if it was, and the listeners stay attached.
+
+        Args:
+            seed (Optional[int]): The seed to reseed the game's generator with,
+                so that the shuffle matches one with ``random.Random(seed)``.
+                Default is None (the generator carries on from its last shuffle).
+        """
+        deck = self.deck
+        deck.reset(2 if self.rules.use_double_deck else 1)
+        if len(self.war.pot) != len(deck.cards):
+            self.war = War(self.rules, len(deck.cards))
+        self.war.rules = self.rules
+        for player in self.players:
+            player.reset()
+        self.table.reset()
+        self.war_in_progress = False
+        self.war_cards.clear()
+        self.speed_war_cards.clear()
+        self.war_depth = 0
+        self.rounds_played = 0
+        self.outcome = None
+        if self.cycle_detector is not None:
+            self.cycle_detector.reset()
+        if deck.rng is None:
+            deck.rng = SeededRandom(seed)
+        elif seed is not None:
+            deck.rng.seed(seed)
+        deck.shuffle()
+        for listener in self.listeners:
+            listener.game_started(self)
+
+    def shuffle(self, rng: Optional[random.Random] = None) -> None:
         """
         Shuffle the deck of cards.
+
+        Args:
+            rng (Optional[random.Random]): The random number generator to shuffle with.
+                Default is the game's own generator.
         """
-        self.deck.shuffle()
+        if rng is None and self.deck.rng is None:
+            self.deck.rng = SeededRandom()
+        self.deck.shuffle(rng)
 
     def deal(self) -> None:
         """
         Deal cards to all players.
         """
-        hands = self.deck.deal(len(self.players))
-        for player, hand in zip(self.players, hands):
-            player.receive_cards(hand)
+        players = self.players
+        cards = self.deck.cards
+        # Dealt straight from the deck, without building the hands as lists
+        for seat, player in enumerate(players):
+            player.receive_cards(itertools.islice(cards, seat, None, len(players)))
+        for listener in self.listeners:
+            listener.game_started(self)
 
     def play_round(self) -> Optional[Player]:
         """
         Play a single round of the game.
 
+        Every player with cards puts down their top card, and the highest card
+        takes the table. If several players tie for the highest card, a war
+        between them follows (see ``resolve_war``). Players without cards are out.
+
         Returns:
             Optional[Player]: The winner of the game if the game ends, otherwise None.
         """
-        if not all(player.has_cards() for player in self.players):
-            return self.get_winner()
+        players = self.players
+        active = 0
+        for player in players:
+            if player.hand:
+                active += 1
+        if active < 2:
+            return self._end_step()
 
-        self.table.clear()
-        for player in self.players:
-            if player.has_cards():
-                card = player.play_card()
-                self.table.place_card(player, card)
-
-        winner = self.table.get_round_winner()
-        if winner:
-            winning_player = next(player for player in self.players if player.name == winner)
-            winning_player.receive_cards(self.table.collect_cards())
+        self.rounds_played += 1
+        table = self.table
+        table.clear()
+        place = table.place
+        for seat, player in enumerate(players):
+            if player.hand:
+                place(seat, player.play_card())
+
+        winner = table.get_round_winner_seat()
+        if winner is not None:
+            winning_player = players[winner]
+            winning_player.receive_cards(table.collect_cards())
             self.war_in_progress = False
         else:
+            winning_player = None
             self.war_in_progress = True
 
-        return self.get_winner()
-    
+        if self.listeners:
+            self._notify_round(winning_player)
+        return self._end_step()
+
+    def _notify_round(self, winner: Optional[Player]) -> None:
+        if winner is not None:
+            cards = self.table.last_cards
+            winner_seat = self._seats[winner.name]
+        else:
+            cards = self.table.cards
+            winner_seat = None
+        placed = [(seat, card) for seat, card in enumerate(cards) if card is not None]
+        for listener in self.listeners:
+            listener.round_played(self, placed, winner_seat, len(placed) if winner is not None else 0)
+
+    def tied_players(self) -> List[Player]:
+        """
+        Get the players who tied for the highest card in the last round, and go to war.
+
+        Returns:
+            List[Player]: The tied players in seat order, or every player if no cards are on the table.
+        """
+        seats = self.table.tied_seats()
+        players = self.players
+        if not seats or len(seats) == len(players):
+            return players
+        return [players[seat] for seat in seats]
+
     def is_war_in_progress(self) -> bool:
         return self.war_in_progress
 
-    def resolve_war(self) -> None:
+    def resolve_war(self) -> Optional[Player]:
         """
         Resolve a war situation.
+
+        Only the players who tied for the highest card go to war (see
+        ``tied_players``). Every card on the table, the face-down cards and the
+        face-up cards all go into a single pot, in the order they were played, and the winner of the war
+        receives the whole pot (see ``War.fight``). The number of face-up rounds
+        needed to settle the war is stored in ``war_depth``.
+
+        Returns:
+            Optional[Player]: The winner of the game if the game ends, otherwise None.
         """
-        war_players = [p for p in self.players if p.has_cards()]
-        war_cards = []
-        
-        while True:
-            cards_to_play = self.rules.get_war_cards_to_play()
-            
-            # Check if all players have enough cards for the war
-            if not all(player.get_hand_size() >= cards_to_play + 1 for player in war_players):
-                # If a player doesn't have enough cards, they lose the war
-                winner = max(war_players, key=lambda p: p.get_hand_size())
-                winner.receive_cards(self.table.collect_cards() + war_cards)
-                self.war_in_progress = False
-                return
-
-            # Each player puts down face-down cards
-            for player in war_players:
-                for _ in range(cards_to_play):
-                    war_cards.append(player.play_card())
-
-            # Each player puts down a face-up card
-            self.table.clear()
-            for player in war_players:
-                card = player.play_card()
-                self.table.place_card(player, card)
-                war_cards.append(card)
-
-            # Check for a winner
-            winner_name = self.table.get_round_winner()
-            if winner_name:
-                winner = next(player for player in self.players if player.name == winner_name)
-                winner.receive_cards(self.table.collect_cards() + war_cards)
-                self.war_in_progress = False
-                return
-            
-            # If there's no winner, continue the war with the remaining players
-            war_players = [p for p in war_players if p.has_cards()]
-            if len(war_players) == 1:
-                war_players[0].receive_cards(self.table.collect_cards() + war_cards)
-                self.war_in_progress = False
-                return
-
-        # This line should never be reached, but just in case:
-        self.war_in_progress = False
+        tied = self.tied_players()
+        stake = self.table.collect_cards()
+        winner = self.war.fight(tied, stake, self.table)
         self.table.clear()
+        self.war_depth = self.war.depth
+        self.war_in_progress = False
+
+        if self.listeners:
+            war = self.war
+            seats = self._seats
+            placed = [(seats[war.owners[i].name], war.pot[i]) for i in range(len(stake), war.pot_size)]
+            winner_seat = seats[winner.name] if winner is not None else None
+            for listener in self.listeners:
+                listener.war_fought(self, placed, winner_seat, war.pot_size)
+        return self._end_step()
+
+    def snapshot(self) -> bytes:
+        """
+        Encode the state of the game compactly, one byte per card.
+
+        The snapshot holds every hand (or the deck order, before the deal), the
+        cards on the table, the war flag, the outcome and the round and war
+        counters. It does not hold the player names, the rules or the cycle
+        detection state; restore it into a game with the same players and rules.
+
+        Returns:
+            bytes: The encoded state, e.g. 72 bytes for a two-player single-deck game.
+        """
+        before_deal = self.rounds_played == 0 and not any(player.hand for player in self.players)
+        flags = (self._SNAPSHOT_WAR if self.war_in_progress else 0) | (self._SNAPSHOT_DECK if before_deal else 0)
+        outcome = 0 if self.outcome is None else self.OUTCOMES.index(self.outcome) + 1
+        parts = [self._SNAPSHOT_HEADER.pack(
+            self.SNAPSHOT_VERSION, len(self.players), flags, outcome, self.rounds_played, self.war_depth)]
+
+        piles = [self.deck.cards] if before_deal else [player.hand for player in self.players]
+        for pile in piles:
+            parts.append(struct.pack('<H', len(pile)))
+            parts.append(bytes([card.id for card in pile]))
+        for cards in (self.table.cards, self.table.last_cards):
+            parts.append(bytes([self._NO_CARD if card is None else card.id for card in cards]))
+        return b"".join(parts)
+
+    def restore(self, data: bytes) -> None:
+        """
+        Restore the state of the game from a snapshot.
+
+        If cycle detection is enabled, it starts over from the restored state.
+
+        Args:
+            data (bytes): A snapshot from ``snapshot``, of a game with the same number of players.
+
+        Raises:
+            ValueError: If the snapshot is malformed, of another version, or of a
+                game with a different number of players.
+        """
+        try:
+            version, num_players, flags, outcome, rounds_played, war_depth = \
+                self._SNAPSHOT_HEADER.unpack_from(data)
+            if version != self.SNAPSHOT_VERSION:
+                raise ValueError(f"Unsupported snapshot version: {version}")
+            if num_players != len(self.players):
+                raise ValueError(f"Snapshot is of a game with {num_players} players, not {len(self.players)}")
+
+            offset = self._SNAPSHOT_HEADER.size
+            piles = []
+            for _ in range(1 if flags & self._SNAPSHOT_DECK else num_players):
+                length, = struct.unpack_from('<H', data, offset)
+                offset += 2
+                piles.append([Card.DECK[card_id] for card_id in data[offset:offset + length]])
+                if len(piles[-1]) != length:
+                    raise ValueError("Snapshot is truncated")
+                offset += length
+            tables = []
+            for _ in range(2):
+                slots = data[offset:offset + num_players]
+                if len(slots) != num_players:
+                    raise ValueError("Snapshot is truncated")
+                tables.append(self._table_cards(slots))
+                offset += num_players
+        except (struct.error, IndexError) as error:
+            raise ValueError(f"Malformed snapshot: {error}") from None
+
+        if flags & self._SNAPSHOT_DECK:
+            self.deck.cards = piles[0]
+            piles = [[] for _ in self.players]
+        for player, pile in zip(self.players, piles):
+            player.hand.clear()
+            player.hand.extend(pile)
+        self.table.load(*tables)
+        self.war_in_progress = bool(flags & self._SNAPSHOT_WAR)
+        self.outcome = None if outcome == 0 else self.OUTCOMES[outcome - 1]
+        self.rounds_played = rounds_played
+        self.war_depth = war_depth
+        if self.cycle_detector is not None:
+            self.enable_cycle_detection()
+        for listener in self.listeners:
+            listener.game_started(self)
+
+    def _table_cards(self, slots: bytes) -> List[Optional[Card]]:
+        return [None if card_id == self._NO_CARD else Card.DECK[card_id] for card_id in slots]
+
+    def clone(self) -> 'Game':
+        """
+        Get an independent copy of the game, e.g. to explore a different line of play.
+
+        Cards are shared instances, so only the hands, the table and the
+        counters are copied; the copy shares the rules with this game and has no
+        listeners, and gets its own generator when it shuffles.
+
+        Returns:
+            Game: The copy.
+        """
+        game = Game.__new__(Game)
+        game.__dict__.update(self.__dict__)
+        game.deck = Deck.__new__(Deck)
+        game.deck.cards = list(self.deck.cards)
+        game.deck.rng = None
+        game.players = [player.copy() for player in self.players]
+        game._seats = dict(self._seats)
+        game.table = self.table.copy()
+        game.war = War(self.rules, len(self.war.pot))
+        game.war_cards = []
+        game.speed_war_cards = []
+        game.listeners = []
+        if self.cycle_detector is not None:
+            game.cycle_detector = self.cycle_detector.copy()
+        return game
 
     def get_winner(self) -> Optional[Player]:
         """
@@ -149,7 +507,7 @@ class Game:
         Returns:
             bool: True if the game is over, False otherwise.
         """
-        return any(len(player.hand) == len(self.deck.cards) for player in self.players)
+        return self.outcome is not None or any(len(player.hand) == len(self.deck.cards) for player in self.players)
 
     def __str__(self) -> str:
         """
@@ -164,4 +522,90 @@ class Game:
                 f"Rules: {self.rules}")
     
 
-    
\ No newline at end of file
+    
+
+class GamePool:
+    """
+    Finished games kept for reuse, so that starting a game allocates nothing.
+
+    ``acquire`` hands out a released game with the same player names and deck
+    size, reset with ``Game.reset``, or a new game if there is none;
+    ``release`` takes a game back once nothing refers to it any more:
+
+        pool = GamePool()
+        for seed in range(1000):
+            game = pool.acquire("Player 1", "Player 2", rules=rules, seed=seed)
+            game.deal()
+            ...
+            pool.release(game)
+
+    Attributes:
+        max_size (int): The number of released games kept; others are dropped.
+    """
+
+    def __init__(self, max_size: int = 64):
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_size (int): The number of released games kept.
+        """
+        self.max_size = max_size
+        # Released games by player names and deck size
+        self._free: Dict[Tuple[Tuple[str, ...], int], List[Game]] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def acquire(self, *names: str, rules: Optional[Rules] = None, max_rounds: Optional[int] = None,
+                detect_cycles: bool = False, seed: Optional[int] = None,
+                snapshot: Optional[bytes] = None) -> Game:
+        """
+        Get a shuffled game that is ready to deal, as ``Game(*names, ...)`` followed by ``reset(seed)``.
+
+        Args:
+            *names (str): The names of the players, in seat order.
+            rules (Optional[Rules]): The rule set for the game. Default is the standard rules.
+            max_rounds (Optional[int]): The number of rounds after which the game is abandoned.
+            detect_cycles (bool): Whether to end games that would repeat forever.
+            seed (Optional[int]): The seed for the shuffle. Default is None (unseeded).
+            snapshot (Optional[bytes]): A ``Game.snapshot`` to restore the game
+                from, instead of resetting it.
+
+        Returns:
+            Game: The game.
+        """
+        if rules is None:
+            rules = Rules()
+        free = self._free.get((names, len(Card.DECK) * (2 if rules.use_double_deck else 1)))
+        if not free:
+            game = Game(*names, rules=rules, max_rounds=max_rounds, detect_cycles=detect_cycles)
+        else:
+            game = free.pop()
+            self._size -= 1
+            game.rules = game.war.rules = rules
+            game.max_rounds = max_rounds
+            if not detect_cycles:
+                game.cycle_detector = None
+            elif game.cycle_detector is None:
+                game.enable_cycle_detection()
+        if snapshot is not None:
+            game.restore(snapshot)
+        else:
+            game.reset(seed)
+        return game
+
+    def release(self, game: Game) -> None:
+        """
+        Return a game to the pool. Its listeners are removed.
+
+        Args:
+            game (Game): A game that is no longer used.
+        """
+        game.listeners.clear()
+        if self._size >= self.max_size:
+            return
+        key = (tuple(player.name for player in game.players), len(game.deck.cards))
+        self._free.setdefault(key, []).append(game)
+        self._size += 1
@@ -1,12 +1,84 @@
 
 import os
+import queue
+import time
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import messagebox
 from PIL import Image, ImageTk
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
 from .game import Game
+from .player import Player
 from .rules import Rules
 from .card import Card
+from .image_cache import get_image_cache
+from .timeline import Timeline
+
+if TYPE_CHECKING:
+    from .replay import Replay
+
+WINDOW_SIZE = (800, 600)
+CARD_SIZE = (150, 218)
+BACK_DECK_SIZE = (350, 350)
+IMAGE_LOADER_THREADS = 4
+IMAGE_POLL_MS = 15
+RESIZE_DELAY_MS = 100
+SCALE_STEP = 0.05
+REPLAY_DELAY_MS = 200
+# The window has a frame for each of two players
+GUI_PLAYERS = 2
+# Autoplay: engine steps run in ticks of at most AUTOPLAY_BUDGET_MS, every
+# AUTOPLAY_TICK_MS, and the display is redrawn at most AUTOPLAY_FPS times a second
+AUTOPLAY_TICK_MS = 10
+AUTOPLAY_BUDGET_MS = 8
+AUTOPLAY_FPS = 30
+AUTOPLAY_SPEEDS = (1, 5, 20, 100, 1000, 10000)  # rounds per second
+DEFAULT_AUTOPLAY_SPEED = 5
+# Set to print the render time of every frame
+RENDER_STATS_ENV = "WARZONE_RENDER_STATS"
+
+
+def check_players(count: int) -> None:
+    """
+    Check that the GUI can show a game with a number of players.
+
+    Raises:
+        ValueError: If the number of players is not ``GUI_PLAYERS``.
+    """
+    if count != GUI_PLAYERS:
+        raise ValueError(f"The GUI shows games of {GUI_PLAYERS} players, not {count}")
+
+
+class RenderStats:
+    """
+    Timing of the frames drawn by ``GUI.render``.
+
+    Attributes:
+        frames (int): The number of frames drawn.
+        total (float): Their total render time in seconds.
+        max (float): The longest render time in seconds.
+        last (float): The render time of the last frame in seconds.
+        widgets (int): The number of widget updates, over all frames.
+    """
+
+    def __init__(self):
+        self.frames = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+        self.widgets = 0
+
+    def add(self, seconds: float) -> None:
+        self.frames += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.last = seconds
+
+    def __str__(self) -> str:
+        mean = self.total / self.frames if self.frames else 0.0
+        return (f"{self.frames} frames, {mean * 1e3:.3f} ms mean, {self.max * 1e3:.3f} ms max, "
+                f"{self.widgets / max(self.frames, 1):.1f} widget updates per frame")
+
 
 class GUI:
     """
@@ -18,7 +90,12 @@ class GUI:
     Attributes:
         game (Game): The main game logic instance.
         root (tk.Tk): The main window of the application.
-        card_images (Dict[str, ImageTk.PhotoImage]): Dictionary of card images.
+        image_cache (ImageCache): The card image cache shared with ``Card.get_image``.
+        timeline (Timeline): The history of the current game, for the round slider.
+        card_size (Tuple[int, int]): The size cards are shown at, which follows the window size.
+        first_frame_time (Optional[float]): Seconds from GUI creation to the first frame.
+        images_ready_time (Optional[float]): Seconds from GUI creation until every card image was loaded.
+        render_stats (RenderStats): The render time of the frames drawn so far.
     """
 
     def __init__(self, game: Game):
@@ -27,14 +104,46 @@ class GUI:
 
         Args:
             game (Game): The main game logic instance.
+
+        Raises:
+            ValueError: If the game does not have two players.
         """
+        check_players(len(game.players))
+        self.created_at = time.perf_counter()
         window = tk.Toplevel # needed to fix tkinter image rendering bug https://stackoverflow.com/questions/23224574/tkinter-create-image-function-error-pyimage1-does-not-exist
         self.game = game
         self.root = tk.Tk()
         self.root.title("Warzone: The Battle of Cards")
-        self.root.geometry("800x600")
-
-        self.card_images = self.load_card_images()
+        self.root.geometry(f"{WINDOW_SIZE[0]}x{WINDOW_SIZE[1]}")
+
+        self.first_frame_time: Optional[float] = None
+        self.images_ready_time: Optional[float] = None
+        self._probe_startup = False
+
+        # Only the back is rendered up front; faces are rendered in the background
+        self.image_cache = get_image_cache()
+        self.card_size = CARD_SIZE
+        self.back_deck_size = BACK_DECK_SIZE
+        self._image_futures: List[Future] = []
+        self._resize_pending = False
+        self._window_size = WINDOW_SIZE
+        self._replay_steps: Optional[Iterator[Game]] = None
+        self.timeline = Timeline()
+        # The past state shown while the round slider is not at the end
+        self._view: Optional[Game] = None
+        # Autoplay mode ('play', 'war' or 'end'), pending tick, and pacing state
+        self._autoplay: Optional[str] = None
+        self._autoplay_after: Optional[str] = None
+        self._autoplay_credit = 0.0
+        self._autoplay_last_tick = 0.0
+        self._autoplay_last_draw = 0.0
+        # What each widget shows, as of the last frame; see render
+        self._drawn: Dict[tk.Widget, object] = {}
+        self._render_pending: Optional[str] = None
+        self._status = ""
+        self.render_stats = RenderStats()
+        self._print_render_stats = bool(os.environ.get(RENDER_STATS_ENV))
+        self.back_image()
 
         self.war_var = tk.StringVar(value="1")
         self.war_var.trace_add("write", self.update_rules)
@@ -42,45 +151,155 @@ class GUI:
         self.create_widgets()
         self.shuffle() 
 
-    def load_card_images(self) -> Dict[str, ImageTk.PhotoImage]:
+        self.load_card_images_async()
+        self.root.bind("<Map>", self.on_first_frame, add="+")
+        self.root.bind("<Destroy>", self.on_destroy, add="+")
+        self.root.bind("<Configure>", self.on_resize, add="+")
+
+    def back_image(self) -> Optional[ImageTk.PhotoImage]:
         """
-        Load card images from files.
+        Get the back of the card, which is also shown until a card face is loaded.
 
         Returns:
-            Dict[str, ImageTk.PhotoImage]: A dictionary of card images.
+            Optional[ImageTk.PhotoImage]: The back of the card, or None if its image is missing.
         """
-        images = {}
-        card_size = (150, 218)  # Adjust this size as needed
-        
-        # Load the back of the card
-        back_path = os.path.join("static", "images", "DECK", "gray_back.png")
-        if os.path.exists(back_path):
-            back_image = Image.open(back_path).resize(card_size, Image.LANCZOS)
-            images['back'] = ImageTk.PhotoImage(back_image)
-        else:
-            print(f"Warning: Back card image not found at {back_path}")
+        try:
+            return self.image_cache.get_photo('back', self.card_size)
+        except FileNotFoundError as error:
+            print(f"Warning: {error}")
+            return None
 
-        back_deck_path = os.path.join("static", "images", "DECK", "back_cards-07.png")
-        if os.path.exists(back_deck_path):
-            back_deck_image = Image.open(back_deck_path).resize((350,350), Image.LANCZOS)
-            images['back_deck'] = ImageTk.PhotoImage(back_deck_image)
-        else:
-            print(f"Warning: Back deck image not found at {back_deck_path}")
-
-        # Load all other card images
-        ranks = ['A'] + [str(i) for i in range(2, 11)] + ['J', 'Q', 'K']
-        suits = ['H', 'D', 'C', 'S']
-
-        for rank in ranks:
-            for suit in suits:
-                filename = f"{rank}{suit}.png"
-                filepath = os.path.join("static", "images", "DECK", filename)
-                if os.path.exists(filepath):
-                    card_image = Image.open(filepath).resize(card_size, Image.LANCZOS)
-                    images[f"{rank}{suit}"] = ImageTk.PhotoImage(card_image)
-                else:
-                    print(f"Warning: Image file not found for {filename}")
+    def image_sources(self) -> Iterator[Tuple[Union[Card, str], Tuple[int, int]]]:
+        """
+        List the images loaded in the background.
+
+        Yields:
+            Tuple[Union[Card, str], Tuple[int, int]]: The card or image name, and its size.
+        """
+        yield 'back_deck', self.back_deck_size
+        for card in Card.DECK:
+            yield card, self.card_size
+
+    def load_card_images_async(self) -> None:
+        """
+        Start rendering the card images at the current size on a thread pool.
+
+        Rendered images go into the shared image cache. The Tk thread is notified
+        in ``drain_loaded_images`` and refreshes the display, which converts the
+        images to ``PhotoImage``s as they are shown.
+        """
+        for future in self._image_futures:
+            future.cancel()
+        self._loaded_images: queue.Queue = queue.Queue()
+        executor = ThreadPoolExecutor(max_workers=IMAGE_LOADER_THREADS, thread_name_prefix="card-images")
+        self._image_futures = []
+        for source, size in self.image_sources():
+            future = executor.submit(self.image_cache.get_image, source, size)
+            future.add_done_callback(lambda f, source=source: self._loaded_images.put((source, f)))
+            self._image_futures.append(future)
+        self._images_pending = len(self._image_futures)
+        executor.shutdown(wait=False)
+        self.root.after(IMAGE_POLL_MS, self.drain_loaded_images, self._loaded_images)
+
+    def drain_loaded_images(self, loaded_images: queue.Queue) -> None:
+        """
+        Refresh the display with the images rendered so far, on the Tk thread.
 
+        Args:
+            loaded_images (queue.Queue): The queue of the loading run being drained.
+        """
+        if loaded_images is not self._loaded_images:
+            return  # Superseded by a newer loading run
+        loaded = False
+        while True:
+            try:
+                source, future = loaded_images.get_nowait()
+            except queue.Empty:
+                break
+            self._images_pending -= 1
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is not None:
+                print(f"Warning: Failed to load image {source}: {error}")
+                continue
+            loaded = True
+
+        if loaded:
+            self.update_display()
+        if self._images_pending > 0:
+            self.root.after(IMAGE_POLL_MS, self.drain_loaded_images, loaded_images)
+        elif self.images_ready_time is None:
+            self.images_ready_time = time.perf_counter() - self.created_at
+            if self._probe_startup:
+                print(f"images_ready {time.time():.6f}", flush=True)
+                self.root.after(0, self.root.destroy)
+
+    def on_first_frame(self, event: tk.Event) -> None:
+        """Record the time it took for the window to first appear."""
+        if event.widget is not self.root or self.first_frame_time is not None:
+            return
+        self.first_frame_time = time.perf_counter() - self.created_at
+        if self._probe_startup:
+            print(f"first_frame {time.time():.6f}", flush=True)
+
+    def on_destroy(self, event: tk.Event) -> None:
+        """Stop loading images when the window is closed."""
+        if event.widget is self.root:
+            for future in self._image_futures:
+                future.cancel()
+
+    def on_resize(self, event: tk.Event) -> None:
+        """Schedule re-rendering the cards when the window size changes."""
+        if event.widget is not self.root:
+            return
+        self._window_size = (event.width, event.height)
+        if not self._resize_pending:
+            self._resize_pending = True
+            self.root.after(RESIZE_DELAY_MS, self.apply_window_size)
+
+    def apply_window_size(self) -> None:
+        """
+        Scale the cards to the window size.
+
+        The new size is rendered from the image files held in the image cache, so
+        the disk is not read again.
+        """
+        self._resize_pending = False
+        # Quantize the scale so that small drags reuse the same cached sizes
+        width, height = self._window_size
+        scale = min(width / WINDOW_SIZE[0], height / WINDOW_SIZE[1])
+        scale = max(round(scale / SCALE_STEP) * SCALE_STEP, SCALE_STEP)
+        card_size = (round(CARD_SIZE[0] * scale), round(CARD_SIZE[1] * scale))
+        if card_size == self.card_size:
+            return
+        self.card_size = card_size
+        self.back_deck_size = (round(BACK_DECK_SIZE[0] * scale), round(BACK_DECK_SIZE[1] * scale))
+        self.update_display()
+        self.load_card_images_async()
+
+    def probe_startup(self) -> None:
+        """
+        Print wall-clock timestamps of the first frame and of the last card image
+        being loaded, then close the window. Used to measure startup time.
+        """
+        self._probe_startup = True
+
+    def load_card_images(self) -> Dict[str, ImageTk.PhotoImage]:
+        """
+        Load all card images at the current size, synchronously.
+
+        Returns:
+            Dict[str, ImageTk.PhotoImage]: A dictionary of card images, keyed by
+                'back', 'back_deck' and rank plus suit letter (e.g. 'AS').
+        """
+        images = {}
+        for source, size in [('back', self.card_size), *self.image_sources()]:
+            key = f"{source.rank}{source.suit[0].upper()}" if isinstance(source, Card) else source
+            try:
+                images[key] = self.image_cache.get_photo(source, size)
+            except FileNotFoundError as error:
+                print(f"Warning: {error}")
         return images
 
     def create_widgets(self):
@@ -111,6 +330,11 @@ class GUI:
         self.winner_label = tk.Label(self.middle_frame, text="", font=("Arial", 16, "bold"))
         self.winner_label.pack(expand=True)
 
+        # Round slider, for going back to any round of the game
+        self.timeline_scale = tk.Scale(self.root, from_=0, to=0, orient=tk.HORIZONTAL, label="Round",
+                                       command=self.on_seek)
+        self.timeline_scale.pack(fill=tk.X, padx=10)
+
         # Bottom row (smaller)
         bottom_frame = tk.Frame(self.root)
         bottom_frame.pack(fill=tk.X)
@@ -131,6 +355,22 @@ class GUI:
 
         self.play_button = tk.Button(buttons_frame, text="Play", command=self.play, state=tk.DISABLED)
         self.play_button.pack(side=tk.LEFT, padx=5)
+
+        # Autoplay controls
+        autoplay_frame = tk.Frame(bottom_frame)
+        autoplay_frame.pack(side=tk.LEFT, expand=True)
+        self.autoplay_button = tk.Button(autoplay_frame, text="Autoplay", command=self.toggle_autoplay,
+                                         state=tk.DISABLED)
+        self.autoplay_button.pack(side=tk.LEFT, padx=5)
+        self.next_war_button = tk.Button(autoplay_frame, text="Next War", command=lambda: self.start_autoplay('war'),
+                                         state=tk.DISABLED)
+        self.next_war_button.pack(side=tk.LEFT, padx=5)
+        self.run_to_end_button = tk.Button(autoplay_frame, text="Run to End",
+                                           command=lambda: self.start_autoplay('end'), state=tk.DISABLED)
+        self.run_to_end_button.pack(side=tk.LEFT, padx=5)
+        tk.Label(autoplay_frame, text="Rounds/s:").pack(side=tk.LEFT)
+        self.speed_var = tk.IntVar(value=DEFAULT_AUTOPLAY_SPEED)
+        tk.OptionMenu(autoplay_frame, self.speed_var, *AUTOPLAY_SPEEDS).pack(side=tk.LEFT)
         # War resolution options (right side of bottom row)
         war_frame = tk.Frame(bottom_frame)
         war_frame.pack(side=tk.RIGHT, expand=True)
@@ -150,24 +390,32 @@ class GUI:
         if self.game.is_war_in_progress():
             self.update_war_status()
         else:
-            self.winner_label.config(text=f"War resolution method changed to: {self.war_var.get()}")
+            self.set_status(f"War resolution method changed to: {self.war_var.get()}")
 
     def update_war_status(self):
         """Update the status message during a war."""
         if self.game.rules.war_resolution_method == 'speed':
-            self.winner_label.config(text="Speed War! Click 'Resolve War' to continue.")
+            self.set_status("Speed War! Click 'Resolve War' to continue.")
         else:
-            self.winner_label.config(text=f"War! {self.game.rules.war_resolution_method} down. Click 'Resolve War' to continue.")
+            self.set_status(f"War! {self.game.rules.war_resolution_method} down. Click 'Resolve War' to continue.")
 
 
     def shuffle(self):
         """Handle the Shuffle button click."""
-        self.game = Game(self.game.players[0].name, self.game.players[1].name, self.game.rules)
-        self.game.shuffle()
+        self.stop_autoplay()
+        self._replay_steps = None
+        self._view = None
+        # The deck, hands and table of the last game are reused
+        self.game.reset()
+        if self.timeline not in self.game.listeners:
+            self.game.add_listener(self.timeline)
+        self.timeline_scale.config(state=tk.NORMAL)
+        self.update_timeline()
         self.deal_button.config(state=tk.NORMAL)
         self.play_button.config(state=tk.DISABLED)
+        self.set_autoplay_state(tk.DISABLED)
         self.update_display()
-        self.winner_label.config(text="")
+        self.set_status("")
         self.root.title("Warzone: The Battle of Cards - The deck has been shuffled.")
 
     def deal(self):
@@ -175,17 +423,38 @@ class GUI:
         self.game.deal()
         self.play_button.config(state=tk.NORMAL)
         self.deal_button.config(state=tk.DISABLED)
+        self.set_autoplay_state(tk.NORMAL)
         self.update_display()
         self.root.title("Warzone: The Battle of Cards - Cards have been dealt to the players.")
 
     def play(self):
-        if self.game.is_war_in_progress():
-            winner = self.game.resolve_war()
-        else:
-            winner = self.game.play_round()
+        self.stop_autoplay()
+        self._view = None
+        winner = self.step()
         self.update_display()
+        self.update_timeline()
+        self.show_result(winner)
+
+    def step(self) -> Optional[Player]:
+        """
+        Play the next round, or resolve the war in progress.
+
+        Returns:
+            Optional[Player]: The winner of the game if the game ends, otherwise None.
+        """
+        if self.game.is_war_in_progress():
+            return self.game.resolve_war()
+        return self.game.play_round()
+
+    def show_result(self, winner: Optional[Player]) -> None:
+        """
+        Show the result of the last step, and start a new game if it was won.
+
+        Args:
+            winner (Optional[Player]): The winner of the game, if it has ended.
+        """
         if winner:
-            self.winner_label.config(text=f"{winner.name} wins the game!")
+            self.set_status(f"{winner.name} wins the game!")
             messagebox.showinfo("Game Over", f"{winner.name} wins the game!")
             self.shuffle()  # Reset the game
         elif self.game.is_war_in_progress():
@@ -194,67 +463,283 @@ class GUI:
         else:
             round_winner = self.game.table.get_round_winner()
             if round_winner:
-                self.winner_label.config(text=f"{round_winner} wins the round!")
+                self.set_status(f"{round_winner} wins the round!")
             else:
-                self.winner_label.config(text="It's a tie!") 
+                self.set_status("It's a tie!") 
             self.play_button.config(text="Play")   
 
+    def set_autoplay_state(self, state: str) -> None:
+        """Enable or disable the autoplay controls."""
+        for button in (self.autoplay_button, self.next_war_button, self.run_to_end_button):
+            button.config(state=state)
+
+    def toggle_autoplay(self) -> None:
+        """Handle the Autoplay/Pause button click."""
+        if self._autoplay is None:
+            self.start_autoplay('play')
+        else:
+            self.stop_autoplay()
+
+    def start_autoplay(self, mode: str) -> None:
+        """
+        Start playing automatically.
+
+        Args:
+            mode (str): 'play' to play at the chosen speed until paused or the game
+                ends, 'war' to play until the next war starts, or 'end' to play
+                to the end of the game as fast as possible.
+        """
+        self.stop_autoplay()
+        self._view = None
+        if self.game.cycle_detector is None:
+            # Otherwise a game that repeats forever would never end
+            self.game.enable_cycle_detection()
+        self._autoplay = mode
+        self._autoplay_credit = 0.0
+        self._autoplay_last_tick = self._autoplay_last_draw = time.perf_counter()
+        self.autoplay_button.config(text="Pause")
+        self.play_button.config(state=tk.DISABLED)
+        self._autoplay_after = self.root.after(0, self.autoplay_tick)
+
+    def stop_autoplay(self) -> None:
+        """Pause automatic play."""
+        if self._autoplay_after is not None:
+            self.root.after_cancel(self._autoplay_after)
+            self._autoplay_after = None
+        if self._autoplay is None:
+            return
+        self._autoplay = None
+        self.autoplay_button.config(text="Autoplay")
+        self.play_button.config(state=tk.NORMAL, text="Resolve War" if self.game.war_in_progress else "Play")
+
+    def autoplay_tick(self) -> None:
+        """
+        Advance the game by the rounds due since the last tick, and redraw if a frame is due.
+
+        The engine runs for at most ``AUTOPLAY_BUDGET_MS`` per tick, so the window
+        stays responsive at any speed; steps that do not fit are played in the
+        next ticks.
+        """
+        self._autoplay_after = None
+        mode = self._autoplay
+        if mode is None:
+            return
+        now = time.perf_counter()
+        if mode == 'play':
+            # Bank the rounds due at the chosen speed, without catching up on more than a second
+            speed = self.speed_var.get()
+            self._autoplay_credit = min(self._autoplay_credit + (now - self._autoplay_last_tick) * speed, speed)
+        self._autoplay_last_tick = now
+
+        game = self.game
+        deadline = now + AUTOPLAY_BUDGET_MS / 1000
+        winner = None
+        stop = False
+        clock = time.perf_counter
+        while mode != 'play' or self._autoplay_credit >= 1:
+            if game.war_in_progress:
+                winner = game.resolve_war()
+            else:
+                winner = game.play_round()
+                if mode == 'play':
+                    self._autoplay_credit -= 1
+            if game.outcome is not None or (mode == 'war' and game.war_in_progress):
+                stop = True
+                break
+            if clock() >= deadline:
+                break
+
+        if stop or clock() - self._autoplay_last_draw >= 1 / AUTOPLAY_FPS:
+            self._autoplay_last_draw = clock()
+            self.update_display()
+            self.update_timeline()
+            self.set_status(f"Round {game.rounds_played}")
+        if not stop:
+            self._autoplay_after = self.root.after(AUTOPLAY_TICK_MS, self.autoplay_tick)
+            return
+
+        self.stop_autoplay()
+        if game.outcome == 'infinite':
+            self.set_status(f"The game repeats forever after {game.rounds_played} rounds")
+            self.play_button.config(state=tk.DISABLED)
+            self.set_autoplay_state(tk.DISABLED)
+        else:
+            self.show_result(winner)
+
+    def play_replay(self, replay: 'Replay', delay_ms: int = REPLAY_DELAY_MS) -> None:
+        """
+        Play a recorded game back, one round or war at a time.
+
+        The game is reconstructed from the replay log rather than played again.
+        Shuffling stops the playback.
+
+        Args:
+            replay (Replay): The recorded game.
+            delay_ms (int): The time between steps, in milliseconds.
+
+        Raises:
+            ValueError: If the recorded game does not have two players.
+        """
+        check_players(len(replay.names))
+        self.stop_autoplay()
+        self.game = replay.new_game()
+        self._view = None
+        self.set_autoplay_state(tk.DISABLED)
+        self.timeline_scale.config(state=tk.DISABLED)
+        self.war_var.set(replay.rules.war_resolution_method)
+        self.deal_button.config(state=tk.DISABLED)
+        self.play_button.config(state=tk.DISABLED)
+        self.update_display()
+        self.root.title("Warzone: The Battle of Cards - Replay")
+        steps = self._replay_steps = replay.steps(self.game)
+
+        def step():
+            if self._replay_steps is not steps:
+                return
+            if next(steps, None) is None:
+                self.set_status(f"Replay finished: {replay.outcome or 'unfinished'}")
+                return
+            self.update_display()
+            if self.game.war_in_progress:
+                self.update_war_status()
+            else:
+                self.set_status(f"Round {self.game.rounds_played}")
+            self.root.after(delay_ms, step)
+
+        self.root.after(delay_ms, step)
+
+    @property
+    def shown_game(self) -> Game:
+        """The game state on screen: the live game, or a past state chosen with the round slider."""
+        return self._view if self._view is not None else self.game
+
+    def update_timeline(self) -> None:
+        """Extend the round slider to the latest round and move it there."""
+        self.timeline_scale.config(to=self.timeline.rounds)
+        self.timeline_scale.set(self.timeline.rounds)
+
+    def on_seek(self, value: str) -> None:
+        """
+        Show the game as it was after the round chosen with the slider.
+
+        The state is restored from the nearest keyframe of the timeline, so
+        seeking takes the same time anywhere in a long game. Moving the slider
+        to the end shows the live game again.
+
+        Args:
+            value (str): The position of the slider.
+        """
+        rounds = int(float(value))
+        if rounds >= self.timeline.rounds:
+            if self._view is None:
+                return
+            self._view = None
+        else:
+            self._view = self.timeline.seek(self._view or self.game.clone(), rounds)
+            self.set_status(f"Round {rounds} of {self.timeline.rounds}")
+        self.update_display()
+
+    def set_status(self, text: str) -> None:
+        """
+        Show a status message in the middle of the window, with the next frame.
+
+        Args:
+            text (str): The message.
+        """
+        self._status = text
+        self.update_display()
+
     def update_display(self):
-        """Update the GUI to reflect the current game state."""
+        """
+        Update the GUI to reflect the current game state.
+
+        The frame is drawn once Tk is idle, so any number of updates requested
+        in one event (e.g. the display and the status message) draw one frame.
+        """
+        if self._render_pending is None:
+            self._render_pending = self.root.after_idle(self.render)
+
+    def render(self) -> None:
+        """
+        Draw a frame, touching only the widgets whose content changed since the last one.
+
+        The render time of the frame is added to ``render_stats``.
+        """
+        self._render_pending = None
+        start = time.perf_counter()
         self.update_player_labels()
         self.update_card_display()
         self.update_deck_display()
-        
+        self._draw(self.winner_label, self._status, text=self._status)
+        self.render_stats.add(time.perf_counter() - start)
+        if self._print_render_stats:
+            print(f"render {self.render_stats.last * 1e3:.3f} ms ({self.render_stats})", flush=True)
+
+    def _draw(self, widget: tk.Widget, content: object, **options) -> None:
+        """
+        Configure a widget, unless it already shows the given content.
+
+        Args:
+            widget (tk.Widget): The widget.
+            content (object): A comparable description of what the widget shows.
+            **options: The options that make the widget show it.
+        """
+        if self._drawn.get(widget) == content:
+            return
+        widget.config(**options)
+        self._drawn[widget] = content
+        self.render_stats.widgets += 1
 
     def update_player_labels(self):
         """Update the labels showing the number of cards for each player and whose turn it is."""
-        for i, player in enumerate(self.game.players, 1):
+        for i, player in enumerate(self.shown_game.players, 1):
             label = getattr(self, f'player{i}_label')
             if player.hand:
-                label.config(text=f"Player {i} - Remaining Cards: {len(player.hand)}")
+                text = f"Player {i} - Remaining Cards: {len(player.hand)}"
             else:
-                label.config(text=f"Player {i} - No Cards")  
+                text = f"Player {i} - No Cards"
+            self._draw(label, text, text=text)
 
     def update_card_display(self):
-        for i, player in enumerate(self.game.players, 1):
-            card_label = getattr(self, f'player{i}_card')
-            if player.hand:
-                if self.game.table.played_cards.get(player.name):
-                    card = self.game.table.played_cards[player.name]
-                elif self.game.table.last_played_cards.get(player.name):
-                    card = self.game.table.last_played_cards[player.name]
-                else:
-                    card = None
-                
-                if card:
-                    card_image = self.get_card_image(card)
-                    if card_image:
-                        card_label.config(image=card_image)
-                        card_label.image = card_image
-                    else:
-                        print(f"Failed to load image for card: {card}")
-                        card_label.config(image='')
-                else:
-                    back_image = self.card_images.get('back')
-                    if back_image:
-                        card_label.config(image=back_image)
-                        card_label.image = back_image
-                    else:
-                        print("Failed to load back image")
-                        card_label.config(image='')
+        game = self.shown_game
+        table = game.table
+        for seat, player in enumerate(game.players):
+            card_label = getattr(self, f'player{seat + 1}_card')
+            if not player.hand:
+                self._draw(card_label, None, image='')
+                continue
+            card = table.cards[seat] or table.last_cards[seat]
+            if card is None or card.facedown:
+                content = ('back', self.card_size)
             else:
-                card_label.config(image='')
-                
+                content = (card.id, self.card_size)
+            if self._drawn.get(card_label) == content:
+                continue
+
+            image = None
+            if card is not None and not card.facedown:
+                image = self.image_cache.cached_photo(card, self.card_size)
+                if image is None:
+                    # Show the back until the face has been loaded, and look again next frame
+                    content = ('loading',) + content
+            image = image or self.back_image()
+            if image is None:
+                print(f"Failed to load image for card: {card}" if card else "Failed to load back image")
+            self._draw(card_label, content, image=image or '')
+            card_label.image = image
+
     def update_deck_display(self):
         """Update the display of deck."""
-        try:
-            if not self.game.players[0].hand and not self.game.players[1].hand:
-                self.deck_label.config(image=self.card_images['back_deck'])
-            else:
-                self.deck_label.config(image='')
-        except:
-            print("failed to load update_deck_display")        
-    
+        game = self.shown_game
+        if any(player.hand for player in game.players):
+            self._draw(self.deck_label, None, image='')
+            return
+        content = ('back_deck', self.back_deck_size)
+        if self._drawn.get(self.deck_label) == content:
+            return
+        image = self.image_cache.cached_photo('back_deck', self.back_deck_size)
+        self._draw(self.deck_label, content if image is not None else ('loading',) + content, image=image or '')
+
     def get_card_image(self, card: Optional[Card]) -> Optional[ImageTk.PhotoImage]:
         """
         Get the image for a given card.
@@ -269,11 +754,10 @@ class GUI:
             return None
         
         if card.facedown:
-            return self.card_images['back']
+            return self.back_image()
         
-        rank = card.rank
-        suit = card.suit[0].upper()
-        return self.card_images.get(f"{rank}{suit}")
+        # Show the back until the face has been loaded
+        return self.image_cache.cached_photo(card, self.card_size) or self.back_image()
 
     def run(self):
         """Start the GUI main loop."""
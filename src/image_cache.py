@@ -0,0 +1,286 @@
+import os
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from typing import Dict, Optional, Tuple, Union
+from PIL import Image, ImageTk
+from .atlas import ATLAS_DIR, AtlasSet
+from .card import Card
+
+# A card, a card id, or the name of another image ('back' or 'back_deck')
+ImageSource = Union[Card, int, str]
+CacheKey = Tuple[Union[int, str], Tuple[int, int], bool]
+
+DEFAULT_BUDGET = 64 * 1024 * 1024
+
+# Files of the images that are not card faces
+NAMED_IMAGES = {
+    'back': "gray_back.png",
+    'back_deck': "back_cards-07.png",
+}
+
+
+class ImageCache:
+    """
+    A size-keyed cache of card images shared by ``Card.get_image`` and the GUI.
+
+    Images are keyed by ``(card id, size, facedown)``. The compressed image files
+    are read from disk once and kept in memory, so rendering a card at a new size
+    (e.g. after the window is resized) never touches the disk again. Sizes with
+    an up-to-date sprite atlas (see ``atlas``) are sliced from the atlas instead
+    of being decoded. Rendered images are evicted least recently used first once
+    their total size exceeds the memory budget.
+
+    ``get_image`` may be called from any thread; ``get_photo`` and
+    ``cached_photo`` create Tk images and must be called from the Tk thread.
+
+    Attributes:
+        image_dir (str): The directory containing the card images.
+        budget (int): The maximum number of bytes of rendered images to keep.
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups that had to render an image.
+        evictions (int): The number of images evicted to stay within the budget.
+        bytes_used (int): The number of bytes of rendered images currently cached.
+    """
+
+    def __init__(self, image_dir: str = Card.IMAGE_PATH, budget: int = DEFAULT_BUDGET,
+                 atlas_dir: Optional[str] = ATLAS_DIR):
+        """
+        Initialize an empty image cache.
+
+        Args:
+            image_dir (str): The directory containing the card images.
+            budget (int): The maximum number of bytes of rendered images to keep.
+            atlas_dir (Optional[str]): The directory containing the sprite atlases,
+                or None to always load the image files.
+        """
+        self.image_dir = image_dir
+        self.budget = budget
+        self.atlases = AtlasSet(image_dir, atlas_dir) if atlas_dir is not None else None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_used = 0
+        self._files: Dict[str, bytes] = {}
+        # key -> [image, photo or None, bytes]
+        self._entries: 'OrderedDict[CacheKey, list]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(source: ImageSource, size: Tuple[int, int], facedown: bool = False) -> CacheKey:
+        """
+        Get the cache key of an image.
+
+        All face-down cards look the same, so they share the key of the back image.
+
+        Args:
+            source (ImageSource): The card, card id or image name.
+            size (Tuple[int, int]): The size of the image (width, height).
+            facedown (bool): Whether the card is face down.
+
+        Returns:
+            CacheKey: The cache key.
+        """
+        if facedown:
+            return ('back', tuple(size), True)
+        if isinstance(source, Card):
+            source = source.id
+        return (source, tuple(size), False)
+
+    @staticmethod
+    def file_name(key: CacheKey) -> str:
+        """
+        Get the name of the image file for a cache key.
+
+        Args:
+            key (CacheKey): The cache key.
+
+        Returns:
+            str: The file name of the image (e.g. 'AS.png').
+        """
+        source = key[0]
+        if isinstance(source, str):
+            return NAMED_IMAGES[source]
+        card = Card.from_id(source)
+        return f"{card.rank}{card.suit[0].upper()}.png"
+
+    def read_file(self, path: str) -> bytes:
+        """
+        Get the contents of an image file, reading it from disk only the first time.
+
+        Args:
+            path (str): The path of the image file.
+
+        Returns:
+            bytes: The contents of the file.
+
+        Raises:
+            FileNotFoundError: If the image file is not found.
+        """
+        data = self._files.get(path)
+        if data is None:
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"Card image not found: {path}")
+            with open(path, "rb") as file:
+                data = file.read()
+            self._files[path] = data
+        return data
+
+    def render(self, key: CacheKey) -> Image.Image:
+        """
+        Render the image for a cache key, bypassing the cache.
+
+        The image is sliced from the atlas of its size when there is one, and
+        decoded and resized from its file otherwise.
+
+        Args:
+            key (CacheKey): The cache key.
+
+        Returns:
+            Image.Image: The image resized to the size in the key.
+        """
+        name = self.file_name(key)
+        if self.atlases is not None:
+            image = self.atlases.get(os.path.splitext(name)[0], key[1])
+            if image is not None:
+                return image
+        with Image.open(BytesIO(self.read_file(os.path.join(self.image_dir, name)))) as image:
+            return image.resize(key[1], Image.LANCZOS)
+
+    def get_image(self, source: ImageSource, size: Tuple[int, int], facedown: bool = False) -> Image.Image:
+        """
+        Get an image, rendering it if it is not cached.
+
+        Args:
+            source (ImageSource): The card, card id or image name.
+            size (Tuple[int, int]): The size of the image (width, height).
+            facedown (bool): Whether the card is face down.
+
+        Returns:
+            Image.Image: The image at the requested size.
+
+        Raises:
+            FileNotFoundError: If the image file is not found.
+        """
+        return self._get(self.make_key(source, size, facedown))[0]
+
+    def get_photo(self, source: ImageSource, size: Tuple[int, int], facedown: bool = False) -> ImageTk.PhotoImage:
+        """
+        Get an image as a Tk ``PhotoImage``, rendering it if it is not cached.
+
+        Args:
+            source (ImageSource): The card, card id or image name.
+            size (Tuple[int, int]): The size of the image (width, height).
+            facedown (bool): Whether the card is face down.
+
+        Returns:
+            ImageTk.PhotoImage: The image at the requested size.
+
+        Raises:
+            FileNotFoundError: If the image file is not found.
+        """
+        key = self.make_key(source, size, facedown)
+        return self._photo(key, self._get(key))
+
+    def cached_photo(self, source: ImageSource, size: Tuple[int, int],
+                     facedown: bool = False) -> Optional[ImageTk.PhotoImage]:
+        """
+        Get an image as a Tk ``PhotoImage`` only if it has already been rendered.
+
+        Args:
+            source (ImageSource): The card, card id or image name.
+            size (Tuple[int, int]): The size of the image (width, height).
+            facedown (bool): Whether the card is face down.
+
+        Returns:
+            Optional[ImageTk.PhotoImage]: The image, or None if it is not cached.
+        """
+        key = self.make_key(source, size, facedown)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return self._photo(key, entry)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the cache counters.
+
+        Returns:
+            Dict[str, int]: The hits, misses, evictions, number of entries and bytes used.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.bytes_used,
+            }
+
+    def clear(self) -> None:
+        """
+        Drop every rendered image. The image files stay in memory.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.bytes_used = 0
+
+    def _get(self, key: CacheKey) -> list:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        image = self.render(key)
+        entry = [image, None, image.width * image.height * 4]
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                # Rendered by another thread in the meantime
+                return existing
+            self._entries[key] = entry
+            self.bytes_used += entry[2]
+            self._evict()
+        return entry
+
+    def _photo(self, key: CacheKey, entry: list) -> ImageTk.PhotoImage:
+        if entry[1] is None:
+            entry[1] = ImageTk.PhotoImage(entry[0])
+            with self._lock:
+                # The Tk image holds a second copy of the pixels
+                if self._entries.get(key) is entry:
+                    self.bytes_used += entry[2]
+                    entry[2] *= 2
+                    self._evict()
+        return entry[1]
+
+    def _evict(self) -> None:
+        # Called with the lock held; always keeps the most recent entry
+        while self.bytes_used > self.budget and len(self._entries) > 1:
+            _, entry = self._entries.popitem(last=False)
+            self.bytes_used -= entry[2]
+            self.evictions += 1
+
+
+_shared_cache: Optional[ImageCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_image_cache() -> ImageCache:
+    """
+    Get the image cache shared by ``Card.get_image`` and the GUI.
+
+    Returns:
+        ImageCache: The shared image cache.
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ImageCache()
+        return _shared_cache
@@ -1,4 +1,5 @@
 
+import os
 from src.game import Game
 from src.rules import Rules
 from src.gui import GUI
@@ -24,6 +25,8 @@ def main():
 
     # Create and run the GUI
     gui = GUI(game)
+    if os.environ.get("WARZONE_STARTUP_PROBE"):
+        gui.probe_startup()
     gui.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,313 @@
+import sys
+import threading
+import time
+from functools import wraps
+from typing import Callable, Dict, Optional, TextIO
+from .game import Game
+from .table import Table
+
+# Timed phases: (class, method name)
+PHASES = (
+    (Game, 'play_round'),
+    (Game, 'resolve_war'),
+    (Table, 'get_round_winner_seat'),
+    (Table, 'collect_cards'),
+)
+
+# Counters and their descriptions, in the order they are reported
+COUNTERS = {
+    'rounds': "Rounds played.",
+    'wars': "Wars fought.",
+    'war_depth': "Face-up rounds played in wars.",
+    'collections': "Calls to Table.collect_cards.",
+    'cards_collected': "Cards collected from the table.",
+    'allocated_blocks': "Net memory blocks allocated during rounds (sys.getallocatedblocks).",
+}
+
+
+class Timer:
+    """
+    The number of calls to a phase and the time they took.
+
+    Attributes:
+        count (int): The number of calls.
+        total (float): Their total time in seconds, including the phases they called.
+        max (float): The longest call in seconds.
+    """
+    __slots__ = ('count', 'total', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class Registry:
+    """
+    In-memory counters and phase timers filled in by ``Instrumentation``.
+
+    Attributes:
+        counters (Dict[str, int]): The value of each counter in ``COUNTERS``.
+        timers (Dict[str, Timer]): The timer of each phase, keyed by method name.
+    """
+
+    def __init__(self):
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.timers: Dict[str, Timer] = {name: Timer() for _, name in PHASES}
+
+    def reset(self) -> None:
+        """Set every counter and timer back to zero, in place (enabled wrappers keep recording into them)."""
+        for name in self.counters:
+            self.counters[name] = 0
+        for timer in self.timers.values():
+            timer.__init__()
+
+    def allocations_per_round(self) -> float:
+        rounds = self.counters['rounds']
+        return self.counters['allocated_blocks'] / rounds if rounds else 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Get the counters and timers as plain values.
+
+        Returns:
+            Dict[str, object]: The counters, and the count, total, mean and max
+                seconds of each timer.
+        """
+        return {
+            'counters': dict(self.counters),
+            'timers': {name: {'count': timer.count, 'total': timer.total, 'mean': timer.mean, 'max': timer.max}
+                       for name, timer in self.timers.items()},
+        }
+
+    def log_line(self) -> str:
+        """
+        Summarize the registry on one line, for periodic logging.
+
+        Returns:
+            str: The counters, and the mean time of each phase in microseconds.
+        """
+        counters = self.counters
+        phases = " ".join(f"{name}={timer.mean * 1e6:.2f}us" for name, timer in self.timers.items())
+        return (f"rounds={counters['rounds']} wars={counters['wars']} "
+                f"cards_collected={counters['cards_collected']} "
+                f"allocs/round={self.allocations_per_round():.1f} {phases}")
+
+    def to_prometheus(self, prefix: str = "warzone") -> str:
+        """
+        Dump the registry in the Prometheus text exposition format.
+
+        Counters are exported as ``<prefix>_<name>_total`` and the timers as a
+        ``<prefix>_phase_seconds`` summary labelled by phase.
+
+        Args:
+            prefix (str): The prefix of the metric names.
+
+        Returns:
+            str: The metrics, one sample per line.
+        """
+        lines = []
+        for name, description in COUNTERS.items():
+            metric = f"{prefix}_{name}_total"
+            lines += [f"# HELP {metric} {description}", f"# TYPE {metric} counter",
+                      f"{metric} {self.counters[name]}"]
+        metric = f"{prefix}_phase_seconds"
+        lines += [f"# HELP {metric} Time spent in each phase, including the phases it calls.",
+                  f"# TYPE {metric} summary"]
+        for name, timer in self.timers.items():
+            lines += [f'{metric}_sum{{phase="{name}"}} {timer.total!r}',
+                      f'{metric}_count{{phase="{name}"}} {timer.count}']
+        metric = f"{prefix}_phase_max_seconds"
+        lines += [f"# HELP {metric} Longest call of each phase.", f"# TYPE {metric} gauge"]
+        lines += [f'{metric}{{phase="{name}"}} {timer.max!r}' for name, timer in self.timers.items()]
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, prefix: str = "warzone") -> None:
+        """Write ``to_prometheus`` to a file, e.g. for the node exporter's textfile collector."""
+        with open(path, "w") as file:
+            file.write(self.to_prometheus(prefix))
+
+
+def _instrumented(cls: type, name: str, registry: Registry) -> Callable:
+    """Wrap a phase method so that it records into a registry."""
+    original = cls.__dict__[name]
+    timer = registry.timers[name]
+    counters = registry.counters
+    clock = time.perf_counter
+
+    if name == 'play_round':
+        allocated_blocks = sys.getallocatedblocks
+
+        @wraps(original)
+        def play_round(self):
+            rounds = self.rounds_played
+            blocks = allocated_blocks()
+            start = clock()
+            result = original(self)
+            timer.observe(clock() - start)
+            if self.rounds_played != rounds:
+                counters['rounds'] += 1
+                counters['allocated_blocks'] += allocated_blocks() - blocks
+            return result
+        return play_round
+
+    if name == 'resolve_war':
+        @wraps(original)
+        def resolve_war(self):
+            start = clock()
+            result = original(self)
+            timer.observe(clock() - start)
+            counters['wars'] += 1
+            counters['war_depth'] += self.war_depth
+            return result
+        return resolve_war
+
+    if name == 'collect_cards':
+        @wraps(original)
+        def collect_cards(self):
+            start = clock()
+            cards = original(self)
+            timer.observe(clock() - start)
+            counters['collections'] += 1
+            counters['cards_collected'] += len(cards)
+            return cards
+        return collect_cards
+
+    @wraps(original)
+    def timed(self, *args, **kwargs):
+        start = clock()
+        result = original(self, *args, **kwargs)
+        timer.observe(clock() - start)
+        return result
+    return timed
+
+
+class Instrumentation:
+    """
+    Per-phase counters and timers for ``Game`` and ``Table``.
+
+    While enabled, the methods in ``PHASES`` are replaced on their classes by
+    wrappers that record into a ``Registry``; disabling puts the original
+    methods back. Nothing is wrapped while it is disabled, so it costs nothing
+    then. It applies to every game in the process (but not to worker
+    processes), and can be used as a context manager:
+
+        with Instrumentation() as registry:
+            simulate(1000)
+        print(registry.to_prometheus())
+
+    Attributes:
+        registry (Registry): The registry the measurements go into.
+    """
+    _active: Optional['Instrumentation'] = None
+
+    def __init__(self, registry: Optional[Registry] = None):
+        """
+        Initialize disabled instrumentation.
+
+        Args:
+            registry (Optional[Registry]): The registry to record into. Defaults to a new one.
+        """
+        self.registry = registry if registry is not None else Registry()
+        self._originals: Dict[str, Callable] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return Instrumentation._active is self
+
+    def enable(self) -> Registry:
+        """
+        Start recording.
+
+        Returns:
+            Registry: The registry the measurements go into.
+
+        Raises:
+            RuntimeError: If other instrumentation is already enabled.
+        """
+        if Instrumentation._active is not None and not self.enabled:
+            raise RuntimeError("Another Instrumentation is already enabled")
+        if not self.enabled:
+            for cls, name in PHASES:
+                self._originals[name] = cls.__dict__[name]
+                setattr(cls, name, _instrumented(cls, name, self.registry))
+            Instrumentation._active = self
+        return self.registry
+
+    def disable(self) -> None:
+        """Stop recording and restore the original methods."""
+        if not self.enabled:
+            return
+        for cls, name in PHASES:
+            setattr(cls, name, self._originals.pop(name))
+        Instrumentation._active = None
+
+    def __enter__(self) -> Registry:
+        return self.enable()
+
+    def __exit__(self, *exc_info) -> None:
+        self.disable()
+
+
+class PeriodicLogger:
+    """
+    Write ``Registry.log_line`` at a fixed interval from a background thread.
+
+    The game loop is not involved, so logging adds nothing to the phases
+    being measured. Use it as a context manager, or call ``start`` and ``stop``.
+    """
+
+    def __init__(self, registry: Registry, interval: float = 10.0, stream: Optional[TextIO] = None):
+        """
+        Initialize a stopped logger.
+
+        Args:
+            registry (Registry): The registry to report.
+            interval (float): Seconds between log lines.
+            stream (Optional[TextIO]): Where to write the lines. Defaults to standard error.
+        """
+        self.registry = registry
+        self.interval = interval
+        self.stream = stream
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def log(self) -> None:
+        stream = self.stream or sys.stderr
+        print(f"[metrics] {self.registry.log_line()}", file=stream, flush=True)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.log()
+
+    def start(self) -> None:
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-logger", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the thread, and write a last line."""
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        self.log()
+
+    def __enter__(self) -> 'PeriodicLogger':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
@@ -0,0 +1,197 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+from .card import Card
+from .game import Game, GamePool
+from .rules import Rules
+from .rng import fill_permutations
+from .simulation import DEFAULT_MAX_ROUNDS, GameResult, new_game, play_game
+from .stats import StatsAggregator
+
+RESULT_FIELDS = 5  # winner, rounds, wars, max_war_depth, outcome
+DEFAULT_CHUNK_SIZE = 256
+
+# Per-worker state, set up once by _init_worker
+_worker = {}
+
+
+def _init_worker(deals_name: str, results_name: str, deck_size: int, rules: Rules,
+                 seed: int, max_rounds: int, detect_cycles: bool, collect_stats: bool) -> None:
+    """
+    Attach a worker process to the shared deal and result buffers.
+    """
+    deals = shared_memory.SharedMemory(name=deals_name)
+    results = shared_memory.SharedMemory(name=results_name)
+    _worker.update(
+        deals_shm=deals,
+        results_shm=results,
+        deals=deals.buf,
+        results=results.buf.cast('i'),
+        deck_size=deck_size,
+        # The card ids of an unshuffled deck, which the deals are shuffled from
+        card_ids=[card.id for card in Card.DECK] * (deck_size // len(Card.DECK)),
+        rules=rules,
+        seed=seed,
+        max_rounds=max_rounds,
+        detect_cycles=detect_cycles,
+        collect_stats=collect_stats,
+    )
+
+
+def _run_chunk(task: Tuple[int, int, bool]) -> Tuple[int, Optional[StatsAggregator]]:
+    """
+    Play the games in ``range(start, stop)`` inside a worker process.
+
+    Each game's deal is read from the shared deal buffer, where the deals of the
+    whole chunk are first shuffled from the games' own seeds when they are not
+    pre-filled, and the outcome is written to the shared result buffer.
+
+    Returns:
+        Tuple[int, Optional[StatsAggregator]]: The number of rounds played in the
+            chunk, and the statistics of its games if they are being collected.
+    """
+    start, stop, dealt = task
+    deals = _worker['deals']
+    results = _worker['results']
+    deck_size = _worker['deck_size']
+    rules = _worker['rules']
+    seed = _worker['seed']
+    max_rounds = _worker['max_rounds']
+    detect_cycles = _worker['detect_cycles']
+    stats = StatsAggregator() if _worker['collect_stats'] else None
+    rounds = 0
+    pool = GamePool(1)
+    if not dealt:
+        fill_permutations(deals[start * deck_size:stop * deck_size], _worker['card_ids'], seed, start)
+
+    for index in range(start, stop):
+        offset = index * deck_size
+        game = new_game(rules, deal=deals[offset:offset + deck_size], pool=pool, detect_cycles=detect_cycles)
+        if stats is not None:
+            game.add_listener(stats)
+        result = play_game(game, max_rounds, detect_cycles)
+
+        base = index * RESULT_FIELDS
+        results[base] = -1 if result.winner is None else result.winner
+        results[base + 1] = result.rounds
+        results[base + 2] = result.wars
+        results[base + 3] = result.max_war_depth
+        results[base + 4] = Game.OUTCOMES.index(result.outcome)
+        rounds += result.rounds
+        pool.release(game)
+
+    return rounds, stats
+
+
+class ParallelRun:
+    """
+    The outcome of a multi-process simulation run.
+
+    Attributes:
+        deals (bytes): The initial deck order of every game, ``deck_size`` bytes per game,
+            encoded by ``simulation.encode_cards``.
+        results (List[GameResult]): The outcome of every game, in order.
+        deck_size (int): The number of cards in each game's deck.
+        rounds (int): The total number of rounds played.
+        stats (Optional[StatsAggregator]): The statistics of all the games, if they were collected.
+    """
+
+    def __init__(self, deals: bytes, results: List[GameResult], deck_size: int, rounds: int,
+                 stats: Optional[StatsAggregator] = None):
+        self.deals = deals
+        self.results = results
+        self.deck_size = deck_size
+        self.rounds = rounds
+        self.stats = stats
+
+    def deal(self, index: int) -> bytes:
+        """
+        Get the initial deck order of a game, to replay it with ``simulation.new_game``.
+
+        Args:
+            index (int): The index of the game.
+
+        Returns:
+            bytes: The encoded deck order.
+        """
+        return self.deals[index * self.deck_size:(index + 1) * self.deck_size]
+
+
+def run(n_games: int, rules: Optional[Rules] = None, seed: int = 0, workers: Optional[int] = None,
+        max_rounds: int = DEFAULT_MAX_ROUNDS, chunk_size: int = DEFAULT_CHUNK_SIZE,
+        deals: Optional[bytes] = None, detect_cycles: bool = True, collect_stats: bool = False) -> ParallelRun:
+    """
+    Simulate games across a pool of worker processes.
+
+    Every game is shuffled from its own seed (see ``simulation.game_seed``), so the
+    results are identical to ``simulation.simulate`` with the same seed, no matter
+    how many workers are used or how the games are split between them. Deals and
+    results are exchanged through shared memory; only the chunk boundaries are
+    sent to the workers.
+
+    Args:
+        n_games (int): The number of games to simulate.
+        rules (Optional[Rules]): The rule set for every game. Default is the standard rules.
+        seed (int): The seed of the run.
+        workers (Optional[int]): The number of worker processes. Default is the number of CPUs.
+        max_rounds (int): The number of rounds after which a game is abandoned.
+        chunk_size (int): The number of games handed to a worker at a time.
+        deals (Optional[bytes]): Pre-generated deck orders, ``deck_size`` bytes per game.
+            When given, the games are played from these deals instead of being shuffled.
+        detect_cycles (bool): Whether to stop games that would repeat forever.
+        collect_stats (bool): Whether to aggregate the statistics of the games in
+            each worker (see ``stats.StatsAggregator``) and merge them.
+
+    Returns:
+        ParallelRun: The deals and results of the run.
+
+    Raises:
+        ValueError: If ``deals`` does not hold exactly one deck per game.
+    """
+    if rules is None:
+        rules = Rules()
+    if workers is None:
+        workers = os.cpu_count() or 1
+    deck_size = 104 if rules.use_double_deck else 52
+    if deals is not None and len(deals) != n_games * deck_size:
+        raise ValueError(f"Expected {n_games * deck_size} bytes of deals, got {len(deals)}")
+    if n_games == 0:
+        return ParallelRun(b"", [], deck_size, 0, StatsAggregator() if collect_stats else None)
+
+    deals_shm = shared_memory.SharedMemory(create=True, size=n_games * deck_size)
+    results_shm = shared_memory.SharedMemory(create=True, size=n_games * RESULT_FIELDS * 4)
+    try:
+        if deals is not None:
+            deals_shm.buf[:len(deals)] = deals
+        tasks = [(start, min(start + chunk_size, n_games), deals is not None)
+                 for start in range(0, n_games, chunk_size)]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(deals_shm.name, results_shm.name, deck_size, rules, seed, max_rounds, detect_cycles,
+                      collect_stats),
+        ) as executor:
+            rounds = 0
+            stats = StatsAggregator() if collect_stats else None
+            for chunk_rounds, chunk_stats in executor.map(_run_chunk, tasks):
+                rounds += chunk_rounds
+                if stats is not None:
+                    stats.merge(chunk_stats)
+
+        raw = results_shm.buf.cast('i')
+        try:
+            values = raw.tolist()
+        finally:
+            raw.release()
+        results = [
+            GameResult(None if values[i] < 0 else values[i], values[i + 1], values[i + 2], values[i + 3],
+                       Game.OUTCOMES[values[i + 4]])
+            for i in range(0, n_games * RESULT_FIELDS, RESULT_FIELDS)
+        ]
+        return ParallelRun(bytes(deals_shm.buf[:n_games * deck_size]), results, deck_size, rounds, stats)
+    finally:
+        deals_shm.close()
+        deals_shm.unlink()
+        results_shm.close()
+        results_shm.unlink()
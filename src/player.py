@@ -1,4 +1,5 @@
-from typing import List
+from collections import deque
+from typing import Deque, Iterable, List
 from .card import Card
 
 class Player:
@@ -10,7 +11,8 @@ class Player:
 
     Attributes:
         name (str): The name of the player.
-        hand (List[Card]): A list of Card objects representing the player's current hand.
+        hand (Deque[Card]): A queue of Card objects representing the player's current hand,
+            with the top card on the left.
     """
 
     def __init__(self, name: str):
@@ -21,7 +23,7 @@ class Player:
             name (str): The name of the player.
         """
         self.name = name
-        self.hand: List[Card] = []
+        self.hand: Deque[Card] = deque()
 
     def play_card(self) -> Card:
         """
@@ -35,17 +37,54 @@ class Player:
         """
         if not self.hand:
             raise ValueError(f"{self.name} has no cards left to play.")
-        return self.hand.pop(0)
+        return self.hand.popleft()
 
-    def receive_cards(self, cards: List[Card]) -> None:
+    def play_cards(self, count: int) -> List[Card]:
         """
-        Add cards to the player's hand.
+        Play several cards from the player's hand.
 
         Args:
-            cards (List[Card]): A list of Card objects to be added to the player's hand.
+            count (int): The number of cards to play.
+
+        Returns:
+            List[Card]: The cards played, in the order they were taken from the top of the hand.
+
+        Raises:
+            ValueError: If the player has fewer than ``count`` cards in their hand.
+        """
+        if len(self.hand) < count:
+            raise ValueError(f"{self.name} has fewer than {count} cards left to play.")
+        popleft = self.hand.popleft
+        return [popleft() for _ in range(count)]
+
+    def receive_cards(self, cards: Iterable[Card]) -> None:
+        """
+        Add cards to the bottom of the player's hand.
+
+        Args:
+            cards (Iterable[Card]): The cards to be added to the player's hand, in order.
         """
         self.hand.extend(cards)
 
+    def reset(self) -> None:
+        """
+        Empty the player's hand for a new game, keeping its storage.
+        """
+        self.hand.clear()
+
+    def copy(self) -> 'Player':
+        """
+        Get a copy of the player with an independent hand.
+
+        Cards are shared instances, so only the hand itself is copied.
+
+        Returns:
+            Player: The copy.
+        """
+        clone = type(self)(self.name)
+        clone.hand = self.hand.copy()
+        return clone
+
     def get_hand_size(self) -> int:
         """
         Get the number of cards in the player's hand.
@@ -0,0 +1,442 @@
+"""
+Binary replay logs of games.
+
+A log is the magic bytes ``WZR1`` followed by records, each a 2-byte
+little-endian length and a body whose first byte is the record type:
+
+- GAME: the rules, the player names and a ``Game.snapshot`` of the start
+  of a game. Every game in a log begins with one.
+- KEYFRAME: a ``Game.snapshot``, written every few rounds so that a replay
+  can seek without starting from the beginning.
+- ROUND and WAR: the winner's seat (255 for nobody), the pot size, for wars
+  the depth, then a ``(seat, card id)`` byte pair for every card put down.
+- END: the outcome of the game, as an index into ``Game.OUTCOMES``.
+
+``ReplayWriter`` is a ``GameListener`` that writes a log through an
+in-memory buffer. ``load`` reads a log back into ``Replay`` objects, which
+reconstruct the game by moving the logged cards, without playing it again.
+
+To print a summary of a log, or play it back in the GUI:
+
+    python -m src.replay games.wzr [--gui [--game N]]
+"""
+import argparse
+import struct
+from bisect import bisect_right
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple, Union
+from .card import Card
+from .game import Game, GameListener
+from .rules import Rules
+
+MAGIC = b"WZR1"
+
+GAME = 1
+KEYFRAME = 2
+ROUND = 3
+WAR = 4
+END = 5
+
+NO_SEAT = 0xFF
+DEFAULT_BUFFER_SIZE = 1 << 16
+DEFAULT_KEYFRAME_INTERVAL = 256
+
+_LENGTH = struct.Struct('<H')
+# The start of the body of ROUND and WAR records: type, winner seat, pot size (and for wars, depth)
+_ROUND_BODY = struct.Struct('<BBH')
+_WAR_BODY = struct.Struct('<BBHH')
+# The same, preceded by the record length
+_ROUND = struct.Struct('<H' + _ROUND_BODY.format[1:])
+_WAR = struct.Struct('<H' + _WAR_BODY.format[1:])
+
+
+class ReplayWriter(GameListener):
+    """
+    Writes the events of games to a replay log.
+
+    Records are collected in a buffer and written to the file whenever the
+    buffer fills up, so logging costs little more than encoding the events.
+    Add the writer to a game with ``Game.add_listener``; one writer can record
+    any number of games, one after the other.
+
+    Attributes:
+        keyframe_interval (int): The number of rounds between keyframes, or 0 for none.
+        bytes_written (int): The number of bytes written to the file so far.
+    """
+
+    def __init__(self, file: Union[str, BinaryIO], keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        Open a replay log for writing.
+
+        Args:
+            file (Union[str, BinaryIO]): The path of the log, or a binary file to write it to.
+            keyframe_interval (int): The number of rounds between keyframes, or 0 for none.
+            buffer_size (int): The number of bytes buffered before writing to the file.
+        """
+        self._owns_file = isinstance(file, str)
+        self._file = open(file, "wb") if self._owns_file else file
+        self.keyframe_interval = keyframe_interval
+        self.bytes_written = 0
+        self._buffer_size = buffer_size
+        self._buffer = bytearray(MAGIC)
+
+    def _record(self, body: bytes) -> None:
+        buffer = self._buffer
+        buffer += _LENGTH.pack(len(body))
+        buffer += body
+        if len(buffer) >= self._buffer_size:
+            self.flush()
+
+    def _record_play(self, placed: List[Tuple[int, Card]]) -> None:
+        # The (seat, card id) pairs that end a ROUND or WAR record
+        buffer = self._buffer
+        for seat, card in placed:
+            buffer.append(seat)
+            buffer.append(card.id)
+        if len(buffer) >= self._buffer_size:
+            self.flush()
+
+    def game_started(self, game: Game) -> None:
+        rules = game.rules
+        method = rules.war_resolution_method.encode()
+        parts = [bytes([GAME, len(method)]), method,
+                 bytes([rules.use_double_deck, rules.speed_war_enabled, len(game.players)])]
+        for player in game.players:
+            name = player.name.encode()
+            parts.append(bytes([len(name)]))
+            parts.append(name)
+        parts.append(game.snapshot())
+        self._record(b"".join(parts))
+
+    def round_played(self, game: Game, placed: List[Tuple[int, Card]], winner: Optional[int],
+                     pot_size: int) -> None:
+        self._buffer += _ROUND.pack(_ROUND.size - 2 + 2 * len(placed), ROUND,
+                                    NO_SEAT if winner is None else winner, pot_size)
+        self._record_play(placed)
+        if self.keyframe_interval and game.rounds_played % self.keyframe_interval == 0:
+            self._record(bytes([KEYFRAME]) + game.snapshot())
+
+    def war_fought(self, game: Game, placed: List[Tuple[int, Card]], winner: Optional[int],
+                   pot_size: int) -> None:
+        self._buffer += _WAR.pack(_WAR.size - 2 + 2 * len(placed), WAR,
+                                  NO_SEAT if winner is None else winner, pot_size, game.war_depth)
+        self._record_play(placed)
+
+    def game_ended(self, game: Game) -> None:
+        self._record(bytes([END, Game.OUTCOMES.index(game.outcome)]))
+
+    def flush(self) -> None:
+        """
+        Write the buffered records to the file.
+        """
+        self._file.write(self._buffer)
+        self.bytes_written += len(self._buffer)
+        self._buffer.clear()
+        self._file.flush()
+
+    def close(self) -> None:
+        """
+        Flush the buffer, and close the file if the writer opened it.
+        """
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self) -> 'ReplayWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_records(data: bytes) -> Iterator[Tuple[int, memoryview]]:
+    """
+    Split a replay log into its records.
+
+    Args:
+        data (bytes): The contents of the log.
+
+    Yields:
+        Tuple[int, memoryview]: The type and the body of each record (including the type byte).
+
+    Raises:
+        ValueError: If the data is not a replay log or a record is truncated.
+    """
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not a replay log")
+    view = memoryview(data)
+    offset = len(MAGIC)
+    end = len(data)
+    while offset < end:
+        if offset + 2 > end:
+            raise ValueError(f"Truncated record at byte {offset}")
+        length, = _LENGTH.unpack_from(view, offset)
+        offset += 2
+        body = view[offset:offset + length]
+        if len(body) != length or length == 0:
+            raise ValueError(f"Truncated record at byte {offset}")
+        yield body[0], body
+        offset += length
+
+
+def round_record(placed: List[Tuple[int, Card]], winner: Optional[int], pot_size: int) -> bytes:
+    """
+    Encode the body of a ROUND record.
+
+    Args:
+        placed (List[Tuple[int, Card]]): The seat and card of every card put down.
+        winner (Optional[int]): The seat of the winner, or None for a tie.
+        pot_size (int): The number of cards the winner received.
+
+    Returns:
+        bytes: The body of the record.
+    """
+    return (_ROUND_BODY.pack(ROUND, NO_SEAT if winner is None else winner, pot_size)
+            + bytes([value for seat, card in placed for value in (seat, card.id)]))
+
+
+def war_record(placed: List[Tuple[int, Card]], winner: Optional[int], pot_size: int, depth: int) -> bytes:
+    """
+    Encode the body of a WAR record.
+
+    Args:
+        placed (List[Tuple[int, Card]]): The seat and card of every card put down.
+        winner (Optional[int]): The seat of the winner.
+        pot_size (int): The number of cards the winner received.
+        depth (int): The number of face-up rounds the war took.
+
+    Returns:
+        bytes: The body of the record.
+    """
+    return (_WAR_BODY.pack(WAR, NO_SEAT if winner is None else winner, pot_size, depth)
+            + bytes([value for seat, card in placed for value in (seat, card.id)]))
+
+
+def apply_record(game: Game, body: bytes) -> None:
+    """
+    Apply a ROUND, WAR, KEYFRAME or END record to a game, moving the logged
+    cards without playing the round.
+
+    Args:
+        game (Game): The game, in the state just before the record.
+        body (bytes): The body of the record.
+
+    Raises:
+        ValueError: If a logged card is not the card on top of its player's hand.
+    """
+    kind = body[0]
+    if kind == KEYFRAME:
+        return
+    if kind == END:
+        game.outcome = Game.OUTCOMES[body[1]]
+        return
+
+    players = game.players
+    table = game.table
+    placed = body[(_ROUND_BODY if kind == ROUND else _WAR_BODY).size:]
+    if kind == ROUND:
+        _, winner, pot_size = _ROUND_BODY.unpack_from(body)
+        game.rounds_played += 1
+        table.clear()
+        pot = []
+    else:
+        _, winner, pot_size, game.war_depth = _WAR_BODY.unpack_from(body)
+        pot = table.collect_cards()
+
+    for i in range(0, len(placed), 2):
+        seat = placed[i]
+        player = players[seat]
+        card = player.play_card()
+        if card.id != placed[i + 1]:
+            raise ValueError(f"Replay does not match the game: {player.name} holds {card}")
+        table.place(seat, card)
+        pot.append(card)
+
+    if winner == NO_SEAT:
+        game.war_in_progress = True
+        return
+    if len(pot) != pot_size:
+        raise ValueError(f"Replay does not match the game: pot of {len(pot)} cards, logged {pot_size}")
+    players[winner].receive_cards(pot)
+    if kind == ROUND:
+        table.collect_cards()
+    else:
+        table.clear()
+    game.war_in_progress = False
+
+
+class Replay:
+    """
+    The log of one game, which can reconstruct the game at any point.
+
+    Attributes:
+        names (List[str]): The names of the players.
+        rules (Rules): The rules of the game.
+        start (bytes): The snapshot of the start of the game.
+        records (List[memoryview]): The bodies of the game's ROUND, WAR, KEYFRAME and END records.
+        rounds (int): The number of rounds in the log.
+        outcome (Optional[str]): The outcome of the game, or None if the log stops before its end.
+    """
+
+    def __init__(self, body: memoryview):
+        """
+        Start a replay from a GAME record.
+
+        Args:
+            body (memoryview): The body of the GAME record.
+        """
+        offset = 1
+        length = body[offset]
+        method = bytes(body[offset + 1:offset + 1 + length]).decode()
+        offset += 1 + length
+        use_double_deck, speed_war_enabled, num_players = body[offset:offset + 3]
+        offset += 3
+        self.names = []
+        for _ in range(num_players):
+            length = body[offset]
+            self.names.append(bytes(body[offset + 1:offset + 1 + length]).decode())
+            offset += 1 + length
+        self.rules = Rules(method, bool(use_double_deck), bool(speed_war_enabled))
+        self.start = bytes(body[offset:])
+        self.records: List[memoryview] = []
+        self.outcome: Optional[str] = None
+        # Round numbers of the keyframes and their positions in records
+        self._keyframe_rounds: List[int] = [0]
+        self._keyframe_positions: List[int] = [-1]
+        self.rounds = 0
+
+    def _add(self, kind: int, body: memoryview) -> None:
+        if kind == ROUND:
+            self.rounds += 1
+        elif kind == KEYFRAME:
+            self._keyframe_rounds.append(self.rounds)
+            self._keyframe_positions.append(len(self.records))
+        elif kind == END:
+            self.outcome = Game.OUTCOMES[body[1]]
+        self.records.append(body)
+
+    def new_game(self) -> Game:
+        """
+        Create the game at its start.
+
+        Returns:
+            Game: A game with the logged players and rules, in its logged starting state.
+        """
+        game = Game(*self.names, self.rules)
+        game.restore(self.start)
+        return game
+
+    def steps(self, game: Optional[Game] = None) -> Iterator[Game]:
+        """
+        Replay the game record by record.
+
+        Args:
+            game (Optional[Game]): The game to replay into. Default is a new game from ``new_game``.
+
+        Yields:
+            Game: The game after each round, war and the end.
+        """
+        if game is None:
+            game = self.new_game()
+        for body in self.records:
+            if body[0] != KEYFRAME:
+                apply_record(game, body)
+                yield game
+
+    def seek(self, rounds: int, game: Optional[Game] = None) -> Game:
+        """
+        Reconstruct the game after a number of rounds (and the war that followed, if any).
+
+        The game is restored from the last keyframe at or before that round and
+        brought forward from there, so seeking takes bounded time.
+
+        Args:
+            rounds (int): The number of rounds played. Clamped to the rounds in the log.
+            game (Optional[Game]): The game to restore into. Default is a new game.
+
+        Returns:
+            Game: The reconstructed game.
+        """
+        if game is None:
+            game = self.new_game()
+        index = bisect_right(self._keyframe_rounds, rounds) - 1
+        position = self._keyframe_positions[index]
+        game.restore(self.start if position < 0 else bytes(self.records[position][1:]))
+        for body in self.records[position + 1:]:
+            if body[0] == ROUND and game.rounds_played >= rounds:
+                break
+            apply_record(game, body)
+        return game
+
+    def final(self) -> Game:
+        """
+        Reconstruct the game at the end of the log.
+
+        Returns:
+            Game: The reconstructed game.
+        """
+        return self.seek(self.rounds)
+
+
+def load(source: Union[str, bytes]) -> List[Replay]:
+    """
+    Read the games in a replay log.
+
+    Args:
+        source (Union[str, bytes]): The path of the log, or its contents.
+
+    Returns:
+        List[Replay]: The games, in the order they were written.
+
+    Raises:
+        ValueError: If the log is malformed.
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as file:
+            source = file.read()
+    replays: List[Replay] = []
+    for kind, body in read_records(source):
+        if kind == GAME:
+            if replays and not replays[-1].records:
+                # Restarted before anything happened, e.g. added before the deal
+                replays.pop()
+            replays.append(Replay(body))
+        elif not replays:
+            raise ValueError("Replay log does not start with a game")
+        else:
+            replays[-1]._add(kind, body)
+    return replays
+
+
+def main(argv: Optional[Iterable[str]] = None) -> None:
+    """
+    Command line entry point for inspecting and playing back replay logs.
+    """
+    parser = argparse.ArgumentParser(description="Inspect or play back a replay log.")
+    parser.add_argument("log", help="path of the replay log")
+    parser.add_argument("--gui", action="store_true", help="play a game back in the GUI")
+    parser.add_argument("--game", type=int, default=0, help="index of the game to play back")
+    parser.add_argument("--delay", type=int, default=200, help="milliseconds between steps in the GUI")
+    args = parser.parse_args(argv)
+
+    replays = load(args.log)
+    if args.gui:
+        from .gui import GUI, check_players
+        replay = replays[args.game]
+        try:
+            check_players(len(replay.names))
+        except ValueError as error:
+            parser.error(f"cannot play game {args.game} back: {error}")
+        gui = GUI(replay.new_game())
+        gui.play_replay(replay, args.delay)
+        gui.run()
+        return
+
+    for index, replay in enumerate(replays):
+        game = replay.final()
+        hands = ", ".join(f"{player.name}: {len(player.hand)}" for player in game.players)
+        print(f"Game {index}: {replay.rounds} rounds, {replay.outcome or 'unfinished'} ({hands})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""
+Seeded random number generators for shuffling decks.
+
+``SeededRandom`` is a ``random.Random`` that remembers its seed, so that any
+shuffle can be reproduced, and splits into independent streams: stream ``i``
+of seed ``s`` is the generator seeded with ``derive_seed(s, i)``, which is how
+``simulation.simulate`` seeds its games. Its shuffles are the same as those of
+``random.Random`` with the same seed, only faster.
+
+``PermutationBatch`` shuffles the decks of many streams at once into one
+reusable buffer of card ids, for bulk simulation.
+"""
+import os
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+STREAMS = 1 << 32  # streams per seed: the index fills the low 32 bits of the stream's seed
+
+
+def derive_seed(seed: int, index: int) -> int:
+    """
+    Derive the seed of a stream from the seed of its parent.
+
+    The parent's seed goes in the high bits and the index in the low 32 bits,
+    so distinct seeds and indexes give distinct stream seeds. Negative seeds
+    are rejected because ``random.Random`` seeds with their absolute value,
+    which would make stream ``i`` of ``-s`` the same as stream ``i`` of ``s``.
+
+    Args:
+        seed (int): The seed of the parent generator, at least 0.
+        index (int): The index of the stream, from 0 to ``STREAMS - 1``.
+
+    Returns:
+        int: The seed of the stream.
+
+    Raises:
+        ValueError: If the seed is negative or the index is out of range.
+    """
+    if seed < 0:
+        raise ValueError(f"Seeds must not be negative, got {seed}")
+    if not 0 <= index < STREAMS:
+        raise ValueError(f"Stream indexes must be from 0 to {STREAMS - 1}, got {index}")
+    return (seed << 32) | index
+
+
+# The swaps of a Fisher-Yates shuffle of each length: (position, bound, bits),
+# drawing the other position as ``random.Random._randbelow(bound)`` does
+_STEPS: Dict[int, Tuple[Tuple[int, int, int], ...]] = {}
+
+
+def _steps(size: int) -> Tuple[Tuple[int, int, int], ...]:
+    steps = _STEPS.get(size)
+    if steps is None:
+        steps = _STEPS[size] = tuple((i, i + 1, (i + 1).bit_length()) for i in reversed(range(1, size)))
+    return steps
+
+
+def _shuffle(items: list, getrandbits) -> None:
+    """Shuffle a list in place exactly as ``random.Random.shuffle`` does, with the calls inlined."""
+    for i, bound, bits in _steps(len(items)):
+        j = getrandbits(bits)
+        while j >= bound:
+            j = getrandbits(bits)
+        items[i], items[j] = items[j], items[i]
+
+
+def _matches_random_shuffle() -> bool:
+    """Check that ``_shuffle`` gives the shuffles of this Python's ``random.Random``."""
+    expected = list(range(104))
+    random.Random(1).shuffle(expected)
+    items = list(range(104))
+    _shuffle(items, random.Random(1).getrandbits)
+    return items == expected
+
+
+# Falls back to random.Random.shuffle should a Python version draw differently
+_FAST_SHUFFLE = _matches_random_shuffle()
+
+
+class SeededRandom(random.Random):
+    """
+    A ``random.Random`` that remembers its seed and splits into independent streams.
+
+    Each game can have its own generator, so concurrent games in a process do
+    not share random state, and every shuffle can be reproduced from the seed.
+    Seeding with None draws a seed from the operating system and records it.
+    The Mersenne Twister has no cheap jump-ahead, so streams are addressed by
+    index instead: ``jump(i)`` moves the generator to the start of stream
+    ``i`` of its seed in constant time, wherever it was.
+
+    Attributes:
+        root (int): The seed the generator was seeded with, which its streams derive from.
+        index (Optional[int]): The stream the generator is on, or None for the root seed itself.
+        spawned (int): The number of streams handed out by ``spawn``.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize a generator.
+
+        Args:
+            seed (Optional[int]): The seed. Default is None (a seed drawn from the operating system).
+        """
+        self.spawned = 0
+        super().__init__(seed)
+
+    def seed(self, a: Optional[int] = None, version: int = 2) -> None:
+        """
+        Seed the generator, as ``random.Random.seed`` does but recording the seed.
+
+        Args:
+            a (Optional[int]): The seed. Default is None (a seed drawn from the operating system).
+            version (int): Passed on to ``random.Random.seed``.
+
+        Raises:
+            TypeError: If the seed is not an integer or None.
+            ValueError: If the seed is negative (see ``derive_seed``).
+        """
+        if a is None:
+            a = int.from_bytes(os.urandom(8), 'little')
+        elif not isinstance(a, int):
+            raise TypeError("The seed must be an integer")
+        elif a < 0:
+            raise ValueError(f"Seeds must not be negative, got {a}")
+        self.root = a
+        self.index: Optional[int] = None
+        super().seed(a, version)
+
+    def jump(self, index: int) -> None:
+        """
+        Move the generator to the start of a stream of its seed.
+
+        Args:
+            index (int): The index of the stream, from 0 to ``STREAMS - 1``.
+        """
+        super().seed(derive_seed(self.root, index))
+        self.index = index
+
+    def stream(self, index: int) -> 'SeededRandom':
+        """
+        Get a new generator at the start of a stream of this generator's seed.
+
+        Args:
+            index (int): The index of the stream.
+
+        Returns:
+            SeededRandom: The generator, whose draws match
+                ``random.Random(derive_seed(root, index))``.
+        """
+        generator = SeededRandom(self.root)
+        generator.jump(index)
+        return generator
+
+    def spawn(self, count: int) -> List['SeededRandom']:
+        """
+        Get generators for the next streams not yet handed out.
+
+        Args:
+            count (int): The number of generators.
+
+        Returns:
+            List[SeededRandom]: Independent generators, on streams ``spawned``
+                to ``spawned + count - 1``.
+        """
+        start = self.spawned
+        self.spawned += count
+        return [self.stream(index) for index in range(start, start + count)]
+
+    def shuffle(self, x: list) -> None:
+        """
+        Shuffle a list in place, giving the same order as ``random.Random.shuffle``.
+
+        Args:
+            x (list): The list to shuffle.
+        """
+        if _FAST_SHUFFLE:
+            _shuffle(x, self.getrandbits)
+        else:
+            super().shuffle(x)
+
+
+class PermutationBatch:
+    """
+    Many shuffled decks at once, written into a reusable buffer.
+
+    Row ``i`` of a batch filled from seed ``s`` starting at ``start`` is the
+    order of the values after shuffling them with stream ``start + i`` of
+    ``s``, that is ``random.Random(derive_seed(s, start + i)).shuffle``. With
+    the card ids of an unshuffled deck as the values, the rows are the deals
+    ``simulation.simulate`` plays, one byte per card as ``encode_cards`` gives.
+
+        batch = PermutationBatch([card.id for card in Deck().cards], 1024)
+        for start in range(0, n_games, 1024):
+            deals = batch.fill(seed, start)
+
+    Attributes:
+        values (List[int]): The unshuffled values of a row, each below 256.
+        count (int): The number of rows.
+        buffer (bytearray): The rows, one after another.
+    """
+
+    def __init__(self, values: Sequence[int], count: int):
+        """
+        Initialize a batch.
+
+        Args:
+            values (Sequence[int]): The values to shuffle in each row, each below 256.
+            count (int): The number of rows.
+
+        Raises:
+            ValueError: If a value does not fit in a byte.
+        """
+        self.values = list(values)
+        if any(not 0 <= value < 256 for value in self.values):
+            raise ValueError("The values must fit in a byte")
+        self.count = count
+        self.buffer = bytearray(len(self.values) * count)
+        self._generator = random.Random()
+
+    def fill(self, seed: int, start: int = 0, count: Optional[int] = None) -> memoryview:
+        """
+        Shuffle rows into the buffer.
+
+        Args:
+            seed (int): The seed whose streams shuffle the rows.
+            start (int): The stream of the first row.
+            count (Optional[int]): The number of rows to fill. Default is all of them.
+
+        Returns:
+            memoryview: The filled rows.
+        """
+        if count is None:
+            count = self.count
+        size = len(self.values)
+        view = memoryview(self.buffer)[:count * size]
+        fill_permutations(view, self.values, seed, start, self._generator)
+        return view
+
+    def row(self, index: int) -> memoryview:
+        """
+        Get a row of the buffer.
+
+        Args:
+            index (int): The index of the row.
+
+        Returns:
+            memoryview: The row.
+        """
+        size = len(self.values)
+        return memoryview(self.buffer)[index * size:(index + 1) * size]
+
+
+def fill_permutations(out, values: Sequence[int], seed: int, start: int = 0,
+                      generator: Optional[random.Random] = None) -> None:
+    """
+    Write shuffled copies of values into a buffer, one row per stream of a seed.
+
+    This is what ``PermutationBatch.fill`` does, for a buffer that is already
+    there, such as shared memory.
+
+    Args:
+        out: A writable buffer of bytes whose length is a multiple of ``len(values)``.
+        values (Sequence[int]): The values to shuffle in each row, each below 256.
+        seed (int): The seed whose streams shuffle the rows.
+        start (int): The stream of the first row.
+        generator (Optional[random.Random]): A generator to reseed for each row. Default is a new one.
+    """
+    if generator is None:
+        generator = random.Random()
+    size = len(values)
+    values = list(values)
+    row = list(values)
+    reseed = generator.seed
+    getrandbits = generator.getrandbits
+    steps = _steps(size)
+    for offset in range(0, len(out), size):
+        reseed(derive_seed(seed, start + offset // size))
+        row[:] = values
+        if _FAST_SHUFFLE:
+            for i, bound, bits in steps:
+                j = getrandbits(bits)
+                while j >= bound:
+                    j = getrandbits(bits)
+                row[i], row[j] = row[j], row[i]
+        else:
+            generator.shuffle(row)
+        out[offset:offset + size] = bytes(row)
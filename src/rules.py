@@ -1,6 +1,7 @@
 from typing import Optional
 from .player import Player
 from .card import Card
+from .war import War
 
 class Rules:
     """
@@ -10,11 +11,17 @@ class Rules:
     resolving special situations like wars and speed wars.
 
     Attributes:
-        war_resolution_method (str): The method used to resolve wars ('standard', 'double', or 'quadruple').
+        war_resolution_method (str): The method used to resolve wars: '1', '2' or '3' cards
+            face down, 'speed', or the older names 'double' and 'quadruple'.
         use_double_deck (bool): Whether the game uses a double deck (104 cards).
         speed_war_enabled (bool): Whether the speed war rule is enabled.
+
+    Class Attributes:
+        WAR_CARDS (Dict[str, int]): The number of face-down cards for each war resolution method.
     """
 
+    WAR_CARDS = {'1': 1, '2': 2, '3': 3, 'speed': 1, 'standard': 1, 'double': 2, 'quadruple': 4}
+
     def __init__(self, war_resolution_method: str = '1', use_double_deck: bool = False, speed_war_enabled: bool = False):
         """
         Initialize a new rule set for the game.
@@ -28,56 +35,31 @@ class Rules:
         self.use_double_deck = use_double_deck
         self.speed_war_enabled = speed_war_enabled
 
-    def get_war_cards_to_play(self):
-        if self.war_resolution_method in ['1', '2', '3']:
-            return int(self.war_resolution_method)
-        elif self.war_resolution_method == 'speed':
-            return 1
-        else:
-            return 1
-        
+    def get_war_cards_to_play(self) -> int:
+        """
+        Get the number of cards each player puts face down in a war.
+
+        Returns:
+            int: The number of face-down cards. Unknown methods play one card.
+        """
+        return self.WAR_CARDS.get(self.war_resolution_method, 1)
+
     def resolve_war(self, player1: Player, player2: Player) -> Optional[Player]:
         """
         Resolve a war between two players.
 
-        This method implements the war resolution based on the chosen method.
+        Each player puts down ``get_war_cards_to_play()`` cards face down and
+        one face up, repeating until the face-up cards differ; the winner takes
+        every card played (see ``War.fight``).
 
         Args:
             player1 (Player): The first player in the war.
             player2 (Player): The second player in the war.
 
         Returns:
-            Optional[Player]: The winner of the war, or None if it's a tie or players run out of cards.
+            Optional[Player]: The winner of the war. A player who runs out of cards loses it.
         """
-        cards_to_play = 1  # Standard war
-
-        if self.war_resolution_method == 'double':
-            cards_to_play = 2
-        elif self.war_resolution_method == 'quadruple':
-            cards_to_play = 4
-
-        # Check if players have enough cards for the war
-        if player1.get_hand_size() < cards_to_play + 1 or player2.get_hand_size() < cards_to_play + 1:
-            return player1 if player1.get_hand_size() > player2.get_hand_size() else player2
-
-        # Play face-down cards
-        face_down_cards = []
-        for _ in range(cards_to_play):
-            face_down_cards.extend([player1.play_card(), player2.play_card()])
-
-        # Play face-up cards
-        card1 = player1.play_card()
-        card2 = player2.play_card()
-
-        if card1 > card2:
-            player1.receive_cards(face_down_cards + [card1, card2])
-            return player1
-        elif card2 > card1:
-            player2.receive_cards(face_down_cards + [card1, card2])
-            return player2
-        else:
-            # Another tie, recursively resolve
-            return self.resolve_war(player1, player2)
+        return War(self, player1.get_hand_size() + player2.get_hand_size()).fight((player1, player2))
 
     def is_speed_war(self, card1: Card, card2: Card) -> bool:
         """
@@ -95,7 +77,7 @@ class Rules:
         if self.war_resolution_method != 'speed':
             return False
         
-        rank_diff = abs(Card.RANKS.index(card1.rank) - Card.RANKS.index(card2.rank))
+        rank_diff = abs(card1.value - card2.value)
         return rank_diff == 1 or rank_diff == 12  # 12 for Ace-King adjacency
 
     def __str__(self) -> str:
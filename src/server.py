@@ -0,0 +1,717 @@
+"""
+An asyncio game server hosting many tables, with a line-delimited JSON protocol.
+
+Clients connect over TCP and send one JSON object per line; the server
+answers each with one JSON object per line, in order. Every request may
+carry an ``id``, which is echoed in its response. The operations are:
+
+- ``{"op": "create", "rules": {...}, "players": [...], "seed": 1}``: open a
+  table. ``rules`` holds ``Rules`` arguments (``war_resolution_method``,
+  ``use_double_deck``, ``speed_war_enabled``), ``players`` the player names
+  (default two, at most 52), ``seed`` the shuffle seed (default random), and
+  ``max_rounds`` and ``detect_cycles`` are passed to the ``Game``.
+- ``{"op": "play", "table": 1, "steps": 10}``: play up to ``steps`` rounds
+  or wars (default 1), stopping when the game is over.
+- ``{"op": "state", "table": 1}``: get the state of a table.
+- ``{"op": "close", "table": 1}``: close a table.
+- ``{"op": "watch", "table": 1}``: become a spectator of a table. The
+  response holds the ``state`` of the table and the sequence number ``q`` of
+  the last event in it; events with a higher ``q`` follow on the connection.
+- ``{"op": "unwatch", "table": 1}``: stop watching a table.
+- ``{"op": "stats"}``: get the number of tables, spectators and requests served.
+
+Successful responses have ``"ok": true`` and, for table operations, the
+``state`` of the table: the rounds played, whether a war is in progress, the
+outcome and winner, the number of cards in each hand, and the card shown in
+each seat (``"QH"`` for the queen of hearts). Failed requests get
+``"ok": false`` and an ``error`` message.
+
+Spectators get one line per event of the game, a delta from the previous one
+rather than the whole state, and tagged with ``ev`` so that they can be told
+apart from responses:
+
+- ``{"ev": "round", "t": 1, "q": 7, "n": 12, "c": ["QH", "4D"], "w": 0, "h": [1, -1]}``:
+  round ``n`` was played. ``c`` is the card each seat put down (null for
+  none), ``w`` the winning seat (null for a tie, which starts a war) and
+  ``h`` the change in the size of each hand.
+- ``{"ev": "war", "t": 1, "q": 8, "n": 12, "c": [...], "w": 1, "p": 10, "d": 1, "h": [-5, 5]}``:
+  a war was fought. ``c`` holds the face-up cards of the last face-up round,
+  null for the seats that were not in it (all null if a player lacking the
+  cards to go on lost the war), ``p`` is the size of the pot and ``d`` the
+  number of face-up rounds.
+- ``{"ev": "end", "t": 1, "q": 9, "o": "win", "w": 1}``: the game is over.
+- ``{"ev": "snapshot", "t": 1, "q": 9, "state": {...}}``: the whole state,
+  sent to a spectator that fell behind (see ``Broadcaster``).
+- ``{"ev": "closed", "t": 1}``: the table was closed.
+
+Idle tables are kept as ``Game.snapshot`` bytes, and only the most recently
+used ones as live ``Game`` objects, so an idle table costs about 1 KB and one
+process can hold many thousands of tables.
+
+    python -m src.server [--host 127.0.0.1] [--port 8765] [--unix PATH]
+"""
+import argparse
+import asyncio
+import json
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+from .card import Card
+from .game import Game, GameListener, GamePool
+from .rules import Rules
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_LIVE = 1024
+DEFAULT_MAX_TABLES = 100_000
+# Connections waiting to be accepted, enough for a crowd of spectators arriving at once
+BACKLOG = 1024
+MAX_STEPS = 10_000  # per play request, so that one request cannot stall the server
+DEFAULT_PLAYERS = ("Player 1", "Player 2")
+# Enough for every player to be dealt a card, and within what Game.snapshot can encode
+MAX_PLAYERS = len(Card.DECK)
+# The type of each option of the ``rules`` object of a create request
+RULE_TYPES = {'war_resolution_method': str, 'use_double_deck': bool, 'speed_war_enabled': bool}
+# Bytes waiting to be sent to a spectator before it is skipped, and before it is caught up again
+DEFAULT_HIGH_WATER = 256 * 1024
+DEFAULT_LOW_WATER = 64 * 1024
+
+
+class ProtocolError(Exception):
+    """A request that cannot be served. Its message is sent back to the client."""
+
+
+def card_code(card: Optional[Card]) -> Optional[str]:
+    """
+    Get the short code of a card, e.g. 'QH' for the queen of hearts.
+
+    Args:
+        card (Optional[Card]): The card.
+
+    Returns:
+        Optional[str]: The rank followed by the initial of the suit, or None for no card.
+    """
+    return None if card is None else f"{card.rank}{card.suit[0].upper()}"
+
+
+class TableEntry:
+    """
+    A table hosted by the server.
+
+    Attributes:
+        id (int): The table id.
+        names (Tuple[str, ...]): The names of the players.
+        rules (Rules): The rules of the game.
+        max_rounds (Optional[int]): The round cap of the game.
+        detect_cycles (bool): Whether games that repeat forever are ended.
+        game (Optional[Game]): The live game, or None while the table is stored as a snapshot.
+        snapshot (Optional[bytes]): The stored state while the game is not live.
+        broadcaster (Optional[Broadcaster]): The spectators of the table, or None if nobody watches it.
+    """
+
+    __slots__ = ('id', 'names', 'rules', 'max_rounds', 'detect_cycles', 'game', 'snapshot', 'broadcaster')
+
+    def __init__(self, table_id: int, game: Game, detect_cycles: bool):
+        self.id = table_id
+        self.names = tuple(player.name for player in game.players)
+        self.rules = game.rules
+        self.max_rounds = game.max_rounds
+        self.detect_cycles = detect_cycles
+        self.game: Optional[Game] = game
+        self.snapshot: Optional[bytes] = None
+        self.broadcaster: Optional[Broadcaster] = None
+
+
+class TableStore:
+    """
+    The tables of a server, with the most recently used ones kept live.
+
+    Attributes:
+        max_live (int): The number of tables kept as live ``Game`` objects,
+            besides the watched tables, which are always live.
+        max_tables (int): The number of tables that may be open at once.
+        created (int): The number of tables created so far.
+    """
+
+    def __init__(self, max_live: int = DEFAULT_MAX_LIVE, max_tables: int = DEFAULT_MAX_TABLES):
+        """
+        Initialize an empty store.
+
+        Args:
+            max_live (int): The number of tables kept as live ``Game`` objects, at least 1.
+            max_tables (int): The number of tables that may be open at once.
+
+        Raises:
+            ValueError: If ``max_live`` is less than 1, which would store a table
+                as soon as it is created.
+        """
+        if max_live < 1:
+            raise ValueError(f"max_live must be at least 1, got {max_live}")
+        self.max_live = max_live
+        self.max_tables = max_tables
+        self.created = 0
+        self._tables: Dict[int, TableEntry] = {}
+        # Games of closed and stored tables, reused for new and restored ones
+        self._pool = GamePool(max_size=max_live)
+        # Live tables, least recently used first
+        self._live: 'OrderedDict[int, TableEntry]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    @property
+    def live(self) -> int:
+        return len(self._live)
+
+    def create(self, names: List[str], rules: Rules, seed: Optional[int] = None,
+               max_rounds: Optional[int] = None, detect_cycles: bool = True) -> TableEntry:
+        """
+        Open a table with a shuffled and dealt game.
+
+        Raises:
+            ProtocolError: If too many tables are open.
+            ValueError: If the players or rules are invalid.
+        """
+        if len(self._tables) >= self.max_tables:
+            raise ProtocolError(f"Too many open tables ({self.max_tables})")
+        game = self._pool.acquire(*names, rules=rules, max_rounds=max_rounds, detect_cycles=detect_cycles,
+                                  seed=seed)
+        game.deal()
+        self.created += 1
+        entry = TableEntry(self.created, game, detect_cycles)
+        self._tables[entry.id] = entry
+        self._touch(entry)
+        return entry
+
+    def get(self, table_id: Any) -> Tuple[TableEntry, Game]:
+        """
+        Get a table and its live game, restoring the game from its snapshot if needed.
+
+        Raises:
+            ProtocolError: If there is no such table.
+        """
+        entry = self._tables.get(table_id)
+        if entry is None:
+            raise ProtocolError(f"No table {table_id!r}")
+        if entry.game is None:
+            entry.game = self._pool.acquire(*entry.names, rules=entry.rules, max_rounds=entry.max_rounds,
+                                            detect_cycles=entry.detect_cycles, snapshot=entry.snapshot)
+            entry.snapshot = None
+        self._touch(entry)
+        return entry, entry.game
+
+    def close(self, table_id: Any) -> None:
+        """
+        Close a table.
+
+        Raises:
+            ProtocolError: If there is no such table.
+        """
+        entry = self._tables.pop(table_id, None)
+        if entry is None:
+            raise ProtocolError(f"No table {table_id!r}")
+        self._live.pop(entry.id, None)
+        if entry.broadcaster is not None:
+            entry.broadcaster.close()
+            entry.broadcaster = None
+        if entry.game is not None:
+            self._pool.release(entry.game)
+            entry.game = None
+
+    def pin(self, entry: TableEntry) -> None:
+        """Keep a live table live, e.g. while it is watched, until ``unpin``."""
+        self._live.pop(entry.id, None)
+
+    def unpin(self, entry: TableEntry) -> None:
+        self._touch(entry)
+
+    def _touch(self, entry: TableEntry) -> None:
+        """Mark a live table as the most recently used, and store the least recently used ones."""
+        if entry.broadcaster is not None:
+            return  # Pinned
+        live = self._live
+        live[entry.id] = entry
+        live.move_to_end(entry.id)
+        while len(live) > self.max_live:
+            _, oldest = live.popitem(last=False)
+            oldest.snapshot = oldest.game.snapshot()
+            self._pool.release(oldest.game)
+            oldest.game = None
+
+
+def table_state(entry: TableEntry, game: Game) -> Dict[str, Any]:
+    """
+    Describe the state of a table for a client.
+
+    Args:
+        entry (TableEntry): The table.
+        game (Game): Its live game.
+
+    Returns:
+        Dict[str, Any]: The JSON-serializable state.
+    """
+    table = game.table
+    shown = table.cards if any(card is not None for card in table.cards) else table.last_cards
+    winner = game.get_winner()
+    return {
+        'table': entry.id,
+        'players': list(entry.names),
+        'rounds': game.rounds_played,
+        'war': game.war_in_progress,
+        'war_depth': game.war_depth,
+        'outcome': game.outcome,
+        'winner': None if winner is None else winner.name,
+        'hands': [len(player.hand) for player in game.players],
+        'cards': [card_code(card) for card in shown],
+    }
+
+
+def parse_rules(options: Any) -> Rules:
+    """
+    Build the rules of a table from the ``rules`` object of a request.
+
+    Raises:
+        ProtocolError: If the options are not valid ``Rules`` arguments.
+    """
+    if options is None:
+        return Rules()
+    if not isinstance(options, dict):
+        raise ProtocolError("rules must be an object")
+    for name, value in options.items():
+        expected = RULE_TYPES.get(name)
+        if expected is None:
+            raise ProtocolError(f"Invalid rules: unknown option {name!r}")
+        if not isinstance(value, expected):
+            raise ProtocolError(f"Invalid rules: {name} must be a {'string' if expected is str else 'boolean'}")
+    rules = Rules(**options)
+    if rules.war_resolution_method not in Rules.WAR_CARDS:
+        raise ProtocolError(f"Unknown war resolution method: {rules.war_resolution_method!r}")
+    return rules
+
+
+def is_integer(value: Any) -> bool:
+    """Check that a value from a request is an integer. JSON ``true`` and ``false`` are not."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def parse_table(request: Dict[str, Any]) -> int:
+    """
+    Get the table id of a request.
+
+    Raises:
+        ProtocolError: If the ``table`` of the request is not an integer.
+    """
+    table_id = request.get('table')
+    if not is_integer(table_id):
+        raise ProtocolError("table must be an integer")
+    return table_id
+
+
+class Spectator:
+    """
+    A connection watching one or more tables.
+
+    Attributes:
+        writer (asyncio.StreamWriter): The connection, whose transport is written to directly.
+        watching (Dict[int, Broadcaster]): The broadcaster of each table watched, by table id.
+        sent (int): The number of events sent.
+        skipped (int): The number of events skipped because the connection fell behind.
+        resyncs (int): The number of snapshots sent to catch up after skipping events.
+    """
+
+    __slots__ = ('writer', 'transport', 'watching', 'sent', 'skipped', 'resyncs', '_catching_up')
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.transport = writer.transport
+        self.watching: Dict[int, 'Broadcaster'] = {}
+        self.sent = 0
+        self.skipped = 0
+        self.resyncs = 0
+        self._catching_up: Optional[asyncio.Future] = None
+
+    def fell_behind(self) -> None:
+        """Catch up the tables this spectator fell behind on, once its backlog has been sent."""
+        if self._catching_up is None:
+            self._catching_up = asyncio.ensure_future(self._catch_up())
+
+    async def _catch_up(self) -> None:
+        try:
+            # Returns once the backlog is under the transport's low-water mark
+            await self.writer.drain()
+        except ConnectionError:
+            return
+        finally:
+            self._catching_up = None
+        for broadcaster in list(self.watching.values()):
+            broadcaster.catch_up(self)
+
+
+class Broadcaster(GameListener):
+    """
+    Sends the events of a table's game to its spectators, as deltas.
+
+    Each event is encoded once and queued until ``flush``, which writes all
+    the queued events to the transport of every spectator in one go, without
+    waiting for them to be sent, so spectators never hold up the game. A
+    spectator with more than ``high_water`` bytes waiting to be sent is
+    skipped instead; once its backlog falls under ``low_water``, it gets a
+    ``snapshot`` event and the deltas from there, even if the game has not
+    moved on since.
+
+    Attributes:
+        entry (TableEntry): The table.
+        spectators (Dict[Spectator, bool]): The spectators, and whether each one is behind.
+        seq (int): The sequence number of the last event.
+        hands (List[int]): The size of each hand after the last event.
+    """
+
+    def __init__(self, entry: TableEntry, high_water: int = DEFAULT_HIGH_WATER,
+                 low_water: int = DEFAULT_LOW_WATER):
+        """
+        Initialize a broadcaster without spectators.
+
+        Args:
+            entry (TableEntry): The table.
+            high_water (int): The backlog in bytes above which a spectator is skipped.
+            low_water (int): The backlog in bytes under which a skipped spectator is caught up.
+        """
+        self.entry = entry
+        self.high_water = high_water
+        self.low_water = low_water
+        self.spectators: Dict[Spectator, bool] = {}
+        self.seq = 0
+        self.hands: List[int] = []
+        self._pending: List[bytes] = []
+
+    def subscribe(self, spectator: Spectator) -> None:
+        self.spectators[spectator] = False
+        spectator.watching[self.entry.id] = self
+
+    def unsubscribe(self, spectator: Spectator) -> None:
+        self.spectators.pop(spectator, None)
+        spectator.watching.pop(self.entry.id, None)
+
+    def catch_up(self, spectator: Spectator) -> None:
+        """Send a snapshot to a spectator that fell behind."""
+        if self.spectators.get(spectator) and not spectator.transport.is_closing():
+            spectator.transport.write(self.snapshot_line(self.entry.game))
+            self.spectators[spectator] = False
+            spectator.resyncs += 1
+
+    def close(self) -> None:
+        """Tell the spectators that the table was closed, and drop them."""
+        line = json.dumps({'ev': 'closed', 't': self.entry.id}, separators=(',', ':')).encode() + b"\n"
+        for spectator in list(self.spectators):
+            if not spectator.transport.is_closing():
+                spectator.transport.write(line)
+            self.unsubscribe(spectator)
+
+    def game_started(self, game: Game) -> None:
+        self.hands = [len(player.hand) for player in game.players]
+
+    def round_played(self, game: Game, placed: List[Tuple[int, Card]], winner: Optional[int],
+                     pot_size: int) -> None:
+        cards: List[Optional[str]] = [None] * len(game.players)
+        for seat, card in placed:
+            cards[seat] = card_code(card)
+        self._publish(game, 'round', {'n': game.rounds_played, 'c': cards, 'w': winner})
+
+    def war_fought(self, game: Game, placed: List[Tuple[int, Card]], winner: Optional[int],
+                   pot_size: int) -> None:
+        self._publish(game, 'war', {'n': game.rounds_played,
+                                    'c': [card_code(card) for card in game.table.last_cards],
+                                    'w': winner, 'p': pot_size, 'd': game.war_depth})
+
+    def game_ended(self, game: Game) -> None:
+        winner = game.get_winner()
+        self._publish(game, 'end', {'o': game.outcome,
+                                    'w': None if winner is None else game.players.index(winner)})
+
+    def _publish(self, game: Game, kind: str, fields: Dict[str, Any]) -> None:
+        """Number an event, add the changes in the hand sizes to rounds and wars, and queue it."""
+        self.seq += 1
+        event = {'ev': kind, 't': self.entry.id, 'q': self.seq, **fields}
+        if kind != 'end':
+            hands = [len(player.hand) for player in game.players]
+            event['h'] = [new - old for new, old in zip(hands, self.hands)]
+            self.hands = hands
+        self._pending.append(json.dumps(event, separators=(',', ':')).encode() + b"\n")
+
+    def flush(self) -> None:
+        """Write the queued events to every spectator that keeps up."""
+        pending = self._pending
+        if not pending:
+            return
+        data = b"".join(pending)
+        count = len(pending)
+        pending.clear()
+        high_water = self.high_water
+        spectators = self.spectators
+        for spectator, behind in spectators.items():
+            transport = spectator.transport
+            if behind or transport.is_closing():
+                spectator.skipped += count
+            elif transport.get_write_buffer_size() > high_water:
+                spectators[spectator] = True
+                spectator.skipped += count
+                spectator.fell_behind()
+            else:
+                transport.write(data)
+                spectator.sent += count
+
+    def snapshot_line(self, game: Game) -> bytes:
+        """Encode a ``snapshot`` event with the whole state of the game, after the last event."""
+        return json.dumps({'ev': 'snapshot', 't': self.entry.id, 'q': self.seq,
+                           'state': table_state(self.entry, game)}, separators=(',', ':')).encode() + b"\n"
+
+
+class GameServer:
+    """
+    Serves the tables of a ``TableStore`` over the JSON-lines protocol.
+
+    Attributes:
+        tables (TableStore): The tables.
+        requests (int): The number of requests served.
+        connections (int): The number of clients connected.
+        high_water (int): The backlog in bytes above which a spectator is skipped.
+        low_water (int): The backlog in bytes under which a skipped spectator is caught up.
+    """
+
+    def __init__(self, tables: Optional[TableStore] = None, high_water: int = DEFAULT_HIGH_WATER,
+                 low_water: int = DEFAULT_LOW_WATER):
+        """
+        Initialize a server.
+
+        Args:
+            tables (Optional[TableStore]): The table store. Defaults to a new one.
+            high_water (int): The backlog in bytes above which a spectator is skipped.
+            low_water (int): The backlog in bytes under which a skipped spectator is caught up.
+        """
+        self.tables = tables if tables is not None else TableStore()
+        self.requests = 0
+        self.connections = 0
+        self.high_water = high_water
+        self.low_water = low_water
+        self._spectators: Set[Spectator] = set()
+        self._handlers = {
+            'create': self.op_create,
+            'play': self.op_play,
+            'state': self.op_state,
+            'close': self.op_close,
+            'watch': self.op_watch,
+            'unwatch': self.op_unwatch,
+            'stats': self.op_stats,
+        }
+
+    def handle(self, request: Any, spectator: Optional[Spectator] = None) -> Dict[str, Any]:
+        """
+        Serve one request.
+
+        Args:
+            request (Any): The decoded JSON request.
+            spectator (Optional[Spectator]): The connection the request came from, needed to watch tables.
+
+        Returns:
+            Dict[str, Any]: The response, with the request id if it had one.
+        """
+        self.requests += 1
+        response: Dict[str, Any]
+        try:
+            if not isinstance(request, dict):
+                raise ProtocolError("Requests must be JSON objects")
+            op = request.get('op')
+            if not isinstance(op, str):
+                raise ProtocolError("op must be a string")
+            handler = self._handlers.get(op)
+            if handler is None:
+                raise ProtocolError(f"Unknown op: {op!r}")
+            response = handler(request, spectator)
+            response['ok'] = True
+        except (ProtocolError, ValueError) as error:
+            response = {'ok': False, 'error': str(error)}
+        if isinstance(request, dict) and 'id' in request:
+            response['id'] = request['id']
+        return response
+
+    def op_create(self, request: Dict[str, Any], spectator: Optional[Spectator]) -> Dict[str, Any]:
+        names = request.get('players', list(DEFAULT_PLAYERS))
+        if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+            raise ProtocolError("players must be a list of names")
+        if len(names) > MAX_PLAYERS:
+            raise ProtocolError(f"A table has at most {MAX_PLAYERS} players")
+        seed = request.get('seed')
+        if seed is not None and (not is_integer(seed) or seed < 0):
+            raise ProtocolError("seed must be a non-negative integer")
+        max_rounds = request.get('max_rounds')
+        if max_rounds is not None and (not is_integer(max_rounds) or max_rounds < 1):
+            raise ProtocolError("max_rounds must be a positive integer")
+        detect_cycles = request.get('detect_cycles', True)
+        if not isinstance(detect_cycles, bool):
+            raise ProtocolError("detect_cycles must be a boolean")
+        entry = self.tables.create(names, parse_rules(request.get('rules')), seed, max_rounds, detect_cycles)
+        return {'state': table_state(entry, entry.game)}
+
+    def op_play(self, request: Dict[str, Any], spectator: Optional[Spectator]) -> Dict[str, Any]:
+        steps = request.get('steps', 1)
+        if not is_integer(steps) or not 1 <= steps <= MAX_STEPS:
+            raise ProtocolError(f"steps must be an integer from 1 to {MAX_STEPS}")
+        entry, game = self.tables.get(parse_table(request))
+        played = 0
+        while played < steps and game.outcome is None:
+            if game.war_in_progress:
+                game.resolve_war()
+            else:
+                game.play_round()
+            played += 1
+        if entry.broadcaster is not None:
+            entry.broadcaster.flush()
+        return {'played': played, 'state': table_state(entry, game)}
+
+    def op_state(self, request: Dict[str, Any], spectator: Optional[Spectator]) -> Dict[str, Any]:
+        entry, game = self.tables.get(parse_table(request))
+        return {'state': table_state(entry, game)}
+
+    def op_close(self, request: Dict[str, Any], spectator: Optional[Spectator]) -> Dict[str, Any]:
+        self.tables.close(parse_table(request))
+        return {}
+
+    def op_watch(self, request: Dict[str, Any], spectator: Optional[Spectator]) -> Dict[str, Any]:
+        if spectator is None:
+            raise ProtocolError("Only connected clients can watch tables")
+        entry, game = self.tables.get(parse_table(request))
+        broadcaster = entry.broadcaster
+        if broadcaster is None:
+            broadcaster = entry.broadcaster = Broadcaster(entry, self.high_water, self.low_water)
+            game.add_listener(broadcaster)
+            self.tables.pin(entry)
+        broadcaster.subscribe(spectator)
+        return {'q': broadcaster.seq, 'state': table_state(entry, game)}
+
+    def op_unwatch(self, request: Dict[str, Any], spectator: Optional[Spectator]) -> Dict[str, Any]:
+        table_id = parse_table(request)
+        broadcaster = spectator.watching.get(table_id) if spectator is not None else None
+        if broadcaster is None:
+            raise ProtocolError(f"Not watching table {table_id!r}")
+        self._unwatch(spectator, broadcaster)
+        return {}
+
+    def _unwatch(self, spectator: Spectator, broadcaster: Broadcaster) -> None:
+        """Remove a spectator from a table, and stop broadcasting the table once nobody watches it."""
+        broadcaster.unsubscribe(spectator)
+        entry = broadcaster.entry
+        if not broadcaster.spectators and entry.broadcaster is broadcaster:
+            entry.game.remove_listener(broadcaster)
+            entry.broadcaster = None
+            self.tables.unpin(entry)
+
+    def op_stats(self, request: Dict[str, Any], spectator: Optional[Spectator]) -> Dict[str, Any]:
+        spectators = [spectator for spectator in self._spectators if spectator.watching]
+        return {
+            'tables': len(self.tables),
+            'live': self.tables.live,
+            'created': self.tables.created,
+            'requests': self.requests,
+            'connections': self.connections,
+            'spectators': len(spectators),
+            'events_sent': sum(spectator.sent for spectator in self._spectators),
+            'events_skipped': sum(spectator.skipped for spectator in self._spectators),
+            'resyncs': sum(spectator.resyncs for spectator in self._spectators),
+        }
+
+    async def serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve the requests of one connection until it is closed."""
+        self.connections += 1
+        spectator = Spectator(writer)
+        writer.transport.set_write_buffer_limits(self.high_water, self.low_water)
+        self._spectators.add(spectator)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):
+                    break  # Line too long, or connection reset
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                except ValueError as error:
+                    response = {'ok': False, 'error': f"Invalid JSON: {error}"}
+                else:
+                    response = self.handle(request, spectator)
+                writer.write(json.dumps(response, separators=(',', ':')).encode() + b"\n")
+                await writer.drain()
+        finally:
+            self.connections -= 1
+            self._spectators.discard(spectator)
+            for broadcaster in list(spectator.watching.values()):
+                self._unwatch(spectator, broadcaster)
+            writer.close()
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                    path: Optional[str] = None) -> asyncio.AbstractServer:
+        """
+        Start listening.
+
+        Args:
+            host (str): The address to listen on.
+            port (int): The port to listen on, or 0 for any free port.
+            path (Optional[str]): A Unix socket to listen on instead of a TCP port.
+
+        Returns:
+            asyncio.AbstractServer: The listening server.
+        """
+        if path is not None:
+            return await asyncio.start_unix_server(self.serve_client, path, backlog=BACKLOG)
+        return await asyncio.start_server(self.serve_client, host, port, backlog=BACKLOG)
+
+
+async def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, max_live: int = DEFAULT_MAX_LIVE,
+                max_tables: int = DEFAULT_MAX_TABLES, path: Optional[str] = None,
+                high_water: int = DEFAULT_HIGH_WATER, low_water: int = DEFAULT_LOW_WATER) -> None:
+    """
+    Run a game server until it is cancelled.
+
+    The address it listens on is printed as ``listening on HOST:PORT``, or
+    ``listening on PATH`` for a Unix socket.
+    """
+    game_server = GameServer(TableStore(max_live, max_tables), high_water, low_water)
+    server = await game_server.start(host, port, path)
+    if path is not None:
+        print(f"listening on {path}", flush=True)
+    else:
+        address = server.sockets[0].getsockname()
+        print(f"listening on {address[0]}:{address[1]}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Command line entry point for the game server.
+    """
+    parser = argparse.ArgumentParser(description="Host games of Warzone: The Battle of Cards over TCP.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on (0 for any)")
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of a TCP port")
+    parser.add_argument("--max-live", type=int, default=DEFAULT_MAX_LIVE,
+                        help="tables kept as live games (1 or more); the others are stored as snapshots")
+    parser.add_argument("--max-tables", type=int, default=DEFAULT_MAX_TABLES, help="open tables allowed at once")
+    parser.add_argument("--high-water", type=int, default=DEFAULT_HIGH_WATER,
+                        help="bytes waiting to be sent to a spectator before it is skipped")
+    parser.add_argument("--low-water", type=int, default=DEFAULT_LOW_WATER,
+                        help="bytes waiting to be sent to a skipped spectator before it is caught up")
+    args = parser.parse_args(argv)
+    if args.max_live < 1:
+        parser.error("--max-live must be at least 1")
+    try:
+        asyncio.run(serve(args.host, args.port, args.max_live, args.max_tables, args.unix,
+                          args.high_water, args.low_water))
+    except KeyboardInterrupt:
+        print("stopped", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
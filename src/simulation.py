@@ -0,0 +1,304 @@
+import argparse
+import sys
+import time
+from typing import List, NamedTuple, Optional, Sequence
+from .card import Card
+from .game import Game, GameListener, GamePool
+from .rules import Rules
+from .rng import SeededRandom, derive_seed
+
+class GameResult(NamedTuple):
+    """
+    The outcome of a single simulated game.
+
+    Attributes:
+        winner (Optional[int]): The index of the winning player, or None if nobody won.
+        rounds (int): The number of rounds played.
+        wars (int): The number of wars fought.
+        max_war_depth (int): The longest chain of consecutive ties in a single war.
+        outcome (str): How the game ended: 'win', 'infinite' or 'capped' (see ``Game.outcome``).
+    """
+    winner: Optional[int]
+    rounds: int
+    wars: int
+    max_war_depth: int
+    outcome: str = 'win'
+
+
+DEFAULT_MAX_ROUNDS = 10000
+
+
+def game_seed(seed: int, index: int) -> int:
+    """
+    Derive the seed of a single game from the seed of a simulation run.
+
+    Every game gets its own seed, so a game can be replayed on its own and its
+    result does not depend on the games simulated before it. Game ``index`` is
+    shuffled by stream ``index`` of the run's ``rng.SeededRandom``.
+
+    Args:
+        seed (int): The seed of the simulation run.
+        index (int): The index of the game within the run.
+
+    Returns:
+        int: The seed for the game.
+
+    Raises:
+        ValueError: If the seed is negative or the index does not fit in 32 bits.
+    """
+    return derive_seed(seed, index)
+
+
+def encode_cards(cards: Sequence[Card]) -> bytes:
+    """
+    Encode cards as one byte per card.
+
+    A card's byte is its ``id``, its position in an unshuffled deck.
+
+    Args:
+        cards (Sequence[Card]): The cards to encode.
+
+    Returns:
+        bytes: The encoded cards.
+    """
+    return bytes(card.id for card in cards)
+
+
+def decode_cards(data: Sequence[int]) -> List[Card]:
+    """
+    Decode cards encoded by ``encode_cards``.
+
+    Args:
+        data (Sequence[int]): The encoded cards.
+
+    Returns:
+        List[Card]: The decoded cards.
+    """
+    deck = Card.DECK
+    return [deck[i] for i in data]
+
+
+def new_game(rules: Rules, seed: Optional[int] = None, deal: Optional[Sequence[int]] = None,
+             num_players: int = 2, pool: Optional[GamePool] = None, detect_cycles: bool = False) -> Game:
+    """
+    Create a shuffled and dealt game.
+
+    Args:
+        rules (Rules): The rule set for the game.
+        seed (Optional[int]): The seed for shuffling the deck. Default is None (unseeded).
+        deal (Optional[Sequence[int]]): The deck order encoded by ``encode_cards``.
+            When given, the deck is set to this order instead of being shuffled.
+        num_players (int): The number of players, named "Player 1", "Player 2" and so on.
+        pool (Optional[GamePool]): A pool to reuse a finished game from. Release
+            the game to the pool when it is over.
+        detect_cycles (bool): Whether to end games that would repeat forever.
+
+    Returns:
+        Game: A game that is ready for its first round.
+    """
+    names = [f"Player {seat + 1}" for seat in range(num_players)]
+    if pool is not None:
+        game = pool.acquire(*names, rules=rules, detect_cycles=detect_cycles, seed=seed)
+    else:
+        game = Game(*names, rules=rules, detect_cycles=detect_cycles)
+        if deal is None:
+            game.deck.rng = SeededRandom(seed)
+            game.shuffle()
+    if deal is not None:
+        game.deck.cards[:] = decode_cards(deal)
+    game.deal()
+    return game
+
+
+def play_game(game: Game, max_rounds: int = DEFAULT_MAX_ROUNDS, detect_cycles: bool = True) -> GameResult:
+    """
+    Play a dealt game to completion.
+
+    Args:
+        game (Game): The game to play.
+        max_rounds (int): The number of rounds after which the game is abandoned.
+        detect_cycles (bool): Whether to stop games that would repeat forever.
+
+    Returns:
+        GameResult: The outcome of the game.
+    """
+    wars = 0
+    max_war_depth = 0
+    play_round = game.play_round
+    resolve_war = game.resolve_war
+    game.max_rounds = max_rounds
+    if detect_cycles and game.cycle_detector is None:
+        game.enable_cycle_detection()
+
+    while game.outcome is None:
+        if game.war_in_progress:
+            resolve_war()
+            wars += 1
+            if game.war_depth > max_war_depth:
+                max_war_depth = game.war_depth
+        else:
+            play_round()
+
+    winner = game.get_winner()
+    return GameResult(
+        game.players.index(winner) if winner is not None else None,
+        game.rounds_played,
+        wars,
+        max_war_depth,
+        game.outcome,
+    )
+
+
+def simulate(n_games: int, rules: Optional[Rules] = None, seed: int = 0, max_rounds: int = DEFAULT_MAX_ROUNDS,
+             detect_cycles: bool = True, listeners: Sequence[GameListener] = (),
+             num_players: int = 2) -> List[GameResult]:
+    """
+    Simulate games headlessly, without any GUI.
+
+    Args:
+        n_games (int): The number of games to simulate.
+        rules (Optional[Rules]): The rule set for every game. Default is the standard rules.
+        seed (int): The seed of the run. The same seed always gives the same results.
+        max_rounds (int): The number of rounds after which a game is abandoned.
+        detect_cycles (bool): Whether to stop games that would repeat forever.
+        listeners (Sequence[GameListener]): Listeners added to every game after the deal,
+            e.g. a ``replay.ReplayWriter``.
+        num_players (int): The number of players in every game.
+
+    Returns:
+        List[GameResult]: The outcome of each game, in order.
+    """
+    if rules is None:
+        rules = Rules()
+    results = []
+    pool = GamePool(1)
+    for i in range(n_games):
+        game = new_game(rules, game_seed(seed, i), num_players=num_players, pool=pool,
+                        detect_cycles=detect_cycles)
+        for listener in listeners:
+            game.add_listener(listener)
+        results.append(play_game(game, max_rounds, detect_cycles))
+        pool.release(game)
+    return results
+
+
+def summarize(results: Sequence[GameResult]) -> str:
+    """
+    Summarize simulation results for display.
+
+    Args:
+        results (Sequence[GameResult]): The results to summarize.
+
+    Returns:
+        str: A multi-line summary of the results.
+    """
+    n_games = len(results)
+    if not n_games:
+        return "No games played"
+    finished = [r for r in results if r.winner is not None]
+    first_wins = sum(1 for r in finished if r.winner == 0)
+    infinite = sum(1 for r in results if r.outcome == 'infinite')
+    capped = sum(1 for r in results if r.outcome == 'capped')
+    return (f"Games: {n_games} ({infinite} infinite, {capped} hit the round cap)\n"
+            f"Player 1 wins: {first_wins / max(len(finished), 1):.2%}\n"
+            f"Rounds: mean {sum(r.rounds for r in results) / n_games:.1f}, "
+            f"max {max(r.rounds for r in results)}\n"
+            f"Wars: mean {sum(r.wars for r in results) / n_games:.1f}, "
+            f"max depth {max(r.max_war_depth for r in results)}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Command line entry point for headless simulation.
+    """
+    parser = argparse.ArgumentParser(description="Simulate games of Warzone: The Battle of Cards without the GUI.")
+    parser.add_argument("-n", "--games", type=int, default=1000, help="number of games to simulate")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="seed of the run (0 or more)")
+    parser.add_argument("-w", "--war", default="1", choices=["1", "2", "3", "speed"],
+                        help="war resolution method")
+    parser.add_argument("--double-deck", action="store_true", help="play with two decks")
+    parser.add_argument("--max-rounds", type=int, default=DEFAULT_MAX_ROUNDS,
+                        help="rounds after which a game is abandoned")
+    parser.add_argument("--no-cycle-detection", dest="detect_cycles", action="store_false",
+                        help="play games that repeat forever until the round cap (rounds are about 10%% "
+                             "cheaper, but endless games run to the cap, so runs usually take longer)")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="run on this many worker processes (0 for one per CPU)")
+    parser.add_argument("--record", metavar="PATH", help="write a replay log of every game (not with --workers)")
+    parser.add_argument("--stats", metavar="PATH",
+                        help="aggregate statistics without keeping per-game results, and write them "
+                             "as CSV (.csv) or JSON with histograms (any other extension)")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="time each phase of the game and write the metrics in the Prometheus text format "
+                             "(not with --workers)")
+    parser.add_argument("--metrics-interval", type=float, metavar="SECONDS",
+                        help="also log the metrics to stderr at this interval")
+    args = parser.parse_args(argv)
+    if args.seed < 0:
+        parser.error("--seed must not be negative")
+    if args.record and args.workers is not None:
+        parser.error("--record cannot be combined with --workers")
+    if (args.metrics or args.metrics_interval) and args.workers is not None:
+        parser.error("--metrics cannot be combined with --workers")
+
+    if args.metrics or args.metrics_interval:
+        from .metrics import Instrumentation, PeriodicLogger
+        with Instrumentation() as registry:
+            if args.metrics_interval:
+                with PeriodicLogger(registry, args.metrics_interval):
+                    run_cli(args)
+            else:
+                run_cli(args)
+        if args.metrics:
+            registry.write_prometheus(args.metrics)
+    else:
+        run_cli(args)
+
+
+def run_cli(args: argparse.Namespace) -> None:
+    """
+    Run the simulation requested on the command line and print its results.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments of ``main``.
+    """
+    rules = Rules(war_resolution_method=args.war, use_double_deck=args.double_deck)
+    start = time.perf_counter()
+    if args.stats:
+        from .stats import aggregate
+        if args.workers is not None:
+            from .parallel import run
+            aggregator = run(args.games, rules, args.seed, args.workers or None, args.max_rounds,
+                             detect_cycles=args.detect_cycles, collect_stats=True).stats
+        elif args.record:
+            from .replay import ReplayWriter
+            with ReplayWriter(args.record) as writer:
+                aggregator = aggregate(args.games, rules, args.seed, args.max_rounds, args.detect_cycles,
+                                       listeners=[writer])
+        else:
+            aggregator = aggregate(args.games, rules, args.seed, args.max_rounds, args.detect_cycles)
+        elapsed = time.perf_counter() - start
+        aggregator.write(args.stats)
+        print(aggregator.to_json())
+        rounds = sum(stats.rounds.total for stats in aggregator.stats.values())
+        print(f"Time: {elapsed:.2f}s ({rounds / elapsed:,.0f} rounds/s)", file=sys.stderr)
+        return
+
+    if args.record:
+        from .replay import ReplayWriter
+        with ReplayWriter(args.record) as writer:
+            results = simulate(args.games, rules, args.seed, args.max_rounds, args.detect_cycles, [writer])
+    elif args.workers is None:
+        results = simulate(args.games, rules, args.seed, args.max_rounds, args.detect_cycles)
+    else:
+        from .parallel import run
+        results = run(args.games, rules, args.seed, args.workers or None, args.max_rounds,
+                      detect_cycles=args.detect_cycles).results
+    elapsed = time.perf_counter() - start
+
+    print(summarize(results))
+    rounds = sum(r.rounds for r in results)
+    print(f"Time: {elapsed:.2f}s ({rounds / elapsed:,.0f} rounds/s)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
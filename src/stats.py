@@ -0,0 +1,451 @@
+"""
+Constant-memory statistics of simulation runs.
+
+``StatsAggregator`` is a ``GameListener`` that folds every game it sees into
+per-rules summaries as the games are played, so no per-game results are
+kept. Distributions are held in ``QuantileSketch`` objects, logarithmic
+histograms whose quantiles are accurate to within 1% and which merge
+exactly, so aggregators from separate worker processes can be combined.
+
+To aggregate a run and export the summary:
+
+    python -m src.simulation --games 1000000 --stats summary.json
+"""
+import csv
+import io
+import json
+import math
+from weakref import WeakKeyDictionary
+from typing import Dict, Iterable, List, Optional, Tuple
+from .card import Card
+from .game import Game, GameListener, GamePool
+from .rules import Rules
+from .simulation import DEFAULT_MAX_ROUNDS, game_seed, new_game, play_game
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+class QuantileSketch:
+    """
+    A mergeable histogram of non-negative values with logarithmic buckets.
+
+    A value ``v > 0`` is counted in bucket ``ceil(log(v) / log(gamma))``, where
+    ``gamma = (1 + a) / (1 - a)`` for a relative accuracy ``a``, and zeros are
+    counted separately. Every quantile is then within ``a`` of the true value
+    (relative), the memory is bounded by the logarithm of the largest value,
+    and two sketches with the same accuracy merge by adding their buckets.
+
+    Attributes:
+        relative_accuracy (float): The relative accuracy of the quantiles.
+        count (int): The number of values added.
+        total (float): The sum of the values added.
+        min (Optional[float]): The smallest value added, or None if there are none.
+        max (Optional[float]): The largest value added, or None if there are none.
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            relative_accuracy (float): The relative accuracy of the quantiles, between 0 and 1.
+
+        Raises:
+            ValueError: If the accuracy is not between 0 and 1.
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"Relative accuracy must be between 0 and 1, got {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float, weight: int = 1) -> None:
+        """
+        Add a value to the sketch.
+
+        Args:
+            value (float): The value, which must not be negative.
+            weight (int): The number of times to add it.
+        """
+        if value > 0:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self._buckets[index] = self._buckets.get(index, 0) + weight
+        else:
+            self._zeros += weight
+        self.count += weight
+        self.total += value * weight
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """
+        Add every value of another sketch to this one.
+
+        Args:
+            other (QuantileSketch): A sketch with the same relative accuracy.
+
+        Raises:
+            ValueError: If the sketches have different accuracies.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracies")
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self._zeros += other._zeros
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    @property
+    def mean(self) -> Optional[float]:
+        """The mean of the values, or None if there are none."""
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile of the values.
+
+        Args:
+            q (float): The quantile, between 0 and 1 (e.g. 0.99).
+
+        Returns:
+            Optional[float]: The estimate, or None if the sketch is empty.
+        """
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self._zeros
+        if rank < seen:
+            return 0.0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if rank < seen:
+                # The value in the middle of the bucket, in relative terms
+                estimate = 2 * self._gamma ** index / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def buckets(self) -> List[Tuple[float, float, int]]:
+        """
+        Get the histogram.
+
+        Returns:
+            List[Tuple[float, float, int]]: The lower bound, upper bound and count of each
+                non-empty bucket, in increasing order. Zeros have the bucket ``(0, 0)``.
+        """
+        result = [(0.0, 0.0, self._zeros)] if self._zeros else []
+        for index in sorted(self._buckets):
+            result.append((self._gamma ** (index - 1), self._gamma ** index, self._buckets[index]))
+        return result
+
+    def to_dict(self) -> dict:
+        """
+        Encode the sketch as JSON-compatible data, e.g. to send it between processes.
+        """
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'count': self.count,
+            'total': self.total,
+            'min': self.min,
+            'max': self.max,
+            'zeros': self._zeros,
+            'buckets': {str(index): count for index, count in self._buckets.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'QuantileSketch':
+        """
+        Decode a sketch encoded by ``to_dict``.
+        """
+        sketch = cls(data['relative_accuracy'])
+        sketch.count = data['count']
+        sketch.total = data['total']
+        sketch.min = data['min']
+        sketch.max = data['max']
+        sketch._zeros = data['zeros']
+        sketch._buckets = {int(index): count for index, count in data['buckets'].items()}
+        return sketch
+
+
+class GameStats:
+    """
+    The statistics of the games played under one rule set.
+
+    Attributes:
+        games (int): The number of games.
+        outcomes (Dict[str, int]): The number of games with each outcome (see ``Game.OUTCOMES``).
+        first_player_wins (int): The number of games won by the first player.
+        rounds (QuantileSketch): The number of rounds per game.
+        wars (QuantileSketch): The number of wars per game.
+        war_depth (QuantileSketch): The depth of every war.
+        pot_size (QuantileSketch): The number of cards won in every war.
+    """
+
+    METRICS = ('rounds', 'wars', 'war_depth', 'pot_size')
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        self.games = 0
+        self.outcomes = {outcome: 0 for outcome in Game.OUTCOMES}
+        self.first_player_wins = 0
+        for metric in self.METRICS:
+            setattr(self, metric, QuantileSketch(relative_accuracy))
+
+    @property
+    def first_player_win_rate(self) -> Optional[float]:
+        """The share of won games that the first player won, or None if no game was won."""
+        won = self.outcomes['win']
+        return self.first_player_wins / won if won else None
+
+    def merge(self, other: 'GameStats') -> None:
+        """
+        Add the games of another summary to this one.
+        """
+        self.games += other.games
+        for outcome, count in other.outcomes.items():
+            self.outcomes[outcome] += count
+        self.first_player_wins += other.first_player_wins
+        for metric in self.METRICS:
+            getattr(self, metric).merge(getattr(other, metric))
+
+    def summary(self) -> dict:
+        """
+        Summarize the statistics.
+
+        Returns:
+            dict: The game counts, the first player's win rate, and for every
+                metric its count, mean, min, quantiles and max.
+        """
+        result = {
+            'games': self.games,
+            'outcomes': dict(self.outcomes),
+            'first_player_win_rate': self.first_player_win_rate,
+        }
+        for metric in self.METRICS:
+            sketch = getattr(self, metric)
+            result[metric] = {'count': sketch.count, 'mean': sketch.mean, 'min': sketch.min}
+            for q in QUANTILES:
+                result[metric][f"p{round(q * 100)}"] = sketch.quantile(q)
+            result[metric]['max'] = sketch.max
+        return result
+
+    def to_dict(self) -> dict:
+        """
+        Encode the statistics as JSON-compatible data, including the full histograms.
+        """
+        return {
+            'games': self.games,
+            'outcomes': dict(self.outcomes),
+            'first_player_wins': self.first_player_wins,
+            **{metric: getattr(self, metric).to_dict() for metric in self.METRICS},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'GameStats':
+        """
+        Decode statistics encoded by ``to_dict``.
+        """
+        stats = cls()
+        stats.games = data['games']
+        stats.outcomes.update(data['outcomes'])
+        stats.first_player_wins = data['first_player_wins']
+        for metric in cls.METRICS:
+            setattr(stats, metric, QuantileSketch.from_dict(data[metric]))
+        return stats
+
+
+def rules_key(rules: Rules) -> str:
+    """
+    Get the name a rule set is aggregated under.
+
+    Args:
+        rules (Rules): The rule set.
+
+    Returns:
+        str: e.g. 'war=1 deck=single speed=off'.
+    """
+    return (f"war={rules.war_resolution_method} deck={'double' if rules.use_double_deck else 'single'} "
+            f"speed={'on' if rules.speed_war_enabled else 'off'}")
+
+
+class StatsAggregator(GameListener):
+    """
+    Aggregates the games it listens to, per rule set, in constant memory.
+
+    Add the aggregator to every game with ``Game.add_listener`` (or pass it to
+    ``simulation.simulate`` as a listener). Only the war count of the games in
+    progress is kept between events. It starts over whenever a game is dealt,
+    reset or restored, and is dropped with the game, so games abandoned before
+    their end are not counted and leave nothing behind. A pickled aggregator,
+    e.g. one returned by a worker process, holds only the finished games.
+
+    Attributes:
+        stats (Dict[str, GameStats]): The statistics of each rule set, by ``rules_key``.
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        """
+        Initialize an empty aggregator.
+
+        Args:
+            relative_accuracy (float): The relative accuracy of the quantiles.
+        """
+        self.relative_accuracy = relative_accuracy
+        self.stats: Dict[str, GameStats] = {}
+        # The wars of each game in progress so far
+        self._wars: 'WeakKeyDictionary[Game, int]' = WeakKeyDictionary()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state['_wars']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._wars = WeakKeyDictionary()
+
+    def _stats(self, game: Game) -> GameStats:
+        key = rules_key(game.rules)
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = GameStats(self.relative_accuracy)
+        return stats
+
+    def game_started(self, game: Game) -> None:
+        self._wars[game] = 0
+
+    def war_fought(self, game: Game, placed: List[Tuple[int, Card]], winner: Optional[int],
+                   pot_size: int) -> None:
+        stats = self._stats(game)
+        stats.war_depth.add(game.war_depth)
+        stats.pot_size.add(pot_size)
+        self._wars[game] = self._wars.get(game, 0) + 1
+
+    def game_ended(self, game: Game) -> None:
+        stats = self._stats(game)
+        stats.games += 1
+        stats.outcomes[game.outcome] += 1
+        if game.outcome == 'win' and game.get_winner() is game.players[0]:
+            stats.first_player_wins += 1
+        stats.rounds.add(game.rounds_played)
+        stats.wars.add(self._wars.pop(game, 0))
+
+    def merge(self, other: 'StatsAggregator') -> None:
+        """
+        Add the games of another aggregator, e.g. from a worker process, to this one.
+        """
+        for key, stats in other.stats.items():
+            if key in self.stats:
+                self.stats[key].merge(stats)
+            else:
+                self.stats[key] = GameStats.from_dict(stats.to_dict())
+
+    def to_dict(self) -> dict:
+        """
+        Encode the statistics as JSON-compatible data, including the full histograms.
+        """
+        return {'relative_accuracy': self.relative_accuracy,
+                'stats': {key: stats.to_dict() for key, stats in self.stats.items()}}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'StatsAggregator':
+        """
+        Decode an aggregator encoded by ``to_dict``.
+        """
+        aggregator = cls(data['relative_accuracy'])
+        aggregator.stats = {key: GameStats.from_dict(stats) for key, stats in data['stats'].items()}
+        return aggregator
+
+    def to_json(self, histograms: bool = False) -> str:
+        """
+        Export the summary of every rule set as JSON.
+
+        Args:
+            histograms (bool): Whether to include the histogram buckets of every metric.
+
+        Returns:
+            str: The JSON document.
+        """
+        document = {}
+        for key, stats in self.stats.items():
+            document[key] = stats.summary()
+            if histograms:
+                for metric in GameStats.METRICS:
+                    document[key][metric]['histogram'] = getattr(stats, metric).buckets()
+        return json.dumps(document, indent=2)
+
+    def to_csv(self) -> str:
+        """
+        Export the summary of every rule set as CSV, one row per rule set and metric.
+
+        Returns:
+            str: The CSV document.
+        """
+        quantiles = [f"p{round(q * 100)}" for q in QUANTILES]
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(['rules', 'games', 'first_player_win_rate', 'metric', 'count', 'mean', 'min',
+                         *quantiles, 'max'])
+        for key, stats in self.stats.items():
+            summary = stats.summary()
+            for metric in GameStats.METRICS:
+                row = summary[metric]
+                writer.writerow([key, stats.games, summary['first_player_win_rate'], metric, row['count'],
+                                 row['mean'], row['min'], *(row[q] for q in quantiles), row['max']])
+        return output.getvalue()
+
+    def write(self, path: str) -> None:
+        """
+        Write the summary to a file, as CSV if the path ends in '.csv' and as JSON otherwise.
+
+        Args:
+            path (str): The path of the file.
+        """
+        with open(path, "w", newline="") as file:
+            file.write(self.to_csv() if path.endswith(".csv") else self.to_json(histograms=True))
+
+
+def aggregate(n_games: int, rules: Optional[Rules] = None, seed: int = 0, max_rounds: int = DEFAULT_MAX_ROUNDS,
+              detect_cycles: bool = True, aggregator: Optional[StatsAggregator] = None,
+              listeners: Iterable[GameListener] = ()) -> StatsAggregator:
+    """
+    Simulate games and aggregate their statistics, without keeping per-game results.
+
+    The games are the same as those of ``simulation.simulate`` with the same arguments.
+
+    Args:
+        n_games (int): The number of games to simulate.
+        rules (Optional[Rules]): The rule set for every game. Default is the standard rules.
+        seed (int): The seed of the run.
+        max_rounds (int): The number of rounds after which a game is abandoned.
+        detect_cycles (bool): Whether to stop games that would repeat forever.
+        aggregator (Optional[StatsAggregator]): The aggregator to add the games to. Default is a new one.
+        listeners (Iterable[GameListener]): Other listeners to add to every game.
+
+    Returns:
+        StatsAggregator: The aggregator.
+    """
+    if rules is None:
+        rules = Rules()
+    if aggregator is None:
+        aggregator = StatsAggregator()
+    listeners = [aggregator, *listeners]
+    pool = GamePool(1)
+    for i in range(n_games):
+        game = new_game(rules, game_seed(seed, i), pool=pool, detect_cycles=detect_cycles)
+        for listener in listeners:
+            game.add_listener(listener)
+        play_game(game, max_rounds, detect_cycles)
+        pool.release(game)
+    return aggregator
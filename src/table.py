@@ -1,7 +1,44 @@
-from typing import Dict, List, Optional
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Sequence
 from .player import Player
 from .card import Card
 
+
+class SeatView(Mapping):
+    """
+    A read-only view of the cards on a table, keyed by player name.
+
+    Iterates over the names of the players with a card, in seat order. The view
+    follows the table as cards are placed and cleared.
+    """
+
+    __slots__ = ('_table', '_last')
+
+    def __init__(self, table: 'Table', last: bool):
+        self._table = table
+        self._last = last
+
+    def _cards(self) -> List[Optional[Card]]:
+        return self._table.last_cards if self._last else self._table.cards
+
+    def __getitem__(self, name: str) -> Card:
+        seat = self._table.seats.get(name)
+        card = self._cards()[seat] if seat is not None else None
+        if card is None:
+            raise KeyError(name)
+        return card
+
+    def __iter__(self) -> Iterator[str]:
+        names = self._table.names
+        return (names[seat] for seat, card in enumerate(self._cards()) if card is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for card in self._cards() if card is not None)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
 class Table:
     """
     Represents the game table in the card game.
@@ -9,16 +46,87 @@ class Table:
     This class manages the cards played in each round, determines the winner
     of each round, and handles the collection of played cards.
 
+    Cards are kept in fixed slots indexed by seat, next to their values, and the
+    slots of the current and the last round are swapped on ``clear``, so playing
+    rounds allocates nothing. Players placing a card under a name the table
+    does not know yet get the next free seat.
+
     Attributes:
-        played_cards (Dict[str, Card]): A dictionary mapping player names to their played cards.
+        names (List[str]): The name of the player in each seat.
+        seats (Dict[str, int]): The seat of each player, by name.
+        cards (List[Optional[Card]]): The card placed in each seat this round, or None.
+        values (List[int]): The value of each card in ``cards``, 0 for an empty seat.
+        last_cards (List[Optional[Card]]): The cards of the last round, by seat.
+        played_cards (SeatView): ``cards`` as a mapping from player name to card.
+        last_played_cards (SeatView): ``last_cards`` as a mapping from player name to card.
     """
 
-    def __init__(self):
+    def __init__(self, names: Sequence[str] = ()):
         """
         Initialize a new game table.
+
+        Args:
+            names (Sequence[str]): The names of the players, in seat order.
         """
-        self.played_cards: Dict[str, Card] = {}
-        self.last_played_cards: Dict[str, Card] = {} 
+        self.names: List[str] = []
+        self.seats: Dict[str, int] = {}
+        self.cards: List[Optional[Card]] = []
+        self.values: List[int] = []
+        self.last_cards: List[Optional[Card]] = []
+        self._last_values: List[int] = []
+        self._pot: List[Card] = []
+        self._played_view = SeatView(self, False)
+        self._last_played_view = SeatView(self, True)
+        for name in names:
+            self.seat(name)
+
+    def seat(self, name: str) -> int:
+        """
+        Get the seat of a player, seating them if they are new to the table.
+
+        Args:
+            name (str): The name of the player.
+
+        Returns:
+            int: The seat index.
+        """
+        seat = self.seats.get(name)
+        if seat is None:
+            seat = self.seats[name] = len(self.names)
+            self.names.append(name)
+            for slots in (self.cards, self.last_cards):
+                slots.append(None)
+            for slots in (self.values, self._last_values):
+                slots.append(0)
+        return seat
+
+    @property
+    def played_cards(self) -> SeatView:
+        return self._played_view
+
+    @played_cards.setter
+    def played_cards(self, cards: Mapping) -> None:
+        self._load(self.cards, self.values, cards)
+
+    @property
+    def last_played_cards(self) -> SeatView:
+        return self._last_played_view
+
+    @last_played_cards.setter
+    def last_played_cards(self, cards: Mapping) -> None:
+        self._load(self.last_cards, self._last_values, cards)
+
+    def _load(self, slots: List[Optional[Card]], values: List[int], cards: Mapping) -> None:
+        """Replace the cards in a set of slots with the cards of a name-to-card mapping."""
+        for name in cards:
+            self.seat(name)
+        for seat in range(len(slots)):
+            slots[seat] = None
+            values[seat] = 0
+        for name, card in cards.items():
+            seat = self.seats[name]
+            slots[seat] = card
+            values[seat] = card.value
 
     def place_card(self, player: Player, card: Card) -> None:
         """
@@ -28,27 +136,132 @@ class Table:
             player (Player): The player placing the card.
             card (Card): The card being placed on the table.
         """
-        self.played_cards[player.name] = card
+        self.place(self.seat(player.name), card)
+
+    def place(self, seat: int, card: Card) -> None:
+        """
+        Place a card on the table in a seat.
+
+        Args:
+            seat (int): The seat of the player placing the card.
+            card (Card): The card being placed on the table.
+        """
+        self.cards[seat] = card
+        self.values[seat] = card.value
 
     def clear(self) -> None:
         """
         Clear all cards from the table.
+
+        The cards become the last round's cards.
+        """
+        self.cards, self.last_cards = self.last_cards, self.cards
+        self.values, self._last_values = self._last_values, self.values
+        cards = self.cards
+        values = self.values
+        for seat in range(len(cards)):
+            cards[seat] = None
+            values[seat] = 0
+
+    def reset(self) -> None:
+        """
+        Clear the cards of this round and the last round, keeping the seats.
+        """
+        cards, values = self.cards, self.values
+        last_cards, last_values = self.last_cards, self._last_values
+        for seat in range(len(cards)):
+            cards[seat] = last_cards[seat] = None
+            values[seat] = last_values[seat] = 0
+
+    def load(self, cards: Sequence[Optional[Card]], last_cards: Sequence[Optional[Card]]) -> None:
+        """
+        Set the cards of this round and the last round, seat by seat.
+
+        Args:
+            cards (Sequence[Optional[Card]]): The card in each seat this round, or None.
+            last_cards (Sequence[Optional[Card]]): The card in each seat last round, or None.
+        """
+        for slots, values, source in ((self.cards, self.values, cards),
+                                      (self.last_cards, self._last_values, last_cards)):
+            for seat, card in enumerate(source):
+                slots[seat] = card
+                values[seat] = 0 if card is None else card.value
+
+    def copy(self) -> 'Table':
+        """
+        Get an independent copy of the table, with the same seats.
+
+        Returns:
+            Table: The copy.
+        """
+        table = Table(self.names)
+        table.load(self.cards, self.last_cards)
+        return table
+
+    def get_round_winner_seat(self) -> Optional[int]:
+        """
+        Get the seat of the player with the highest card this round.
+
+        When the table has been cleared, the last round's cards are used.
+
+        Returns:
+            Optional[int]: The winner's seat, or None if the highest card is tied or there are no cards.
         """
-        self.last_played_cards = self.played_cards.copy()  # Store the last played cards
-        self.played_cards.clear()  # Clear for the next round
+        values = self.values
+        best = 0
+        winner = None
+        for _ in range(2):
+            for seat, value in enumerate(values):
+                if value > best:
+                    best = value
+                    winner = seat
+                elif value == best:
+                    winner = None
+            if best:
+                return winner
+            values = self._last_values
+        return None
 
     def get_round_winner(self) -> Optional[str]:
-        cards_to_check = self.played_cards if self.played_cards else self.last_played_cards
-        if not cards_to_check:
-            return None
-        max_card = max(cards_to_check.values(), key=lambda card: card.get_value())
-        winners = [player for player, card in cards_to_check.items() if card.get_value() == max_card.get_value()]
-        return winners[0] if len(winners) == 1 else None
-    
+        seat = self.get_round_winner_seat()
+        return self.names[seat] if seat is not None else None
+
+    def tied_seats(self) -> List[int]:
+        """
+        Get the seats of the players tied for the highest card this round.
+
+        Returns:
+            List[int]: The seats in order, a single seat if nobody tied, or none if there are no cards.
+        """
+        tied = []
+        best = 0
+        for seat, value in enumerate(self.values):
+            if value > best:
+                best = value
+                tied.clear()
+                tied.append(seat)
+            elif value == best and value:
+                tied.append(seat)
+        return tied
+
     def collect_cards(self) -> List[Card]:
-        cards = list(self.played_cards.values()) + list(self.last_played_cards.values())
+        """
+        Take the cards of this round and the last round off the table.
+
+        Returns:
+            List[Card]: The cards in seat order, this round's first. The list is
+                reused by the next call, so give the cards away before then.
+        """
+        pot = self._pot
+        pot.clear()
+        for card in self.cards:
+            if card is not None:
+                pot.append(card)
+        for card in self.last_cards:
+            if card is not None:
+                pot.append(card)
         self.clear()
-        return cards
+        return pot
 
     def display_played_cards(self) -> Dict[str, str]:
         """
@@ -58,7 +271,7 @@ class Table:
             Dict[str, str]: A dictionary mapping player names to string representations of their played cards.
         """
         return {player: str(card) for player, card in self.played_cards.items()}
-    
+
     def __str__(self) -> str:
         """
         Get a string representation of the table.
@@ -76,4 +289,4 @@ class Table:
         Returns:
             str: A string describing the cards currently on the table.
         """
-        return " | ".join(f"{player}: {card}" for player, card in self.played_cards.items())
\ No newline at end of file
+        return " | ".join(f"{player}: {card}" for player, card in self.played_cards.items())
@@ -0,0 +1,85 @@
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+from .card import Card
+from .game import Game, GameListener
+from .replay import END, ROUND, apply_record, round_record, war_record
+
+DEFAULT_KEYFRAME_INTERVAL = 64
+
+
+class Timeline(GameListener):
+    """
+    The history of a game as it is played, for jumping back to any round.
+
+    Every round and war is kept as a replay record (see ``replay``), and a
+    ``Game.snapshot`` keyframe is taken every ``keyframe_interval`` rounds.
+    Seeking restores the last keyframe at or before the requested round and
+    applies the records from there, so it takes bounded time however long
+    the game is. Add the timeline to a game with ``Game.add_listener``; it
+    starts over whenever the game is dealt or restored.
+
+    Attributes:
+        keyframe_interval (int): The number of rounds between keyframes.
+        rounds (int): The number of rounds recorded.
+    """
+
+    def __init__(self, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL):
+        """
+        Initialize an empty timeline.
+
+        Args:
+            keyframe_interval (int): The number of rounds between keyframes.
+        """
+        self.keyframe_interval = keyframe_interval
+        self.rounds = 0
+        self._records: List[bytes] = []
+        # Round number, number of records before it and snapshot of each keyframe
+        self._keyframe_rounds: List[int] = []
+        self._keyframes: List[Tuple[int, bytes]] = []
+
+    def game_started(self, game: Game) -> None:
+        self.rounds = game.rounds_played
+        self._records.clear()
+        self._keyframe_rounds = [self.rounds]
+        self._keyframes = [(0, game.snapshot())]
+
+    def round_played(self, game: Game, placed: List[Tuple[int, Card]], winner: Optional[int],
+                     pot_size: int) -> None:
+        self._records.append(round_record(placed, winner, pot_size))
+        self.rounds = game.rounds_played
+        if self.rounds % self.keyframe_interval == 0:
+            self._keyframe_rounds.append(self.rounds)
+            self._keyframes.append((len(self._records), game.snapshot()))
+
+    def war_fought(self, game: Game, placed: List[Tuple[int, Card]], winner: Optional[int],
+                   pot_size: int) -> None:
+        self._records.append(war_record(placed, winner, pot_size, game.war_depth))
+
+    def game_ended(self, game: Game) -> None:
+        self._records.append(bytes([END, Game.OUTCOMES.index(game.outcome)]))
+
+    def seek(self, game: Game, rounds: int) -> Game:
+        """
+        Put a game in the state it was in after a number of rounds (and the war that followed, if any).
+
+        Args:
+            game (Game): A game with the same players and rules, e.g. a ``Game.clone``
+                of the recorded game. Its listeners are not notified.
+            rounds (int): The number of rounds played. Clamped to the recorded rounds.
+
+        Returns:
+            Game: The game passed in.
+        """
+        index = max(bisect_right(self._keyframe_rounds, rounds) - 1, 0)
+        position, snapshot = self._keyframes[index]
+        listeners, game.listeners = game.listeners, []
+        try:
+            game.restore(snapshot)
+            records = self._records
+            for i in range(position, len(records)):
+                if records[i][0] == ROUND and game.rounds_played >= rounds:
+                    break
+                apply_record(game, records[i])
+        finally:
+            game.listeners = listeners
+        return game
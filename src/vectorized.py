@@ -0,0 +1,348 @@
+"""
+Vectorized lockstep engine for simulating many two-player games at once.
+
+Every game's hands are integer rank arrays (2-14, as in ``Card.get_value``)
+held in circular queues, and all games advance together one round (or one
+war exchange) per step using NumPy array operations. The results match the
+object engine in ``game.Game`` for the same deals and seeds.
+
+This module requires NumPy (``pip install numpy``).
+"""
+from typing import List, Optional
+import numpy as np
+from .card import Card
+from .game import Game
+from .rng import fill_permutations
+from .rules import Rules
+from .simulation import DEFAULT_MAX_ROUNDS, GameResult
+
+DEFAULT_BATCH_SIZE = 4096
+
+# Hands are hashed as sum(value * HASH_BASE**i) mod HASH_MODULUS, which keeps
+# every intermediate product within int64
+HASH_MODULUS = (1 << 31) - 1
+HASH_BASE = 48271
+HASH_BASE_INVERSE = pow(HASH_BASE, HASH_MODULUS - 2, HASH_MODULUS)
+
+
+def deck_ranks(use_double_deck: bool = False) -> List[int]:
+    """
+    Get the card values of an unshuffled deck, in ``Deck`` order.
+
+    Args:
+        use_double_deck (bool): Whether to use two decks.
+
+    Returns:
+        List[int]: The value of every card in the deck.
+    """
+    ranks = [card.value for card in Card.DECK]
+    return ranks * 2 if use_double_deck else ranks
+
+
+def deal_ranks(n_games: int, rules: Rules, seed: int = 0, start: int = 0) -> np.ndarray:
+    """
+    Shuffle decks exactly as ``simulation.new_game`` does for the same seed.
+
+    Args:
+        n_games (int): The number of decks to shuffle.
+        rules (Rules): The rule set, which decides the deck size.
+        seed (int): The seed of the run.
+        start (int): The index of the first game.
+
+    Returns:
+        np.ndarray: An ``(n_games, deck_size)`` array of card values.
+    """
+    base = deck_ranks(rules.use_double_deck)
+    decks = np.empty((n_games, len(base)), dtype=np.int8)
+    fill_permutations(memoryview(decks).cast('B'), base, seed, start)
+    return decks
+
+
+def ranks_from_deals(deals: bytes, deck_size: int) -> np.ndarray:
+    """
+    Convert deck orders encoded by ``simulation.encode_cards`` to card values.
+
+    Args:
+        deals (bytes): The encoded deck orders, ``deck_size`` bytes per game.
+        deck_size (int): The number of cards in each deck.
+
+    Returns:
+        np.ndarray: An ``(n_games, deck_size)`` array of card values.
+    """
+    ids = np.frombuffer(deals, dtype=np.uint8).reshape(-1, deck_size)
+    return (ids % len(Card.RANKS) + 2).astype(np.int8)
+
+
+class BatchResults:
+    """
+    The outcome of a batch of games, one array entry per game.
+
+    Attributes:
+        winner (np.ndarray): The index of the winning player, or -1 if nobody won.
+        rounds (np.ndarray): The number of rounds played.
+        wars (np.ndarray): The number of wars fought.
+        max_war_depth (np.ndarray): The longest chain of consecutive ties in a single war.
+        outcome (np.ndarray): How each game ended, as an index into ``Game.OUTCOMES``.
+    """
+
+    def __init__(self, winner: np.ndarray, rounds: np.ndarray, wars: np.ndarray, max_war_depth: np.ndarray,
+                 outcome: np.ndarray):
+        self.winner = winner
+        self.rounds = rounds
+        self.wars = wars
+        self.max_war_depth = max_war_depth
+        self.outcome = outcome
+
+    def __len__(self) -> int:
+        return len(self.winner)
+
+    def to_list(self) -> List[GameResult]:
+        """
+        Convert the batch to ``GameResult`` tuples, as returned by ``simulation.simulate``.
+
+        Returns:
+            List[GameResult]: The outcome of each game, in order.
+        """
+        return [
+            GameResult(None if winner < 0 else winner, rounds, wars, depth, Game.OUTCOMES[outcome])
+            for winner, rounds, wars, depth, outcome in zip(
+                self.winner.tolist(), self.rounds.tolist(), self.wars.tolist(), self.max_war_depth.tolist(),
+                self.outcome.tolist())
+        ]
+
+
+def play(decks: np.ndarray, rules: Rules, max_rounds: int = DEFAULT_MAX_ROUNDS,
+         detect_cycles: bool = True) -> BatchResults:
+    """
+    Play a batch of games in lockstep until every game is won or abandoned.
+
+    Each deck is dealt alternately to the two players, as ``Deck.deal`` does.
+    Cycles are detected exactly as ``Game`` does (see ``cycle.CycleDetector``),
+    with one incrementally hashed checkpoint per game.
+
+    Args:
+        decks (np.ndarray): An ``(n_games, deck_size)`` array of card values.
+        rules (Rules): The rule set for every game.
+        max_rounds (int): The number of rounds after which a game is abandoned.
+        detect_cycles (bool): Whether to stop games that would repeat forever.
+
+    Returns:
+        BatchResults: The outcome of every game.
+    """
+    n_games, size = decks.shape
+    k = rules.get_war_cards_to_play()
+    half = size // 2
+
+    # Circular hand queues: hands[game, player, slot]
+    hands = np.zeros((n_games, 2, size), dtype=np.int8)
+    hands[:, 0, :half] = decks[:, 0:2 * half:2]
+    hands[:, 1, :half] = decks[:, 1:2 * half:2]
+    head = np.zeros((n_games, 2), dtype=np.int64)
+    count = np.full((n_games, 2), half, dtype=np.int64)
+
+    # Cards at stake in a war, in the order they were played
+    pot = np.zeros((n_games, size), dtype=np.int8)
+    pot_len = np.zeros(n_games, dtype=np.int64)
+    depth = np.zeros(n_games, dtype=np.int64)
+
+    winner = np.full(n_games, -1, dtype=np.int64)
+    rounds = np.zeros(n_games, dtype=np.int64)
+    wars = np.zeros(n_games, dtype=np.int64)
+    max_war_depth = np.zeros(n_games, dtype=np.int64)
+    outcome = np.zeros(n_games, dtype=np.int8)
+    at_war = np.zeros(n_games, dtype=bool)
+    active = np.arange(n_games)
+    offsets = np.arange(size)
+
+    # Hashes of the hands, and each game's cycle detection checkpoint
+    # (twice the deck, so that masked-out slots of a full pot still index it)
+    powers = np.ones(2 * size, dtype=np.int64)
+    for i in range(1, 2 * size):
+        powers[i] = powers[i - 1] * HASH_BASE % HASH_MODULUS
+    hashes = (hands.astype(np.int64) * powers[:size]).sum(axis=2) % HASH_MODULUS
+    saved = np.zeros(n_games, dtype=bool)
+    saved_hashes = np.zeros((n_games, 2), dtype=np.int64)
+    saved_counts = np.zeros((n_games, 2), dtype=np.int64)
+    saved_hands = np.zeros((n_games, 2, size), dtype=np.int8)
+    steps = np.zeros(n_games, dtype=np.int64)
+    power = np.ones(n_games, dtype=np.int64)
+
+    def give(games: np.ndarray, players: np.ndarray, cards: np.ndarray, lengths: np.ndarray) -> None:
+        # Append cards[i, :lengths[i]] to the bottom of player players[i]'s hand in game games[i]
+        tail = head[games, players] + count[games, players]
+        mask = offsets[:cards.shape[1]] < lengths[:, None]
+        slots = (tail[:, None] + offsets[:cards.shape[1]]) % size
+        rows, cols = np.nonzero(mask)
+        hands[games[rows], players[rows], slots[rows, cols]] = cards[rows, cols]
+        if detect_cycles:
+            terms = cards.astype(np.int64) * powers[count[games, players][:, None] + offsets[:cards.shape[1]]]
+            added = np.where(mask, terms % HASH_MODULUS, 0).sum(axis=1)
+            hashes[games, players] = (hashes[games, players] + added) % HASH_MODULUS
+        count[games, players] += lengths
+
+    def take(games: np.ndarray, player: int, cards: np.ndarray) -> None:
+        # Update the hashes for the top card of player's hand being taken in each game
+        if detect_cycles:
+            remaining = (hashes[games, player] - cards) % HASH_MODULUS
+            hashes[games, player] = remaining * HASH_BASE_INVERSE % HASH_MODULUS
+
+    def hand_values(games: np.ndarray) -> np.ndarray:
+        # The hands of each game, top card first, padded with zeros
+        slots = (head[games][:, :, None] + offsets) % size
+        values = hands[games[:, None, None], np.arange(2)[None, :, None], slots]
+        values[offsets >= count[games][:, :, None]] = 0
+        return values
+
+    def checkpoint(games: np.ndarray) -> None:
+        saved[games] = True
+        saved_hashes[games] = hashes[games]
+        saved_counts[games] = count[games]
+        saved_hands[games] = hand_values(games)
+        steps[games] = 0
+
+    def find_cycles(games: np.ndarray) -> np.ndarray:
+        # Brent's algorithm, one step for each game; returns the games found to repeat
+        first = ~saved[games]
+        checkpoint(games[first])
+        games = games[~first]
+        steps[games] += 1
+        candidates = games[(hashes[games] == saved_hashes[games]).all(axis=1)]
+        candidates = candidates[(count[candidates] == saved_counts[candidates]).all(axis=1)]
+        cycled = candidates[(hand_values(candidates) == saved_hands[candidates]).all(axis=(1, 2))]
+        rest = games[~np.isin(games, cycled)]
+        moved = rest[steps[rest] >= power[rest]]
+        power[moved] *= 2
+        checkpoint(moved)
+        return cycled
+
+    while len(active):
+        war_games = active[at_war[active]]
+        round_games = active[~at_war[active]]
+        # Games whose hands are at a round boundary, where cycles are checked
+        boundary = []
+
+        if len(round_games):
+            g = round_games
+            rounds[g] += 1
+            c0 = hands[g, 0, head[g, 0]]
+            c1 = hands[g, 1, head[g, 1]]
+            head[g] = (head[g] + 1) % size
+            count[g] -= 1
+            take(g, 0, c0)
+            take(g, 1, c1)
+
+            won = c0 != c1
+            wg = g[won]
+            pair = np.stack((c0[won], c1[won]), axis=1)
+            give(wg, (c1[won] > c0[won]).astype(np.int64), pair, np.full(len(wg), 2))
+            boundary.append(wg)
+
+            # A tie in the last allowed round is never resolved
+            tie = ~won & (rounds[g] < max_rounds)
+            tied = g[tie]
+            at_war[tied] = True
+            wars[tied] += 1
+            depth[tied] = 1
+            pot[tied, 0] = c0[tie]
+            pot[tied, 1] = c1[tie]
+            pot_len[tied] = 2
+
+        if len(war_games):
+            g = war_games
+            n0 = count[g, 0]
+            n1 = count[g, 1]
+            settled = np.full(len(g), -1, dtype=np.int64)
+
+            # A player without cards sits the war out and the other takes the pot
+            lone = (n0 == 0) | (n1 == 0)
+            settled[lone] = (n0[lone] == 0).astype(np.int64)
+
+            # A player who cannot put down enough cards loses the war
+            short = ~lone & ((n0 < k + 1) | (n1 < k + 1))
+            settled[short] = (n1[short] > n0[short]).astype(np.int64)
+
+            fight = ~lone & ~short
+            fg = g[fight]
+            if len(fg):
+                slots0 = (head[fg, 0][:, None] + offsets[:k + 1]) % size
+                slots1 = (head[fg, 1][:, None] + offsets[:k + 1]) % size
+                cards0 = hands[fg[:, None], 0, slots0]
+                cards1 = hands[fg[:, None], 1, slots1]
+                base = pot_len[fg][:, None]
+                rows = fg[:, None]
+                pot[rows, base + offsets[:k]] = cards0[:, :k]
+                pot[rows, base + k + offsets[:k]] = cards1[:, :k]
+                pot[fg, pot_len[fg] + 2 * k] = cards0[:, k]
+                pot[fg, pot_len[fg] + 2 * k + 1] = cards1[:, k]
+                pot_len[fg] += 2 * k + 2
+                head[fg] = (head[fg] + k + 1) % size
+                count[fg] -= k + 1
+                for j in range(k + 1):
+                    take(fg, 0, cards0[:, j])
+                    take(fg, 1, cards1[:, j])
+
+                up0 = cards0[:, k]
+                up1 = cards1[:, k]
+                result = np.where(up0 > up1, 0, np.where(up1 > up0, 1, -1))
+                tie = result < 0
+                depth[fg[tie]] += 1
+                # After a repeated tie, a player who ran out of cards leaves the war
+                left0 = tie & (count[fg, 0] == 0)
+                left1 = tie & (count[fg, 1] == 0) & ~left0
+                result[left0] = 1
+                result[left1] = 0
+                settled[fight] = result
+
+            done = settled >= 0
+            dg = g[done]
+            if len(dg):
+                give(dg, settled[done], pot[dg], pot_len[dg])
+                at_war[dg] = False
+                pot_len[dg] = 0
+                max_war_depth[dg] = np.maximum(max_war_depth[dg], depth[dg])
+                boundary.append(dg)
+
+        finished = (count[active] == size).any(axis=1)
+        winner[active[finished]] = np.argmax(count[active[finished]], axis=1)
+        stopped = finished.copy()
+        if detect_cycles and boundary:
+            boundary = np.concatenate(boundary)
+            cycled = find_cycles(boundary[(count[boundary] < size).all(axis=1)])
+            outcome[cycled] = Game.OUTCOMES.index('infinite')
+            stopped |= np.isin(active, cycled)
+        capped = ~stopped & ~at_war[active] & (rounds[active] >= max_rounds)
+        outcome[active[capped]] = Game.OUTCOMES.index('capped')
+        active = active[~stopped & ~capped]
+
+    return BatchResults(winner, rounds, wars, max_war_depth, outcome)
+
+
+def simulate(n_games: int, rules: Optional[Rules] = None, seed: int = 0, max_rounds: int = DEFAULT_MAX_ROUNDS,
+             batch_size: int = DEFAULT_BATCH_SIZE, detect_cycles: bool = True) -> BatchResults:
+    """
+    Simulate games with the vectorized engine.
+
+    The results are identical to ``simulation.simulate`` with the same arguments.
+
+    Args:
+        n_games (int): The number of games to simulate.
+        rules (Optional[Rules]): The rule set for every game. Default is the standard rules.
+        seed (int): The seed of the run.
+        max_rounds (int): The number of rounds after which a game is abandoned.
+        batch_size (int): The number of games advanced in lockstep at a time.
+        detect_cycles (bool): Whether to stop games that would repeat forever.
+
+    Returns:
+        BatchResults: The outcome of every game.
+    """
+    if rules is None:
+        rules = Rules()
+    batches = []
+    for start in range(0, n_games, batch_size):
+        decks = deal_ranks(min(batch_size, n_games - start), rules, seed, start)
+        batches.append(play(decks, rules, max_rounds, detect_cycles))
+    if not batches:
+        empty = np.zeros(0, dtype=np.int64)
+        return BatchResults(empty, empty, empty, empty, np.zeros(0, dtype=np.int8))
+    return BatchResults(*(np.concatenate([getattr(b, name) for b in batches])
+                          for name in ('winner', 'rounds', 'wars', 'max_war_depth', 'outcome')))
@@ -0,0 +1,156 @@
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, List, Optional
+from .card import Card
+from .player import Player
+from .table import Table
+
+if TYPE_CHECKING:
+    from .rules import Rules
+
+
+class War:
+    """
+    Plays out wars, shared by ``Game`` and ``Rules.resolve_war``.
+
+    A war is settled iteratively, however many times the face-up cards tie.
+    Every card at stake goes into a pot buffer allocated once, in the order it
+    was played: the cards that started the war, then each player's face-down
+    cards, then each player's face-up card, repeated for every tie. The winner
+    receives the whole pot at the bottom of their hand, so no card is ever
+    created or lost.
+
+    Attributes:
+        rules (Rules): The rule set deciding how many cards go face down.
+        pot (List[Optional[Card]]): The pot buffer, one slot per card in the game.
+        owners (List[Optional[Player]]): The player who put down each card of the
+            pot during the war (the cards at stake are not included).
+        pot_size (int): The number of cards in the pot of the last war.
+        depth (int): The number of face-up rounds the last war took to settle.
+    """
+
+    __slots__ = ('rules', 'pot', 'owners', 'pot_size', 'depth', '_contenders')
+
+    def __init__(self, rules: 'Rules', capacity: int):
+        """
+        Initialize a war engine.
+
+        Args:
+            rules (Rules): The rule set deciding how many cards go face down.
+            capacity (int): The number of cards in the game, which bounds the pot.
+        """
+        self.rules = rules
+        self.pot: List[Optional[Card]] = [None] * capacity
+        self.owners: List[Optional[Player]] = [None] * capacity
+        self.pot_size = 0
+        self.depth = 0
+        self._contenders: List[Player] = []
+
+    def fight(self, players: Iterable[Player], stake: Iterable[Card] = (),
+              table: Optional[Table] = None) -> Optional[Player]:
+        """
+        Play out a war until it is settled, and give the pot to the winner.
+
+        Players without cards sit the war out. A player who cannot put down the
+        face-down cards and a face-up card loses the war to the player with the
+        most cards. After a tie, only the players tied for the best face-up card
+        fight on, and those who ran out of cards leave the war; if all of them
+        ran out, the last of them stays in and takes the pot. The same goes for
+        a war that starts with nobody holding cards.
+
+        Args:
+            players (Iterable[Player]): The players in the war, in seat order.
+            stake (Iterable[Card]): The cards already at stake, e.g. the tied cards.
+            table (Optional[Table]): A table to place the face-up cards on, for display.
+                It is cleared before every face-up round after the first, so it
+                ends up showing only the cards of the players in the last one.
+
+        Returns:
+            Optional[Player]: The player who won the pot, or None if there were no players.
+        """
+        pot = self.pot
+        owners = self.owners
+        size = 0
+        for card in stake:
+            pot[size] = card
+            size += 1
+
+        contenders = self._contenders
+        contenders.clear()
+        last = None
+        for player in players:
+            last = player
+            if player.hand:
+                contenders.append(player)
+        if not contenders and last is not None:
+            contenders.append(last)
+        cards_down = self.rules.get_war_cards_to_play()
+        depth = 1
+        winner = None
+
+        while contenders:
+            if len(contenders) == 1:
+                winner = contenders[0]
+                break
+
+            # A player who cannot put down enough cards loses the war
+            winner = contenders[0]
+            short = False
+            for player in contenders:
+                hand_size = len(player.hand)
+                if hand_size <= cards_down:
+                    short = True
+                if hand_size > len(winner.hand):
+                    winner = player
+            if short:
+                break
+
+            # Each player puts down face-down cards, then a face-up card
+            for player in contenders:
+                play_card = player.play_card
+                for _ in range(cards_down):
+                    pot[size] = play_card()
+                    owners[size] = player
+                    size += 1
+            best_value = 0
+            tied = False
+            for player in contenders:
+                card = player.play_card()
+                pot[size] = card
+                owners[size] = player
+                size += 1
+                if table is not None:
+                    table.place_card(player, card)
+                if card.value > best_value:
+                    best_value = card.value
+                    winner = player
+                    tied = False
+                elif card.value == best_value:
+                    tied = True
+            if not tied:
+                break
+
+            # Another tie: only the players tied for the best card stay in the
+            # war, and of them, players who ran out of cards leave it
+            depth += 1
+            if table is not None:
+                table.clear()
+            first = size - len(contenders)
+            kept = 0
+            for k, player in enumerate(contenders):
+                if pot[first + k].value == best_value:
+                    contenders[kept] = player
+                    kept += 1
+            del contenders[kept:]
+            i = 0
+            while i < len(contenders):
+                if contenders[i].hand or len(contenders) == 1:
+                    i += 1
+                else:
+                    del contenders[i]
+
+        if winner is not None:
+            winner.receive_cards(islice(pot, size))
+        contenders.clear()
+        self.pot_size = size
+        self.depth = depth
+        return winner
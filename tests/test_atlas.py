@@ -0,0 +1,43 @@
+import os
+import shutil
+import tempfile
+import unittest
+from PIL import Image
+from src.atlas import AtlasSet, build_atlas
+
+SIZE = (20, 30)
+
+
+class TestAtlasSet(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.image_dir = os.path.join(self.root, "images")
+        self.atlas_dir = os.path.join(self.root, "atlas")
+        os.makedirs(self.image_dir)
+        self.add_image("AS", "red")
+        self.add_image("gray_back", "gray")
+        build_atlas(SIZE, self.image_dir, self.atlas_dir)
+        self.atlases = AtlasSet(self.image_dir, self.atlas_dir)
+
+    def add_image(self, name: str, color: str) -> None:
+        Image.new("RGB", (40, 60), color).save(os.path.join(self.image_dir, name + ".png"))
+
+    def test_image_added_after_the_atlas_was_opened_makes_it_stale(self):
+        self.assertIsNotNone(self.atlases.get("AS", SIZE))
+        self.add_image("KS", "blue")
+        self.assertIsNone(self.atlases.get("AS", SIZE))
+        self.assertIsNone(self.atlases.get("KS", SIZE))
+
+    def test_atlas_rebuilt_after_it_was_opened_is_used(self):
+        self.add_image("KS", "blue")
+        self.assertIsNone(self.atlases.get("KS", SIZE))
+        build_atlas(SIZE, self.image_dir, self.atlas_dir)
+        image = self.atlases.get("KS", SIZE)
+        self.assertIsNotNone(image)
+        self.assertEqual(image.getpixel((0, 0)), (0, 0, 255, 255))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from typing import List
+from src.card import Card
+from src.cycle import CycleDetector
+from src.game import Game
+
+
+def spades(ranks: List[str]) -> List[Card]:
+    """The spades with the given ranks, in order."""
+    return [next(card for card in Card.DECK if card.rank == rank and card.suit == 'Spades') for rank in ranks]
+
+
+def play(first: List[str], second: List[str], detect_cycles: bool, max_rounds: int = 1000) -> Game:
+    """Play a two-player game from the given hands, holding every card in play, until it ends."""
+    game = Game('A', 'B', max_rounds=max_rounds, detect_cycles=detect_cycles)
+    hands = [spades(first), spades(second)]
+    for player, hand in zip(game.players, hands):
+        player.receive_cards(hand)
+    game.deck.cards = hands[0] + hands[1]
+    while game.outcome is None:
+        if game.war_in_progress:
+            game.resolve_war()
+        else:
+            game.play_round()
+    return game
+
+
+class TestCycleDetector(unittest.TestCase):
+
+    def observe_all(self, detector: CycleDetector, states, fingerprint=lambda state: state) -> int:
+        """Feed states to the detector, returning how many it took to find a cycle (-1 if none)."""
+        for count, state in enumerate(states, 1):
+            if detector.observe(fingerprint(state), lambda: state):
+                return count
+        return -1
+
+    def test_repeating_sequence_is_detected_with_its_length(self):
+        detector = CycleDetector()
+        states = [0, 1, 2] + [3, 4, 5, 6, 7] * 20
+        self.assertNotEqual(self.observe_all(detector, states), -1)
+        self.assertEqual(detector.length, 5)
+
+    def test_sequence_without_repeats_is_not_detected(self):
+        detector = CycleDetector()
+        self.assertEqual(self.observe_all(detector, range(10000)), -1)
+        self.assertIsNone(detector.length)
+
+    def test_equal_fingerprints_are_confirmed_against_the_exact_state(self):
+        detector = CycleDetector()
+        self.assertEqual(self.observe_all(detector, range(1000), fingerprint=lambda state: 0), -1)
+
+    def test_reset_forgets_the_states_seen(self):
+        detector = CycleDetector()
+        self.observe_all(detector, [1, 2, 1, 2, 1, 2])
+        detector.reset()
+        self.assertIsNone(detector.length)
+        self.assertFalse(detector.observe(1, lambda: 1))
+
+
+class TestEndlessGames(unittest.TestCase):
+    REPEATING = (['6', 'K'], ['7', '10', '2', '4'])
+
+    def test_repeating_deal_ends_as_infinite(self):
+        game = play(*self.REPEATING, detect_cycles=True)
+        self.assertEqual(game.outcome, 'infinite')
+        self.assertIsNone(game.get_winner())
+        self.assertLess(game.rounds_played, 1000)
+
+        # The cards are of one suit, so there are no wars, and the hands come
+        # back to the same state after another cycle of rounds
+        state = game.hand_state()
+        game.outcome = None
+        for _ in range(game.cycle_detector.length):
+            game.play_round()
+        self.assertEqual(game.hand_state(), state)
+
+    def test_repeating_deal_is_capped_without_detection(self):
+        game = play(*self.REPEATING, detect_cycles=False)
+        self.assertEqual(game.outcome, 'capped')
+        self.assertEqual(game.rounds_played, 1000)
+
+    def test_normal_deal_is_won(self):
+        for detect_cycles in (False, True):
+            game = play(['A', 'K', '3'], ['2', 'Q', '4'], detect_cycles)
+            self.assertEqual(game.outcome, 'win')
+            self.assertIs(game.get_winner(), game.players[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
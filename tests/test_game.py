@@ -0,0 +1,197 @@
+import unittest
+from collections import deque
+from src.cycle import CycleDetector
+from src.deck import Deck
+from src.game import Game, GameListener, GamePool
+from src.player import Player
+from src.rng import SeededRandom
+from src.rules import Rules
+from src.simulation import play_game
+from src.table import Table
+from src.war import War
+
+NAMES = ("Player 1", "Player 2", "Player 3")
+
+
+def dealt_game(seed: int, rules: Rules = None, **options) -> Game:
+    """A new three-player game, shuffled with a seed and dealt."""
+    game = Game(*NAMES, rules=rules or Rules('2'), **options)
+    game.reset(seed)
+    game.deal()
+    return game
+
+
+def step(game: Game, steps: int) -> None:
+    """Play rounds and wars until some have been played or the game is over."""
+    for _ in range(steps):
+        if game.is_game_over():
+            return
+        if game.war_in_progress:
+            game.resolve_war()
+        else:
+            game.play_round()
+
+
+def play_until_war(game: Game) -> None:
+    """Play rounds until a war is about to be fought."""
+    while not game.war_in_progress and not game.is_game_over():
+        game.play_round()
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def test_restored_game_plays_on_exactly_as_the_original(self):
+        for seed in range(10):
+            # Snapshots between rounds and with a war about to be fought
+            for stop in (lambda game: None, play_until_war):
+                game = dealt_game(seed)
+                step(game, 40)
+                stop(game)
+                data = game.snapshot()
+                restored = Game(*NAMES, rules=game.rules)
+                restored.restore(data)
+                self.assertEqual(restored.snapshot(), data)
+
+                self.assertEqual(play_game(restored, 2000), play_game(game, 2000))
+                self.assertEqual(restored.snapshot(), game.snapshot())
+
+    def test_snapshot_before_the_deal_holds_the_deck_order(self):
+        game = Game(*NAMES)
+        game.reset(7)
+        restored = Game(*NAMES)
+        restored.restore(game.snapshot())
+        self.assertEqual([card.id for card in restored.deck.cards], [card.id for card in game.deck.cards])
+        game.deal()
+        restored.deal()
+        self.assertEqual(restored.snapshot(), game.snapshot())
+
+    def test_snapshot_of_another_number_of_players_is_rejected(self):
+        game = dealt_game(1)
+        with self.assertRaises(ValueError):
+            Game("A", "B").restore(game.snapshot())
+        with self.assertRaises(ValueError):
+            Game(*NAMES).restore(game.snapshot()[:-1])
+
+
+class TestClone(unittest.TestCase):
+
+    def test_clone_diverges_without_changing_the_original(self):
+        game = dealt_game(3, detect_cycles=True)
+        step(game, 25)
+        play_until_war(game)
+        before = game.snapshot()
+
+        clone = game.clone()
+        self.assertEqual(clone.snapshot(), before)
+        clone.players[0].hand.rotate(1)
+        play_game(clone)
+        self.assertIsNotNone(clone.outcome)
+        self.assertEqual(game.snapshot(), before)
+        self.assertIsNone(game.outcome)
+
+    def test_clone_shares_no_mutable_state_but_the_rules(self):
+        game = dealt_game(4, detect_cycles=True)
+        step(game, 10)
+        clone = game.clone()
+        mutable = (list, dict, set, deque, Deck, Player, Table, War, CycleDetector)
+        for name, value in vars(clone).items():
+            if isinstance(value, mutable):
+                self.assertIsNot(value, getattr(game, name), name)
+        for original, copy in zip(game.players, clone.players):
+            self.assertIsNot(copy.hand, original.hand)
+        self.assertIs(clone.rules, game.rules)
+        self.assertEqual(clone.listeners, [])
+
+
+class TestReset(unittest.TestCase):
+
+    def test_reset_game_equals_a_new_game_with_the_seed(self):
+        for rules in (Rules('2'), Rules('1', use_double_deck=True)):
+            game = dealt_game(1, rules, detect_cycles=True)
+            play_game(game)
+            for seed in (5, 6):
+                game.reset(seed)
+                new = Game(*NAMES, rules=rules, detect_cycles=True, rng=SeededRandom(seed))
+                new.shuffle()
+                self.assertEqual(game.snapshot(), new.snapshot())
+                game.deal()
+                new.deal()
+                self.assertEqual(play_game(game), play_game(new))
+                self.assertEqual(game.snapshot(), new.snapshot())
+
+    def test_reset_takes_a_change_of_deck_size(self):
+        game = dealt_game(1, Rules('2'))
+        step(game, 30)
+        game.rules.use_double_deck = True
+        game.reset(2)
+        self.assertEqual(len(game.deck.cards), 2 * 52)
+        self.assertEqual(len(set(map(id, game.deck.cards))), len(game.deck.cards) // 2)
+        self.assertEqual(game.table.cards, [None] * len(NAMES))
+        self.assertEqual(game.table.last_cards, [None] * len(NAMES))
+
+
+class Recorder(GameListener):
+
+    def __init__(self):
+        self.events = 0
+
+    def round_played(self, game, placed, winner, pot_size):
+        self.events += 1
+
+
+class TestGamePool(unittest.TestCase):
+
+    def test_pooled_game_carries_nothing_over(self):
+        pool = GamePool()
+        rules = Rules('2')
+        game = pool.acquire(*NAMES, rules=rules, max_rounds=300, detect_cycles=True, seed=1)
+        recorder = Recorder()
+        game.add_listener(recorder)
+        game.deal()
+        play_game(game, 300)
+        pool.release(game)
+        events = recorder.events
+
+        other_rules = Rules('quadruple')
+        reused = pool.acquire(*NAMES, rules=other_rules, seed=2)
+        self.assertIs(reused, game)
+        self.assertEqual(len(pool), 0)
+        new = Game(*NAMES, rules=other_rules, rng=SeededRandom(2))
+        new.shuffle()
+        self.assertEqual(reused.snapshot(), new.snapshot())
+        self.assertIs(reused.rules, other_rules)
+        self.assertIs(reused.war.rules, other_rules)
+        self.assertIsNone(reused.max_rounds)
+        self.assertIsNone(reused.cycle_detector)
+        self.assertIsNone(reused.outcome)
+        self.assertEqual(reused.listeners, [])
+
+        reused.deal()
+        new.deal()
+        self.assertEqual(play_game(reused, 2000, False), play_game(new, 2000, False))
+        self.assertEqual(recorder.events, events)
+
+    def test_pooled_game_restarts_cycle_detection(self):
+        pool = GamePool()
+        game = pool.acquire(*NAMES, rules=Rules('2'), detect_cycles=True, seed=1)
+        game.deal()
+        play_game(game)
+        pool.release(game)
+        reused = pool.acquire(*NAMES, rules=Rules('2'), detect_cycles=True, seed=3)
+        self.assertIs(reused, game)
+        self.assertIsNone(reused.cycle_detector.length)
+        reused.deal()
+        new = dealt_game(3, detect_cycles=True)
+        self.assertEqual(play_game(reused), play_game(new))
+
+    def test_games_of_other_players_or_deck_sizes_are_not_reused(self):
+        pool = GamePool()
+        game = pool.acquire(*NAMES, seed=1)
+        pool.release(game)
+        self.assertIsNot(pool.acquire("A", "B", seed=1), game)
+        self.assertIsNot(pool.acquire(*NAMES, rules=Rules(use_double_deck=True), seed=1), game)
+        self.assertIs(pool.acquire(*NAMES, seed=1), game)
+
+
+if __name__ == '__main__':
+    unittest.main()
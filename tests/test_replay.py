@@ -0,0 +1,36 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from src.replay import ReplayWriter, load, main
+from src.rules import Rules
+from src.simulation import simulate
+
+
+class TestReplayGui(unittest.TestCase):
+
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        self.log = os.path.join(root, "games.wzr")
+        with ReplayWriter(self.log) as writer:
+            simulate(1, Rules(), 1, max_rounds=50, listeners=[writer], num_players=3)
+
+    def test_game_of_more_than_two_players_is_refused_before_the_window_opens(self):
+        self.assertEqual(len(load(self.log)[0].names), 3)
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr), self.assertRaises(SystemExit):
+            main([self.log, "--gui"])
+        self.assertIn("games of 2 players, not 3", stderr.getvalue())
+
+    def test_game_of_more_than_two_players_can_be_summarized(self):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            main([self.log])
+        self.assertIn("Game 0: 50 rounds", stdout.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import math
+import random
+import unittest
+from typing import List, Sequence
+from src.card import Card
+from src.deck import Deck
+from src.game import Game
+from src.rng import STREAMS, PermutationBatch, SeededRandom, derive_seed
+
+DECKS = 20000  # permutations in the statistical checks
+Z_LIMIT = 4.0  # largest |z| that passes; the decks come from fixed seeds, so the checks never flake
+
+
+def chi_square_z(statistic: float, dof: int) -> float:
+    """The z-score of a chi-square statistic (Wilson-Hilferty approximation)."""
+    scale = 2 / (9 * dof)
+    return ((statistic / dof) ** (1 / 3) - (1 - scale)) / math.sqrt(scale)
+
+
+def poisson_z(observed: List[int], mean: float = 1.0, buckets: int = 5) -> float:
+    """Chi-square z-score of counts against a Poisson distribution, the last bucket open."""
+    n = len(observed)
+    histogram = [0] * buckets
+    for value in observed:
+        histogram[min(value, buckets - 1)] += 1
+    probabilities = [math.exp(-mean) * mean ** k / math.factorial(k) for k in range(buckets - 1)]
+    probabilities.append(1 - sum(probabilities))
+    statistic = sum((seen - n * p) ** 2 / (n * p) for seen, p in zip(histogram, probabilities))
+    return chi_square_z(statistic, buckets - 1)
+
+
+def rows(buffer: Sequence[int], size: int) -> List[Sequence[int]]:
+    return [buffer[offset:offset + size] for offset in range(0, len(buffer), size)]
+
+
+class TestStreams(unittest.TestCase):
+
+    def test_distinct_seeds_and_indexes_give_distinct_streams(self):
+        self.assertNotEqual(derive_seed(0, STREAMS - 1), derive_seed(1, 0))
+        with self.assertRaises(ValueError):
+            derive_seed(0, STREAMS)
+        with self.assertRaises(ValueError):
+            derive_seed(0, -1)
+
+    def test_negative_seeds_are_rejected(self):
+        # random.Random seeds with the absolute value, so -1 would repeat the streams of 1
+        with self.assertRaises(ValueError):
+            derive_seed(-1, 0)
+        with self.assertRaises(ValueError):
+            SeededRandom(-1)
+
+    def test_streams_keep_the_seeds_of_simulation_runs(self):
+        self.assertEqual(derive_seed(3, 7), (3 << 32) ^ 7)
+        self.assertEqual(SeededRandom(3).stream(7).random(), random.Random((3 << 32) ^ 7).random())
+
+
+
+class TestReproducibility(unittest.TestCase):
+
+    def test_shuffles_match_random_random(self):
+        for size in (2, 52, 104):
+            for seed in range(200):
+                expected = list(range(size))
+                random.Random(seed).shuffle(expected)
+                shuffled = list(range(size))
+                SeededRandom(seed).shuffle(shuffled)
+                self.assertEqual(shuffled, expected)
+
+    def test_batch_rows_are_the_shuffles_of_their_streams(self):
+        ids = [card.id for card in Deck(2).cards]
+        batch = PermutationBatch(ids, 100)
+        filled = rows(batch.fill(7, 1000), len(ids))
+        for index, row in enumerate(filled):
+            expected = list(ids)
+            random.Random(derive_seed(7, 1000 + index)).shuffle(expected)
+            self.assertEqual(list(row), expected)
+            self.assertEqual(list(batch.row(index)), expected)
+
+    def test_a_game_is_reproduced_from_its_recorded_seed(self):
+        game = Game("Player 1", "Player 2")
+        game.reset()
+        replay = Game("Player 1", "Player 2", rng=SeededRandom(game.deck.rng.root))
+        replay.shuffle()
+        self.assertEqual(replay.deck.cards, game.deck.cards)
+
+    def test_spawned_streams_are_the_next_indexes(self):
+        parent = SeededRandom(5)
+        first, second = parent.spawn(2)
+        third, = parent.spawn(1)
+        self.assertEqual([first.index, second.index, third.index], [0, 1, 2])
+        jumped = SeededRandom(5)
+        jumped.jump(1)
+        self.assertEqual(jumped.getstate(), second.getstate())
+
+
+class TestPermutationQuality(unittest.TestCase):
+    SIZE = len(Card.DECK)
+
+    @classmethod
+    def setUpClass(cls):
+        size = cls.SIZE
+        cls.decks = rows(PermutationBatch(range(size), DECKS).fill(0), size)
+        cls.next_seed = rows(PermutationBatch(range(size), DECKS).fill(1), size)
+
+    def assertPlausible(self, z: float):
+        self.assertLessEqual(abs(z), Z_LIMIT)
+
+    def test_every_card_is_equally_likely_at_every_position(self):
+        size = self.SIZE
+        counts = [[0] * size for _ in range(size)]
+        for deck in self.decks:
+            for position, card in enumerate(deck):
+                counts[position][card] += 1
+        expected = len(self.decks) / size
+        statistic = sum((count - expected) ** 2 for row in counts for count in row) / expected
+        # Rows and columns both sum to the number of decks
+        self.assertPlausible(chi_square_z(statistic, (size - 1) ** 2))
+
+    def test_fixed_points_are_poisson(self):
+        self.assertPlausible(poisson_z([sum(card == position for position, card in enumerate(deck))
+                                        for deck in self.decks]))
+
+    def test_ascents_have_the_expected_mean(self):
+        # Mean (n - 1) / 2 and variance (n + 1) / 12 for uniform permutations
+        size = self.SIZE
+        total = sum(sum(deck[i] < deck[i + 1] for i in range(size - 1)) for deck in self.decks)
+        mean = (size - 1) / 2
+        self.assertPlausible((total / len(self.decks) - mean) / math.sqrt((size + 1) / 12 / len(self.decks)))
+
+    def test_neighbouring_streams_are_unrelated(self):
+        # Cards at the same position in two independent permutations are about Poisson(1)
+        pairs = zip(self.decks, self.decks[1:])
+        self.assertPlausible(poisson_z([sum(a == b for a, b in zip(*pair)) for pair in pairs]))
+
+    def test_the_same_stream_of_neighbouring_seeds_is_unrelated(self):
+        pairs = zip(self.decks, self.next_seed)
+        self.assertPlausible(poisson_z([sum(a == b for a, b in zip(*pair)) for pair in pairs]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import json
+import unittest
+from types import SimpleNamespace
+from src.card import Card
+from src.server import MAX_PLAYERS, GameServer, Spectator, TableStore, card_code
+
+VALUES = {card_code(card): card.value for card in Card.DECK}
+
+
+class RecordingTransport:
+    """Stands in for a spectator's connection, keeping every line written to it."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def write(self, data: bytes) -> None:
+        self.data += data
+
+    def is_closing(self) -> bool:
+        return False
+
+    def get_write_buffer_size(self) -> int:
+        return 0
+
+    def events(self):
+        lines = self.data.decode().splitlines()
+        self.data.clear()
+        return [json.loads(line) for line in lines]
+
+
+class TestRequestValidation(unittest.TestCase):
+
+    def setUp(self):
+        # One live table, so that opening a second one snapshots the first
+        self.server = GameServer(TableStore(max_live=1))
+
+    def assertRejected(self, request, error):
+        response = self.server.handle(request)
+        self.assertFalse(response['ok'])
+        self.assertIn(error, response['error'])
+
+    def test_requests_with_values_of_the_wrong_type_are_rejected(self):
+        self.assertRejected({'op': ['x']}, "op must be a string")
+        self.assertRejected({'op': 'play', 'table': [1]}, "table must be an integer")
+        self.assertRejected({'op': 'state', 'table': True}, "table must be an integer")
+        self.assertRejected({'op': 'create', 'rules': {'war_resolution_method': [1]}},
+                            "war_resolution_method must be a string")
+        self.assertRejected({'op': 'create', 'rules': {'use_double_deck': 'yes'}}, "use_double_deck must be a boolean")
+        self.assertRejected({'op': 'create', 'rules': {'jokers': True}}, "unknown option 'jokers'")
+
+    def test_booleans_are_not_taken_for_integers(self):
+        self.assertRejected({'op': 'create', 'max_rounds': True}, "max_rounds must be a positive integer")
+        self.assertRejected({'op': 'create', 'seed': False}, "seed must be a non-negative integer")
+        self.assertRejected({'op': 'create', 'detect_cycles': "false"}, "detect_cycles must be a boolean")
+        table = self.server.handle({'op': 'create', 'seed': 1, 'detect_cycles': False})['state']['table']
+        self.assertRejected({'op': 'play', 'table': table, 'steps': True}, "steps must be an integer")
+
+    def test_tables_are_limited_to_the_players_a_snapshot_can_hold(self):
+        self.assertRejected({'op': 'create', 'players': [f"P{i}" for i in range(300)]}, "at most")
+        names = [f"P{i}" for i in range(MAX_PLAYERS)]
+        table = self.server.handle({'op': 'create', 'players': names, 'seed': 1})['state']['table']
+        # Evicts the full table, which is then restored from its snapshot
+        self.assertTrue(self.server.handle({'op': 'create', 'seed': 2})['ok'])
+        response = self.server.handle({'op': 'play', 'table': table, 'steps': 10})
+        self.assertTrue(response['ok'])
+        self.assertEqual(len(response['state']['hands']), MAX_PLAYERS)
+
+
+class TestTableStore(unittest.TestCase):
+
+    def test_at_least_one_table_is_kept_live(self):
+        with self.assertRaises(ValueError):
+            TableStore(max_live=0)
+        server = GameServer(TableStore(max_live=1))
+        table = server.handle({'op': 'create', 'seed': 1})['state']['table']
+        self.assertTrue(server.handle({'op': 'play', 'table': table})['ok'])
+        self.assertEqual(server.tables.live, 1)
+
+
+
+class TestSpectatorDeltas(unittest.TestCase):
+
+    def test_deltas_replayed_on_the_watched_state_give_the_table_state(self):
+        server = GameServer()
+        for seed, players, method in ((1, 2, '1'), (44, 3, '3'), (3, 4, 'quadruple'), (4, 5, '2')):
+            names = [f"P{i}" for i in range(players)]
+            table = server.handle({'op': 'create', 'players': names, 'seed': seed,
+                                   'rules': {'war_resolution_method': method}})['state']['table']
+            transport = RecordingTransport()
+            spectator = Spectator(SimpleNamespace(transport=transport))
+            state = server.handle({'op': 'watch', 'table': table}, spectator)['state']
+            wars = 0
+            while state['outcome'] is None:
+                expected = server.handle({'op': 'play', 'table': table})['state']
+                for event in transport.events():
+                    if event['ev'] == 'end':
+                        state['outcome'] = event['o']
+                        continue
+                    state['hands'] = [size + change for size, change in zip(state['hands'], event['h'])]
+                    state['cards'] = event['c']
+                    state['rounds'] = event['n']
+                    state['war'] = event['ev'] == 'round' and event['w'] is None
+                    if event['ev'] == 'war':
+                        state['war_depth'] = event['d']
+                        wars += 1
+                        # Only the seats in the last face-up round show a card, so the winner's is the best
+                        shown = [VALUES[code] for code in event['c'] if code is not None]
+                        if shown:
+                            self.assertEqual(VALUES[event['c'][event['w']]], max(shown), event)
+                for key in ('rounds', 'war', 'war_depth', 'outcome', 'hands', 'cards'):
+                    self.assertEqual(state[key], expected[key], f"{key} after round {expected['rounds']}")
+            self.assertGreater(wars, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
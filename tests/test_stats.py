@@ -0,0 +1,79 @@
+import gc
+import pickle
+import unittest
+from src.game import Game, GamePool
+from src.rules import Rules
+from src.simulation import play_game
+from src.stats import StatsAggregator, rules_key
+
+NAMES = ("Player 1", "Player 2")
+
+
+def play_until_wars(game: Game, wars: int) -> None:
+    """Play a dealt game until it has fought some wars or ended."""
+    while game.outcome is None and wars:
+        if game.war_in_progress:
+            game.resolve_war()
+            wars -= 1
+        else:
+            game.play_round()
+
+
+class TestStatsAggregator(unittest.TestCase):
+
+    def setUp(self):
+        self.rules = Rules()
+        self.aggregator = StatsAggregator()
+
+    def test_games_abandoned_and_reused_from_a_pool_count_only_their_own_wars(self):
+        pool = GamePool()
+        wars = []
+        for seed in range(20):
+            # Abandoned after a few wars, then handed out again and played to the end
+            game = pool.acquire(*NAMES, rules=self.rules, seed=seed)
+            game.add_listener(self.aggregator)
+            game.deal()
+            play_until_wars(game, 3)
+            pool.release(game)
+            game = pool.acquire(*NAMES, rules=self.rules, seed=seed)
+            game.add_listener(self.aggregator)
+            game.deal()
+            wars.append(play_game(game).wars)
+            pool.release(game)
+
+        stats = self.aggregator.stats[rules_key(self.rules)]
+        self.assertEqual(stats.games, 20)
+        self.assertEqual(stats.wars.count, 20)
+        self.assertEqual(stats.wars.total, sum(wars))
+
+    def test_abandoned_games_leave_nothing_behind(self):
+        for seed in range(50):
+            game = Game(*NAMES, rules=self.rules)
+            game.reset(seed)
+            game.add_listener(self.aggregator)
+            game.deal()
+            play_until_wars(game, 2)
+        del game
+        gc.collect()
+        self.assertEqual(len(self.aggregator._wars), 0)
+        self.assertEqual(sum(stats.games for stats in self.aggregator.stats.values()), 0)
+
+    def test_pickled_aggregator_keeps_the_finished_games(self):
+        game = Game(*NAMES, rules=self.rules)
+        game.reset(1)
+        game.add_listener(self.aggregator)
+        game.deal()
+        play_game(game)
+        copy = pickle.loads(pickle.dumps(self.aggregator))
+        self.assertEqual(copy.to_dict(), self.aggregator.to_dict())
+
+        # The copy goes on aggregating
+        game.reset(2)
+        game.add_listener(copy)
+        game.deal()
+        play_game(game)
+        self.assertEqual(copy.stats[rules_key(self.rules)].games, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
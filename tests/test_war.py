@@ -0,0 +1,138 @@
+import random
+import sys
+import unittest
+from typing import List, Tuple
+from src.card import Card
+from src.game import Game
+from src.player import Player
+from src.rules import Rules
+from src.war import War
+
+METHODS = ('1', '2', '3', 'double', 'quadruple')
+
+
+def cards(ranks: List[str], suit: str) -> List[Card]:
+    """The cards of a suit with the given ranks, in order."""
+    return [next(card for card in Card.DECK if card.rank == rank and card.suit == suit) for rank in ranks]
+
+
+class FaceUpRecorder:
+    """Stands in for a table, splitting the face-up cards of a war into its depths."""
+
+    def __init__(self):
+        self.depths: List[List[Tuple[Player, Card]]] = []
+        self._cleared = True
+
+    def place_card(self, player: Player, card: Card) -> None:
+        if self._cleared:
+            self.depths.append([])
+            self._cleared = False
+        self.depths[-1].append((player, card))
+
+    def clear(self) -> None:
+        # The war clears the table before every face-up round after the first
+        self._cleared = True
+
+
+def random_war(rng: random.Random, war: War, players: List[Player]) -> Tuple[list, list]:
+    """Deal random hands with few distinct values, so that ties chain, and fight a war over them."""
+    values = rng.randint(1, 4)
+    deck = [card for card in Card.DECK if card.value - 2 < values] * 2
+    rng.shuffle(deck)
+    stake = deck[:rng.randint(0, 4)]
+    position = len(stake)
+    for player in players:
+        player.hand.clear()
+        size = rng.randint(0, 10)
+        player.receive_cards(deck[position:position + size])
+        position += size
+    war.rules.war_resolution_method = rng.choice(METHODS)
+    return stake, deck[:position]
+
+
+class TestWarProperties(unittest.TestCase):
+    WARS = 20000
+
+    def setUp(self):
+        self.rng = random.Random(0)
+        self.war = War(Rules(), 2 * 2 * len(Card.DECK))
+        self.tables = [[Player(f"Player {i + 1}") for i in range(count)] for count in range(1, 5)]
+
+    def test_every_card_is_conserved_and_the_winner_gets_the_pot(self):
+        for _ in range(self.WARS):
+            players = self.rng.choice(self.tables)
+            stake, dealt = random_war(self.rng, self.war, players)
+            held_before = [len(player.hand) for player in players]
+            winner = self.war.fight(players, stake)
+
+            held = sorted(card.id for player in players for card in player.hand)
+            self.assertEqual(held, sorted(card.id for card in dealt))
+            if winner is None:
+                continue
+            pot = self.war.pot[:self.war.pot_size]
+            self.assertEqual(list(winner.hand)[len(winner.hand) - len(pot):], pot)
+            # The winner kept what it did not put down, and got the whole pot
+            put_down = sum(owner is winner for owner in self.war.owners[len(stake):self.war.pot_size])
+            self.assertEqual(len(winner.hand), held_before[players.index(winner)] - put_down + len(pot))
+
+    def test_winner_tied_for_the_best_card_at_every_depth(self):
+        for _ in range(self.WARS):
+            players = self.rng.choice(self.tables)
+            stake, _ = random_war(self.rng, self.war, players)
+            recorder = FaceUpRecorder()
+            winner = self.war.fight(players, stake, recorder)
+
+            for depth, face_up in enumerate(recorder.depths):
+                best = max(card.value for _, card in face_up)
+                tied = [player for player, card in face_up if card.value == best]
+                self.assertIn(winner, tied, f"depth {depth}: {face_up}")
+                if depth + 1 < len(recorder.depths):
+                    # Only the players tied for the best card fight on
+                    self.assertGreater(len(tied), 1)
+                    for player, _ in recorder.depths[depth + 1]:
+                        self.assertIn(player, tied)
+                elif len(tied) == 1:
+                    self.assertIs(winner, tied[0])
+
+    def test_tie_chain_deeper_than_the_recursion_limit(self):
+        # Both players hold the same values in the same order, so every face-up card ties
+        depth = 10 * sys.getrecursionlimit()
+        first_suit = Card.DECK[:len(Card.RANKS)]
+        second_suit = Card.DECK[len(Card.RANKS):2 * len(Card.RANKS)]
+        players = [Player("Player 1"), Player("Player 2")]
+        for _ in range(depth // len(Card.RANKS) + 1):
+            players[0].receive_cards(first_suit)
+            players[1].receive_cards(second_suit)
+        total = sum(len(player.hand) for player in players)
+        war = War(Rules('1'), total)
+
+        winner = war.fight(players)
+        self.assertIsNotNone(winner)
+        self.assertGreater(war.depth, depth // 2)
+        self.assertEqual(len(winner.hand), total)
+
+
+class TestWarBetweenTiedPlayers(unittest.TestCase):
+
+    def test_player_who_loses_a_repeated_tie_leaves_the_war(self):
+        game = Game('A', 'B', 'C', rules=Rules('1'))
+        hands = (['K', '3', '9', '3', '5'], ['K', '3', '9', '3', '3'], ['K', '3', '2', '3', 'A'])
+        for player, ranks, suit in zip(game.players, hands, ('Clubs', 'Diamonds', 'Hearts')):
+            player.receive_cards(cards(ranks, suit))
+
+        game.play_round()
+        self.assertTrue(game.war_in_progress)
+        game.resolve_war()
+
+        # C showed a 2 against two 9s, so only A and B fight on and A's 5 wins;
+        # C keeps the 3 and the Ace it never had to put down
+        a, b, c = game.players
+        self.assertEqual(game.war.depth, 2)
+        self.assertEqual(game.war.pot_size, 13)
+        self.assertEqual(len(a.hand), 13)
+        self.assertEqual(len(b.hand), 0)
+        self.assertEqual([card.rank for card in c.hand], ['3', 'A'])
+
+
+if __name__ == '__main__':
+    unittest.main()